@@ -1,3 +1,4 @@
+from Business.CardStore import CardStore
 from Domain.Interfaces.IBoardIntegration import IBoardIntegration
 
 
@@ -8,13 +9,17 @@ class BoardIntegrationBusiness:
 
 
     def run(self) -> None:
-        cards = self.board_integration.get_cards()
+        store = CardStore(self.board_integration.get_cards())
         
-        for card in cards:
+        for card in store:
             print(card)
 
         selected_id = input("Select a id: ")
-        selected_card = [x for x in cards if x.id == selected_id][0]
+        selected_card = store.get(selected_id)
+        if selected_card is None:
+            print(f"Card {selected_id} not found")
+            return
+
         selected_card.time_spent += 100
 
         self.board_integration.update_card(selected_card)
\ No newline at end of file
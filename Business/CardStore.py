@@ -0,0 +1,136 @@
+from collections.abc import Iterable, Iterator
+from typing import Optional
+
+from Domain.Models.Card import Card
+from Domain.Models.CardDelta import CardDelta
+
+
+class CardStore:
+    """Ordered collection of cards indexed by issue key and by epic
+
+    Lookups by key or epic are O(1). Rows keep their position on upsert, so the
+    store can back a list model that notifies views row by row.
+    """
+
+    def __init__(self, cards: Iterable[Card] = ()) -> None:
+        self._cards: list[Card] = []
+        self._rows: dict[str, int] = {}
+        self._by_epic: dict[str, dict[str, Card]] = {}
+        self.extend(cards)
+
+
+    def __len__(self) -> int:
+        return len(self._cards)
+
+
+    def __iter__(self) -> Iterator[Card]:
+        return iter(self._cards)
+
+
+    def __contains__(self, card_id: object) -> bool:
+        return card_id in self._rows
+
+
+    def get(self, card_id: Optional[str]) -> Optional[Card]:
+        row = self._rows.get(card_id)
+        return self._cards[row] if row is not None else None
+
+
+    def at(self, row: int) -> Optional[Card]:
+        if 0 <= row < len(self._cards):
+            return self._cards[row]
+        return None
+
+
+    def row_of(self, card_id: Optional[str]) -> int:
+        """Position of the card with the given key, -1 when it isn't stored"""
+        return self._rows.get(card_id, -1)
+
+
+    def ids(self) -> set[str]:
+        return set(self._rows)
+
+
+    def epics(self) -> list[str]:
+        return list(self._by_epic)
+
+
+    def by_epic(self, epic: str) -> list[Card]:
+        return list(self._by_epic.get(epic, {}).values())
+
+
+    def as_list(self) -> list[Card]:
+        """Copy of the cards in their current order"""
+        return list(self._cards)
+
+
+    def replace(self, cards: Iterable[Card]) -> None:
+        """Drop every card and store the given ones"""
+        self._cards.clear()
+        self._rows.clear()
+        self._by_epic.clear()
+        self.extend(cards)
+
+
+    def extend(self, cards: Iterable[Card]) -> None:
+        for card in cards:
+            self.upsert(card)
+
+
+    def upsert(self, card: Card) -> tuple[int, bool]:
+        """Insert the card, or replace the one with the same key in place.
+        Returns the row of the card and whether it was inserted."""
+        row = self._rows.get(card.id)
+        if row is None:
+            row = len(self._cards)
+            self._cards.append(card)
+            self._rows[card.id] = row
+            inserted = True
+        else:
+            self._unindex_epic(self._cards[row])
+            self._cards[row] = card
+            inserted = False
+
+        self._by_epic.setdefault(card.epick, {})[card.id] = card
+        return row, inserted
+
+
+    def remove(self, card_id: str) -> int:
+        """Remove the card with the given key, returning the row it had or -1 when it wasn't stored"""
+        row = self._rows.pop(card_id, None)
+        if row is None:
+            return -1
+
+        self._unindex_epic(self._cards.pop(row))
+        # Only the cards below the removed one move up
+        for following_row in range(row, len(self._cards)):
+            self._rows[self._cards[following_row].id] = following_row
+        return row
+
+
+    def diff(self, cards: Iterable[Card]) -> CardDelta:
+        """Delta turning the stored cards into the given ones"""
+        changed: list[Card] = []
+        new_ids: set[str] = set()
+        for card in cards:
+            new_ids.add(card.id)
+            if self.get(card.id) != card:
+                changed.append(card)
+        return CardDelta(changed=changed, removed_ids=self.ids() - new_ids)
+
+
+    def apply(self, delta: CardDelta) -> None:
+        """Merge a delta by key: removed cards are dropped, changed ones replaced in place or appended"""
+        # From the bottom, so the cards above don't need to be reindexed
+        for card_id in sorted(delta.removed_ids & self._rows.keys(), key=self.row_of, reverse=True):
+            self.remove(card_id)
+        self.extend(delta.changed)
+
+
+    def _unindex_epic(self, card: Card) -> None:
+        epic_cards = self._by_epic.get(card.epick)
+        if epic_cards is None:
+            return
+        epic_cards.pop(card.id, None)
+        if not epic_cards:
+            del self._by_epic[card.epick]
@@ -1,14 +1,45 @@
 import abc
+import time
+from collections.abc import Iterator, Mapping
+from datetime import datetime
 from Domain.Models.Card import Card
+from Domain.Models.CardDelta import CardDelta
 
 
 class IBoardIntegration(metaclass = abc.ABCMeta):
+    # Requests made by the last get_cards/iter_cards/sync_cards, for backends that count them
+    last_load_request_count: int = 0
+    # Boards the last load or sync got no cards from, with their error, for backends combining several.
+    # Their cards are neither returned nor reported removed
+    last_load_errors: Mapping[str, str] = {}
+
     @abc.abstractmethod
     def get_cards(self) -> list[Card]:
         raise NotImplementedError()
 
+    def iter_cards(self) -> Iterator[list[Card]]:
+        """Yield the cards page by page as they arrive. Backends without pagination yield a single page."""
+        yield self.get_cards()
+
+    def sync_cards(self, known_ids: set[str], since: float | None) -> CardDelta:
+        """Cards changed since the given timestamp and known cards that are gone.
+        Backends without change tracking report every card as changed."""
+        synced_at = time.time()
+        cards = self.get_cards()
+        return CardDelta(changed=cards,
+                         removed_ids=known_ids - {card.id for card in cards},
+                         synced_at=synced_at)
+
+    def sync_issues(self, issues: set[str]) -> CardDelta:
+        """Cards of the given issues (keys, or ids) as they are now. Keys of issues that are no longer
+        cards are reported removed. Backends that can't fetch a few issues load every card."""
+        cards = {card.id: card for card in self.get_cards()}
+        return CardDelta(changed=[cards[issue] for issue in issues if issue in cards],
+                         removed_ids=issues - cards.keys())
+
     @abc.abstractmethod
-    def add_timespent_to_card(self, card: Card) -> bool:
+    def add_timespent_to_card(self, card: Card, started: datetime | None = None) -> bool:
+        """Log card.time_spent seconds of work, started at the given time (now when omitted)"""
         raise NotImplementedError()
 
     @abc.abstractmethod
@@ -17,4 +48,8 @@ class IBoardIntegration(metaclass = abc.ABCMeta):
     
     @abc.abstractmethod
     def refresh_card(self, card: Card) -> Card:
-        raise NotImplementedError()
\ No newline at end of file
+        raise NotImplementedError()
+
+    def refresh_cards(self, cards: list[Card]) -> list[Card]:
+        """Refresh several cards at once, in the given order. Backends without batching refresh them one by one."""
+        return [self.refresh_card(card) for card in cards]
\ No newline at end of file
@@ -1,7 +1,8 @@
-from dataclasses import dataclass
+import sys
+from dataclasses import dataclass, field
 
 
-@dataclass
+@dataclass(slots=True)
 class Card:
     id: str
     name: str
@@ -9,4 +10,21 @@ class Card:
     estimated_duration: int
     time_spent: int
     current_stage: str
-    possible_next_stages: list[str]
\ No newline at end of file
+    possible_next_stages: tuple[str, ...]
+    transition_ids: dict[str, str] = field(default_factory=dict)  # Stage name -> transition id, captured at load time
+
+    def __post_init__(self):
+        # Every card of a board repeats the same few stage and epic names, a single copy of each is kept
+        self.epick = sys.intern(self.epick)
+        self.current_stage = sys.intern(self.current_stage)
+        self.possible_next_stages = tuple(sys.intern(stage) for stage in self.possible_next_stages)
+        self.transition_ids = {sys.intern(stage): transition_id for stage, transition_id in self.transition_ids.items()}
+
+    def to_row(self) -> list:
+        """Positional form of the card for caching, read back with from_row"""
+        return [self.id, self.name, self.epick, self.estimated_duration, self.time_spent,
+                self.current_stage, list(self.possible_next_stages), self.transition_ids]
+
+    @classmethod
+    def from_row(cls, row: list) -> "Card":
+        return cls(*row)
@@ -0,0 +1,9 @@
+from dataclasses import dataclass, field
+from Domain.Models.Card import Card
+
+
+@dataclass
+class CardDelta:
+    changed: list[Card] = field(default_factory=list)
+    removed_ids: set[str] = field(default_factory=set)
+    synced_at: float = 0.0
@@ -0,0 +1,12 @@
+from dataclasses import dataclass
+
+
+@dataclass
+class TimerSession:
+    card_id: str
+    card_name: str
+    time_spent: int  # Time already logged on the card when the session started
+    elapsed: float  # Timer value, logged time included, as of monotonic/wall
+    running: bool
+    monotonic: float  # time.monotonic() of the last record
+    wall: float  # time.time() of the last record
@@ -0,0 +1,9 @@
+from dataclasses import dataclass
+
+
+@dataclass
+class WebhookEvent:
+    kind: str  # issue_created, issue_updated, issue_transitioned, issue_deleted or worklog_created
+    issue: str  # Issue key, or issue id when the payload only has that (worklogs)
+    board: str = ""  # Connection the webhook was sent for, "" for the main site
+    timestamp: float = 0.0  # Wall clock time Jira sent it at
@@ -0,0 +1,12 @@
+from dataclasses import dataclass
+
+
+@dataclass
+class WorklogEntry:
+    id: str
+    card_id: str
+    card_name: str
+    seconds: int
+    started: float  # Wall clock timestamp of when the logged work started
+    attempts: int = 0
+    rejection: str | None = None  # Why the board refused it for good, it then waits for the user to retry or discard it
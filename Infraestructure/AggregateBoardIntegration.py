@@ -0,0 +1,228 @@
+import queue
+import threading
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+from datetime import datetime
+from typing import Any
+from Domain.Interfaces.IBoardIntegration import IBoardIntegration
+from Domain.Models.Card import Card
+from Domain.Models.CardDelta import CardDelta
+
+# Queued by a board fetch once all its pages were queued
+_DONE = object()
+
+
+class AggregateBoardIntegration(IBoardIntegration):
+    """Cards of several boards shown as one list, every board fetched in parallel
+
+    Card ids are namespaced with the name of their board, e.g. "acme:ABC-1". The board
+    named "" keeps bare ids, so the cache and pending worklogs of the main site stay
+    valid. Worklogs, transitions and refreshes are routed to the board of the card id.
+
+    Boards are given as factories, each one called by the first operation needing its
+    board, on that board's own thread. A board that is slow or unreachable only fails
+    its own cards: loads and syncs return what the other boards answered and keep the
+    errors in last_load_errors, they only raise when every board failed. A factory that
+    raised is called again the next time.
+    """
+    SEPARATOR = ":"
+
+    def __init__(self, board_factories: dict[str, Callable[[], IBoardIntegration]]):
+        self.board_factories = board_factories
+        self.last_load_request_count: int = 0
+        self.last_load_errors: dict[str, str] = {}
+        self._boards: dict[str, IBoardIntegration] = {}
+        self._board_locks: dict[str, threading.Lock] = {name: threading.Lock() for name in board_factories}
+
+
+    def get_cards(self) -> list[Card]:
+        return [card for page in self.iter_cards() for card in page]
+
+
+    def iter_cards(self) -> Iterator[list[Card]]:
+        """Yield the pages of every board as they arrive, whichever board they come from.
+        Raises once every board is done when any of them failed."""
+        pages: queue.Queue = queue.Queue()
+        stopping = threading.Event()
+
+        def fetch(name: str):
+            try:
+                for page in self._board(name).iter_cards():
+                    if stopping.is_set():
+                        return
+                    pages.put((name, page))
+                pages.put((name, _DONE))
+            except Exception as e:
+                pages.put((name, e))
+
+        pool = ThreadPoolExecutor(max_workers=len(self.board_factories), thread_name_prefix="zilean-board")
+        try:
+            for name in self.board_factories:
+                pool.submit(fetch, name)
+
+            errors: list[tuple[str, Exception]] = []
+            remaining = len(self.board_factories)
+            while remaining:
+                name, item = pages.get()
+                if item is _DONE:
+                    remaining -= 1
+                elif isinstance(item, Exception):
+                    remaining -= 1
+                    errors.append((name, item))
+                else:
+                    yield [self._qualified(name, card) for card in item]
+        finally:
+            # Also reached when the caller stops iterating early, the other fetches stop at their next page
+            stopping.set()
+            pool.shutdown(wait=False)
+
+        self.last_load_request_count = self._request_count()
+        self._keep_partial(errors)
+
+
+    def sync_cards(self, known_ids: set[str], since: float | None) -> CardDelta:
+        # Ids of boards that are no longer configured land on the main board, which reports them gone
+        known_by_board: dict[str, set[str]] = {name: set() for name in self.board_factories}
+        for card_id in known_ids:
+            name, key = self.split_id(card_id)
+            known_by_board[name].add(key)
+
+        deltas, errors = self._on_every_board(lambda name, board: board.sync_cards(known_by_board[name], since))
+        self.last_load_request_count = self._request_count()
+        self._keep_partial(errors)
+
+        # The cards of failed boards are left as they are, none of them is reported removed
+        synced_at = min(board_delta.synced_at for board_delta in deltas.values())
+        if errors and since is not None:
+            # The next sync also covers what the failed boards missed
+            synced_at = min(synced_at, since)
+        delta = CardDelta(synced_at=synced_at)
+        for name, board_delta in deltas.items():
+            delta.changed.extend(self._qualified(name, card) for card in board_delta.changed)
+            delta.removed_ids.update(self.qualify_id(name, key) for key in board_delta.removed_ids)
+        return delta
+
+
+    def sync_issues(self, issues: set[str]) -> CardDelta:
+        by_board: dict[str, set[str]] = {}
+        for issue in issues:
+            name, key = self.split_id(issue)
+            by_board.setdefault(name, set()).add(key)
+
+        deltas, errors = self._on_every_board(lambda name, board: board.sync_issues(by_board[name]), list(by_board))
+        self.last_load_request_count = self._request_count()
+        self._keep_partial(errors, len(by_board))
+
+        delta = CardDelta(synced_at=min((board_delta.synced_at for board_delta in deltas.values()), default=0.0))
+        for name, board_delta in deltas.items():
+            delta.changed.extend(self._qualified(name, card) for card in board_delta.changed)
+            delta.removed_ids.update(self.qualify_id(name, key) for key in board_delta.removed_ids)
+        return delta
+
+
+    def add_timespent_to_card(self, card: Card, started: datetime | None = None) -> bool:
+        name, key = self.split_id(card.id)
+        return self._board(name).add_timespent_to_card(replace(card, id=key), started)
+
+
+    def change_card_stage(self, card: Card, new_stage: str) -> bool:
+        name, key = self.split_id(card.id)
+        routed = replace(card, id=key)
+        try:
+            return self._board(name).change_card_stage(routed, new_stage)
+        finally:
+            # Transitions the board refetched stay on the caller's card, sparing the next move the refetch
+            card.transition_ids = routed.transition_ids
+            card.possible_next_stages = routed.possible_next_stages
+
+
+    def refresh_card(self, card: Card) -> Card:
+        name, key = self.split_id(card.id)
+        return self._qualified(name, self._board(name).refresh_card(replace(card, id=key)))
+
+
+    def refresh_cards(self, cards: list[Card]) -> list[Card]:
+        by_board: dict[str, list[int]] = {}
+        for index, card in enumerate(cards):
+            by_board.setdefault(self.split_id(card.id)[0], []).append(index)
+
+        refreshed, errors = self._on_every_board(
+            lambda name, board: board.refresh_cards([replace(cards[i], id=self.split_id(cards[i].id)[1]) for i in by_board[name]]),
+            list(by_board))
+        self._raise_first(errors)
+
+        result: list[Card] = [None] * len(cards)
+        for name, board_cards in refreshed.items():
+            for index, card in zip(by_board[name], board_cards):
+                result[index] = self._qualified(name, card)
+        return result
+
+
+    def split_id(self, card_id: str) -> tuple[str, str]:
+        """Board name and board issue key of a card id, ids without a known namespace belong to the "" board"""
+        name, separator, key = card_id.partition(self.SEPARATOR)
+        if separator and name in self.board_factories:
+            return name, key
+        return "", card_id
+
+
+    def qualify_id(self, name: str, key: str) -> str:
+        return f"{name}{self.SEPARATOR}{key}" if name else key
+
+
+    def _qualified(self, name: str, card: Card) -> Card:
+        return replace(card, id=self.qualify_id(name, card.id)) if name else card
+
+
+    def _board(self, name: str) -> IBoardIntegration:
+        """The board of the given name, built by its factory on first use"""
+        board = self._boards.get(name)
+        if board is not None:
+            return board
+        if name not in self.board_factories:
+            raise KeyError(f"No board is configured for {name or 'the main site'}")
+
+        # Only callers of the same board wait for it to be built
+        with self._board_locks[name]:
+            board = self._boards.get(name)
+            if board is None:
+                board = self._boards[name] = self.board_factories[name]()
+        return board
+
+
+    def _on_every_board(self, call: Callable[[str, IBoardIntegration], Any],
+                        names: list[str] | None = None) -> tuple[dict[str, Any], list[tuple[str, Exception]]]:
+        """call(name, board) on every board (or the named ones) in parallel, returns the results and errors by board"""
+        names = list(self.board_factories) if names is None else names
+        with ThreadPoolExecutor(max_workers=len(names) or 1, thread_name_prefix="zilean-board") as pool:
+            futures = {name: pool.submit(lambda name: call(name, self._board(name)), name) for name in names}
+
+        results: dict[str, Any] = {}
+        errors: list[tuple[str, Exception]] = []
+        for name, future in futures.items():
+            error = future.exception()
+            if error is None:
+                results[name] = future.result()
+            else:
+                errors.append((name, error))
+        return results, errors
+
+
+    def _request_count(self) -> int:
+        return sum(board.last_load_request_count for board in list(self._boards.values()))
+
+
+    def _keep_partial(self, errors: list[tuple[str, Exception]], board_count: int | None = None) -> None:
+        """Record the boards a load or sync failed on, raises when that is all of them (or all board_count)"""
+        self.last_load_errors = {name: str(error) for name, error in errors}
+        for name, error in errors:
+            print(f"Failed to load the cards of {name or 'the main site'}: {error}")
+        if len(errors) == (len(self.board_factories) if board_count is None else board_count):
+            self._raise_first(errors)
+
+
+    def _raise_first(self, errors: list[tuple[str, Exception]]) -> None:
+        if errors:
+            name, error = errors[0]
+            raise RuntimeError(f"{name or 'Main site'}: {error}") from error
@@ -0,0 +1,51 @@
+import json
+import os
+from pathlib import Path
+from Domain.Models.Card import Card
+
+
+class CardCache:
+    """Last card set loaded from the board, kept on disk so it can be shown before the board answers"""
+    # Bumped whenever the stored card layout changes, older caches are ignored
+    FORMAT_VERSION: int = 2
+
+    def __init__(self, cache_path: str | Path = "cards_cache.json"):
+        self.cache_path = Path(cache_path)
+
+
+    def load(self, server: str, email: str) -> tuple[list[Card], float | None]:
+        """Cached cards of the given account and when they were synced, empty when there is no usable cache"""
+        if not self.cache_path.exists():
+            return [], None
+
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get("format") != self.FORMAT_VERSION or data.get("owner") != self._owner(server, email):
+                return [], None
+            return [Card.from_row(row) for row in data["cards"]], data.get("synced_at")
+        except Exception as e:
+            print(f"Error loading card cache: {e}")
+            return [], None
+
+
+    def save(self, server: str, email: str, cards: list[Card], synced_at: float | None = None) -> None:
+        """Replace the cache with the given cards. The file is swapped atomically so a crash never leaves it half written"""
+        data = {
+            "format": self.FORMAT_VERSION,
+            "owner": self._owner(server, email),
+            "synced_at": synced_at,
+            "cards": [card.to_row() for card in cards],
+        }
+
+        temp_path = self.cache_path.with_name(self.cache_path.name + ".tmp")
+        try:
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+            os.replace(temp_path, self.cache_path)
+        except Exception as e:
+            print(f"Error saving card cache: {e}")
+
+
+    def _owner(self, server: str, email: str) -> str:
+        return f"{server}|{email}"
\ No newline at end of file
@@ -0,0 +1,25 @@
+from dataclasses import dataclass
+
+
+# Issue fields read when building a Card, everything else is left on the server
+CARD_FIELDS: tuple[str, ...] = ("summary", "status", "parent", "aggregatetimeoriginalestimate", "aggregateprogress")
+
+
+@dataclass
+class CardQuery:
+    """Which issues are loaded as cards and which of their fields are transferred"""
+    assignee: str = "currentUser()"
+    sprint_filter: str = "Sprint in openSprints() AND Sprint not in futureSprints()"
+    exclude_done: bool = True
+    extra_jql: str = ""
+    fields: tuple[str, ...] = CARD_FIELDS
+    expand: str = "transitions"
+
+    def to_jql(self) -> str:
+        clauses = [f"assignee = {self.assignee}", self.sprint_filter]
+        if self.exclude_done:
+            # Finished issues are filtered by the server, whatever the status is called on the instance
+            clauses.append("statusCategory != Done")
+        if self.extra_jql:
+            clauses.append(f"({self.extra_jql})")
+        return " AND ".join(clause for clause in clauses if clause)
\ No newline at end of file
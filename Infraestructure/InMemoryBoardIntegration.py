@@ -0,0 +1,143 @@
+import threading
+import time
+from collections import deque
+from collections.abc import Iterable, Iterator
+from dataclasses import replace
+from datetime import datetime
+from Domain.Interfaces.IBoardIntegration import IBoardIntegration
+from Domain.Models.Card import Card
+from Domain.Models.CardDelta import CardDelta
+
+
+class InMemoryBoardIntegration(IBoardIntegration):
+    """Board kept in memory, for running the widget without a Jira server
+
+    Every call waits latency seconds, like a request would, and can be scripted to
+    fail with fail_next(). Cards are copied in and out, so callers never share them
+    with the board.
+    """
+    STAGES: tuple[str, ...] = ("To do", "In progress", "Code review", "Done")
+
+    def __init__(self, cards: Iterable[Card] = (), latency: float = 0.0, page_size: int = 100):
+        self.latency: float = latency
+        self.page_size: int = page_size
+        self.calls: dict[str, int] = {}
+        self.worklogs: list[tuple[str, int, datetime | None]] = []
+        self._cards: dict[str, Card] = {}
+        self._updated: dict[str, float] = {}
+        self._failures: deque[tuple[str | None, Exception]] = deque()
+        self._lock = threading.Lock()
+
+        for card in cards:
+            self.put_card(card)
+
+
+    @classmethod
+    def large_board(cls, count: int, **kwargs) -> "InMemoryBoardIntegration":
+        """Board with count generated cards spread over a few epics and stages"""
+        cards = (Card(id=f"MEM-{i + 1}",
+                      name=f"Generated issue {i + 1} with a summary of realistic length",
+                      epick=f"Epic {i % 25}",
+                      estimated_duration=8 * 3600,
+                      time_spent=i * 60,
+                      current_stage=cls.STAGES[i % 3],
+                      possible_next_stages=cls.STAGES,
+                      transition_ids={stage: str(11 + 10 * n) for n, stage in enumerate(cls.STAGES)})
+                 for i in range(count))
+        return cls(cards, **kwargs)
+
+
+    def fail_next(self, operation: str | None = None, error: Exception | None = None, times: int = 1) -> None:
+        """Make the next calls of operation (any operation when None) raise error"""
+        with self._lock:
+            for _ in range(times):
+                self._failures.append((operation, error or ConnectionError(f"Simulated {operation or 'board'} failure")))
+
+
+    def put_card(self, card: Card) -> None:
+        """Add or replace a card on the board, as if someone edited the issue"""
+        with self._lock:
+            self._cards[card.id] = replace(card)
+            self._updated[card.id] = time.time()
+
+
+    def remove_card(self, card_id: str) -> None:
+        """Drop a card from the board, as if the issue was finished or reassigned"""
+        with self._lock:
+            self._cards.pop(card_id, None)
+            self._updated.pop(card_id, None)
+
+
+    def get_cards(self) -> list[Card]:
+        cards: list[Card] = []
+        for page in self.iter_cards():
+            cards.extend(page)
+        return cards
+
+
+    def iter_cards(self) -> Iterator[list[Card]]:
+        with self._lock:
+            cards = list(self._cards.values())
+        self.last_load_request_count = 0
+
+        for i in range(0, max(len(cards), 1), self.page_size):
+            self._call("search")
+            self.last_load_request_count += 1
+            yield [replace(card) for card in cards[i:i + self.page_size]]
+
+
+    def sync_cards(self, known_ids: set[str], since: float | None) -> CardDelta:
+        if since is None:
+            return super().sync_cards(known_ids, since)
+
+        self._call("search")
+        synced_at = time.time()
+        with self._lock:
+            changed = [replace(card) for card_id, card in self._cards.items()
+                       if card_id not in known_ids or self._updated[card_id] >= since]
+            removed_ids = known_ids - self._cards.keys()
+        self.last_load_request_count = 1
+        return CardDelta(changed=changed, removed_ids=removed_ids, synced_at=synced_at)
+
+
+    def add_timespent_to_card(self, card: Card, started: datetime | None = None) -> bool:
+        self._call("worklog")
+        with self._lock:
+            self.worklogs.append((card.id, card.time_spent, started))
+            stored = self._cards.get(card.id)
+            if stored is not None:
+                stored.time_spent += card.time_spent
+                self._updated[card.id] = time.time()
+        return True
+
+
+    def change_card_stage(self, card: Card, new_stage: str) -> bool:
+        self._call("transition")
+        with self._lock:
+            stored = self._cards.get(card.id)
+            if stored is None or new_stage not in stored.possible_next_stages:
+                raise ValueError(f"{card.id} can't be moved to {new_stage}")
+            stored.current_stage = new_stage
+            self._updated[card.id] = time.time()
+        return True
+
+
+    def refresh_card(self, card: Card) -> Card:
+        self._call("issue")
+        with self._lock:
+            stored = self._cards.get(card.id)
+            return replace(stored) if stored is not None else card
+
+
+    def _call(self, operation: str) -> None:
+        """Count the call, wait the simulated latency and raise the scripted failure, if any"""
+        with self._lock:
+            self.calls[operation] = self.calls.get(operation, 0) + 1
+            error = None
+            if self._failures and self._failures[0][0] in (None, operation):
+                error = self._failures.popleft()[1]
+
+        if self.latency:
+            time.sleep(self.latency)
+        if error is not None:
+            raise error
@@ -0,0 +1,80 @@
+from collections.abc import Iterator, Mapping
+from datetime import datetime
+from Domain.Interfaces.IBoardIntegration import IBoardIntegration
+from Domain.Models.Card import Card
+from Domain.Models.CardDelta import CardDelta
+from Infraestructure.MetricsRegistry import MetricsRegistry, metrics_registry
+
+
+class InstrumentedBoardIntegration(IBoardIntegration):
+    """Records every call of the wrapped integration in a metrics registry, as "board <method>" """
+
+    def __init__(self, integration: IBoardIntegration, registry: MetricsRegistry | None = None):
+        self.integration = integration
+        self.registry = registry if registry is not None else metrics_registry
+
+
+    @property
+    def last_load_request_count(self) -> int:
+        return self.integration.last_load_request_count
+
+
+    @property
+    def last_load_errors(self) -> Mapping[str, str]:
+        return self.integration.last_load_errors
+
+
+    def __getattr__(self, name: str):
+        # Backend specific attributes, e.g. JiraIntegration.request_count
+        return getattr(self.integration, name)
+
+
+    def get_cards(self) -> list[Card]:
+        with self.registry.timed("board get_cards"):
+            return self.integration.get_cards()
+
+
+    def iter_cards(self) -> Iterator[list[Card]]:
+        # Timed per page, the time the caller spends between pages isn't the board's
+        pages = self.integration.iter_cards()
+        while True:
+            mark = self.registry.start()
+            try:
+                page = next(pages)
+            except StopIteration:
+                return
+            except Exception as e:
+                self.registry.finish("board iter_cards page", mark, e)
+                raise
+            self.registry.finish("board iter_cards page", mark)
+            yield page
+
+
+    def sync_cards(self, known_ids: set[str], since: float | None) -> CardDelta:
+        with self.registry.timed("board sync_cards"):
+            return self.integration.sync_cards(known_ids, since)
+
+
+    def sync_issues(self, issues: set[str]) -> CardDelta:
+        with self.registry.timed("board sync_issues"):
+            return self.integration.sync_issues(issues)
+
+
+    def add_timespent_to_card(self, card: Card, started: datetime | None = None) -> bool:
+        with self.registry.timed("board add_timespent_to_card"):
+            return self.integration.add_timespent_to_card(card, started)
+
+
+    def change_card_stage(self, card: Card, new_stage: str) -> bool:
+        with self.registry.timed("board change_card_stage"):
+            return self.integration.change_card_stage(card, new_stage)
+
+
+    def refresh_card(self, card: Card) -> Card:
+        with self.registry.timed("board refresh_card"):
+            return self.integration.refresh_card(card)
+
+
+    def refresh_cards(self, cards: list[Card]) -> list[Card]:
+        with self.registry.timed("board refresh_cards"):
+            return self.integration.refresh_cards(cards)
@@ -0,0 +1,128 @@
+import threading
+from typing import TYPE_CHECKING
+from Infraestructure.MetricsRegistry import metrics_registry
+from Infraestructure.RequestScheduler import RequestScheduler
+
+# jira pulls in requests, oauthlib and friends, it is only imported once a client is needed
+if TYPE_CHECKING:
+    from jira import JIRA
+
+
+class RequestCounter:
+    """Response hook counting the HTTP requests made through a session"""
+
+    def __init__(self):
+        self.count: int = 0
+        self._lock = threading.Lock()
+
+
+    def __call__(self, response, *args, **kwargs):
+        with self._lock:
+            self.count += 1
+
+
+class JiraClientRegistry:
+    """Long-lived Jira clients keyed by (server, email, token).
+
+    Each client is created once, with a keep-alive connection pool, and shared by the
+    GUI thread and the worker threads. Clients are only rebuilt after invalidate().
+    Every request goes through the scheduler of its server, which also handles retries.
+    Each server gets its own scheduler, as each one has its own rate limit, unless a
+    scheduler to share is given. Without a rate_limit requests are only slowed down
+    once the server announces its limit or throttles them."""
+
+    def __init__(self, scheduler: RequestScheduler | None = None, rate_limit: float | None = None):
+        self.rate_limit: float | None = rate_limit
+        self._shared_scheduler = scheduler
+        self._schedulers: dict[str, RequestScheduler] = {}
+        self._clients: dict[tuple[str, str, str], tuple["JIRA", RequestCounter]] = {}
+        # Held while the client of a key is created, which takes a request to its server
+        self._creating: dict[tuple[str, str, str], threading.Lock] = {}
+        self._lock = threading.Lock()
+
+
+    def scheduler(self, server: str) -> RequestScheduler:
+        """Scheduler of the requests sent to the given server"""
+        with self._lock:
+            return self._scheduler(server)
+
+
+    def configure_rate_limit(self, rate_limit: float | None) -> None:
+        """Most requests per second sent to each server, None to leave it to the server"""
+        with self._lock:
+            # Called with every integration built, the schedulers keep what they learned unless the limit changed
+            if rate_limit == self.rate_limit:
+                return
+            self.rate_limit = rate_limit
+            schedulers = list(self._schedulers.values())
+        if self._shared_scheduler is not None:
+            schedulers.append(self._shared_scheduler)
+        for scheduler in schedulers:
+            scheduler.configure(rate_limit)
+
+
+    def get(self, server: str, email: str, token: str, pool_size: int = 10, timeout: float = 20.0) -> tuple["JIRA", RequestCounter]:
+        """Client of the given credentials and the counter of the requests made through it.
+        Pool size and timeout only apply when the client is first created."""
+        key = (server, email, token)
+        with self._lock:
+            entry = self._clients.get(key)
+            if entry is not None:
+                return entry
+            creating = self._creating.setdefault(key, threading.Lock())
+            scheduler = self._scheduler(server)
+
+        # Created outside the registry lock: a slow or unreachable server only holds up the callers of that client
+        with creating:
+            with self._lock:
+                entry = self._clients.get(key)
+            if entry is None:
+                entry = self._create_client(server, email, token, pool_size, timeout, scheduler)
+                with self._lock:
+                    self._clients[key] = entry
+                    self._creating.pop(key, None)
+            return entry
+
+
+    def invalidate(self) -> None:
+        """Forget every client, the next get() builds a new one.
+        Clients still in use by a running request are left to finish and be collected."""
+        with self._lock:
+            self._clients.clear()
+
+
+    def _scheduler(self, server: str) -> RequestScheduler:
+        if self._shared_scheduler is not None:
+            return self._shared_scheduler
+        scheduler = self._schedulers.get(server)
+        if scheduler is None:
+            scheduler = self._schedulers[server] = RequestScheduler(self.rate_limit)
+        return scheduler
+
+
+    def _create_client(self, server: str, email: str, token: str, pool_size: int, timeout: float,
+                       scheduler: RequestScheduler) -> tuple["JIRA", RequestCounter]:
+        from jira import JIRA
+        from Infraestructure.ScheduledHTTPAdapter import ScheduledHTTPAdapter
+
+        # Retries are left to the scheduler, which spaces them for every thread at once.
+        # Server info is fetched below, once the session goes through the scheduler
+        client = JIRA(server=server, basic_auth=(email, token), timeout=timeout, max_retries=0, get_server_info=False)
+
+        # Connections are kept alive and reused by every thread sharing the client
+        adapter = ScheduledHTTPAdapter(scheduler, pool_connections=pool_size, pool_maxsize=pool_size)
+        client._session.mount("https://", adapter)
+        client._session.mount("http://", adapter)
+
+        counter = RequestCounter()
+        client._session.hooks["response"].append(counter)
+        client._session.hooks["response"].append(metrics_registry.record_response)
+
+        # What JIRA(get_server_info=True) does, Cloud detection depends on it
+        server_info = client.server_info()
+        client._version = tuple(server_info["versionNumbers"])
+        client.deploymentType = server_info.get("deploymentType")
+        return client, counter
+
+
+jira_client_registry = JiraClientRegistry()
\ No newline at end of file
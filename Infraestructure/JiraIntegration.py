@@ -1,86 +1,267 @@
+import sys
+import time
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 from typing import Any
 from Domain.Interfaces.IBoardIntegration import IBoardIntegration
 from Domain.Models.Card import Card
-from jira import JIRA, Issue
+from Domain.Models.CardDelta import CardDelta
+from Infraestructure.CardQuery import CardQuery
+from Infraestructure.JiraClientRegistry import JiraClientRegistry, jira_client_registry
+from Infraestructure.RequestScheduler import Priority, priority
+from jira import JIRA, Issue, JIRAError
 from jira.client import ResultList
 
 
 class JiraIntegration(IBoardIntegration):
-    
-    def __init__(self, server: str, user_email: str, user_token: str):
+    # Upper bound of concurrent transitions requests when the server ignores expand=transitions
+    MAX_PARALLEL_REQUESTS: int = 8
+    # Issues requested per search page, Jira Cloud does not return more than 100 at once
+    PAGE_SIZE: int = 100
+    # Extra minutes queried on delta syncs, covering clock skew between this machine and the server
+    SYNC_MARGIN_MINUTES: int = 2
+    # Keys per "key in (...)" search, keeping the request URL well under server limits
+    KEYS_PER_SEARCH: int = 50
+
+    def __init__(self, server: str, user_email: str, user_token: str, query: CardQuery | None = None,
+                 pool_size: int = 10, timeout: float = 20.0, client_registry: JiraClientRegistry | None = None):
         self.user_token: str = user_token
-        self.jira: JIRA = JIRA(server=server, basic_auth=(user_email, user_token))
+        self.query: CardQuery = query if query is not None else CardQuery()
 
+        # The client (and its connection pool) is shared with every other integration using the same credentials
+        registry = client_registry if client_registry is not None else jira_client_registry
+        self.jira: JIRA
+        self.jira, self._request_counter = registry.get(server, user_email, user_token, pool_size, timeout)
+        self.last_load_request_count: int = 0
 
-    def get_cards(self) -> list[Card]:
-        myself = self.jira.myself()
-        issues: dict[str, Any] | ResultList[Issue]  = self.jira.search_issues(jql_str=f"assignee='{myself['emailAddress']}' AND Sprint in openSprints() AND Sprint not in futureSprints()", maxResults=1000)
-        if type(issues) == dict[str, Any]:
-            return []
 
-        issues = ResultList[Issue](issues)
+    @property
+    def request_count(self) -> int:
+        """HTTP requests made so far through the shared client"""
+        return self._request_counter.count
+
 
+    def get_cards(self) -> list[Card]:
         cards: list[Card] = []
+        for page in self.iter_cards():
+            cards.extend(page)
+        return cards
 
-        for issue in issues:
-            issue_dict = dict(issue.raw)
 
-            transitions = self.jira.transitions(issue)
-            if transitions == None or len(transitions) == 0:
-                transitions = []
-            else:
-                transitions = [str(transition["to"]["name"]).capitalize() for transition in transitions]
-
-            status = issue_dict["fields"]["status"]["name"]
-            if status == "Concluído":
-                continue
-
-            duration = issue_dict["fields"]["aggregatetimeoriginalestimate"]
-            if duration is None:
-                duration = "0"
-
-            time_spent = issue_dict["fields"]["aggregateprogress"]["progress"]
-            if time_spent is None:
-                time_spent = "0"
-
-            card: Card = Card(id=issue.key, 
-                              name=issue.fields.summary, 
-                              epick=issue_dict["fields"]["parent"]["fields"]["summary"],
-                              estimated_duration=int(duration),
-                              time_spent=int(time_spent),
-                              current_stage=issue_dict["fields"]["status"]["name"].capitalize(),
-                              possible_next_stages=transitions)
-            cards.append(card)
-            
-        return cards
+    def iter_cards(self) -> Iterator[list[Card]]:
+        requests_before = self.request_count
+
+        for issues in self._search_pages(self.query.to_jql(), list(self.query.fields), self.query.expand):
+            cards = self._cards_from_issues(issues)
+            self.last_load_request_count = self.request_count - requests_before
+            yield cards
+
+
+    def sync_cards(self, known_ids: set[str], since: float | None) -> CardDelta:
+        if since is None:
+            return super().sync_cards(known_ids, since)
+
+        requests_before = self.request_count
+        synced_at = time.time()
+        jql = self.query.to_jql()
+
+        # Only issues updated since the last sync are transferred in full.
+        # A relative date keeps the query independent of the server timezone
+        minutes = int((synced_at - since) // 60) + self.SYNC_MARGIN_MINUTES
+        changed: list[Card] = []
+        for issues in self._search_pages(f"{jql} AND updated >= -{minutes}m", list(self.query.fields), self.query.expand):
+            changed.extend(self._cards_from_issues(issues))
+
+        # Removals are detected from the keys alone: finished, reassigned or deleted issues no longer match
+        current_ids: set[str] = set()
+        for issues in self._search_pages(jql, ["key"], None):
+            current_ids.update(issue.key for issue in issues)
 
+        # Issues that started matching without being updated (e.g. a new extra_jql) are loaded as well
+        missing_ids = current_ids - known_ids - {card.id for card in changed}
+        if missing_ids:
+            changed.extend(self._cards_by_keys(sorted(missing_ids), self.query.exclude_done))
 
-    def add_timespent_to_card(self, card: Card) -> bool:
-        self.jira.add_worklog(card.id, timeSpentSeconds=card.time_spent)
+        self.last_load_request_count = self.request_count - requests_before
+        return CardDelta(changed=changed, removed_ids=known_ids - current_ids, synced_at=synced_at)
+
+
+    def sync_issues(self, issues: set[str]) -> CardDelta:
+        requests_before = self.request_count
+        synced_at = time.time()
+        wanted = sorted(issues)
+        changed: list[Card] = []
+        # Only the named issues that still match the card query come back
+        for i in range(0, len(wanted), self.KEYS_PER_SEARCH):
+            changed.extend(self._search_keys(wanted[i:i + self.KEYS_PER_SEARCH], self.query.to_jql()))
+
+        # Issues named by their numeric id (worklog payloads) can't be matched to a card id
+        current_ids = {card.id for card in changed}
+        removed_ids = {issue for issue in issues if not issue.isdigit()} - current_ids
+        self.last_load_request_count = self.request_count - requests_before
+        return CardDelta(changed=changed, removed_ids=removed_ids, synced_at=synced_at)
+
+
+    def add_timespent_to_card(self, card: Card, started: datetime | None = None) -> bool:
+        with priority(Priority.INTERACTIVE):
+            self.jira.add_worklog(card.id, timeSpentSeconds=card.time_spent, started=started)
         return True
 
 
+    @priority(Priority.INTERACTIVE)
     def change_card_stage(self, card: Card, new_stage: str) -> bool:
-        issue: Issue = self.jira.issue(card.id)
-        card_transitions = self.jira.transitions(issue)
-        transition_id = [transition["id"] for transition in card_transitions if str(transition["to"]["name"]).capitalize() == new_stage][0]
+        # Common case: a single request with the transition id captured when the card was loaded
+        transition_id = card.transition_ids.get(new_stage)
+        if transition_id is not None:
+            try:
+                self.jira.transition_issue(card.id, transition_id)
+                return True
+            except JIRAError as e:
+                # Only a rejected transition id means the workflow changed since the card was loaded,
+                # authentication, server and network errors are not fixed by refetching the map
+                if e.status_code not in (400, 404):
+                    raise
+
+        self._reload_transitions(card)
+        transition_id = card.transition_ids.get(new_stage)
+        if transition_id is None:
+            raise ValueError(f"{card.id} can't be moved to {new_stage}, "
+                             f"available stages: {', '.join(card.possible_next_stages) or 'none'}")
         self.jira.transition_issue(card.id, transition_id)
         return True
-    
 
+
+    @priority(Priority.INTERACTIVE)
     def refresh_card(self, card: Card) -> Card:
-        issue: Issue = self.jira.issue(card.id)
-        issue_dict = dict(issue.raw)
+        issue: Issue = self.jira.issue(card.id, fields=",".join(self.query.fields), expand=self.query.expand)
+        transitions = issue.raw["transitions"] if "transitions" in issue.raw else self.jira.transitions(issue)
+
+        refreshed_card = self._card_from_raw(dict(issue.raw), transitions)
+        if refreshed_card is None:
+            return card
+
+        return refreshed_card
+
+
+    def refresh_cards(self, cards: list[Card]) -> list[Card]:
+        # Finished issues are transferred as well, so they can be reported as unchanged like refresh_card does
+        refreshed = {card.id: card for card in self._cards_by_keys([card.id for card in cards], exclude_done=False)}
+        return [refreshed.get(card.id, card) for card in cards]
+
+
+    def _reload_transitions(self, card: Card) -> None:
+        """Replace the card transitions with the ones currently offered by the server"""
+        transitions = self.jira.transitions(card.id)
+        card.possible_next_stages = tuple(sys.intern(str(transition["to"]["name"]).capitalize()) for transition in transitions)
+        card.transition_ids = {sys.intern(str(transition["to"]["name"]).capitalize()): transition["id"] for transition in transitions}
 
-        transitions = self.jira.transitions(issue)
+
+    def _search_pages(self, jql: str, fields: list[str], expand: str | None, validate_query: bool = True) -> Iterator[ResultList[Issue]]:
+        """Run the search one page at a time until every matching issue was returned"""
+        if self.jira._is_cloud:
+            # Jira Cloud only pages searches with tokens and reports no total
+            yield from self._search_token_pages(jql, fields, expand)
+            return
+
+        start_at = 0
+        while True:
+            issues: ResultList[Issue] = self.jira.search_issues(jql_str=jql,
+                                                                 startAt=start_at,
+                                                                 maxResults=self.PAGE_SIZE,
+                                                                 fields=fields,
+                                                                 expand=expand,
+                                                                 validate_query=validate_query)
+            yield issues
+
+            start_at += len(issues)
+            if len(issues) == 0 or start_at >= issues.total:
+                break
+
+
+    def _search_token_pages(self, jql: str, fields: list[str], expand: str | None) -> Iterator[ResultList[Issue]]:
+        next_page_token: str | None = None
+        while True:
+            issues: ResultList[Issue] = self.jira.enhanced_search_issues(jql_str=jql,
+                                                                          nextPageToken=next_page_token,
+                                                                          maxResults=self.PAGE_SIZE,
+                                                                          fields=fields,
+                                                                          expand=expand)
+            yield issues
+
+            next_page_token = issues.nextPageToken
+            if len(issues) == 0 or not next_page_token:
+                break
+
+
+    def _cards_by_keys(self, keys: list[str], exclude_done: bool) -> list[Card]:
+        """Cards of the given issue keys, fetched with as few "issue in (...)" searches as the URL allows"""
+        cards: list[Card] = []
+        for i in range(0, len(keys), self.KEYS_PER_SEARCH):
+            cards.extend(self._search_keys(keys[i:i + self.KEYS_PER_SEARCH], "statusCategory != Done" if exclude_done else ""))
+        return cards
+
+
+    def _search_keys(self, keys: list[str], condition: str) -> list[Card]:
+        """Cards of the given issue keys or ids that also match condition, a JQL clause"""
+        jql = f"issue in ({','.join(keys)})"
+        if condition:
+            jql += f" AND {condition}"
+        try:
+            # Without validation keys of deleted issues are skipped instead of failing the whole search
+            return [card for issues in self._search_pages(jql, list(self.query.fields), self.query.expand, validate_query=False)
+                    for card in self._cards_from_issues(issues)]
+        except JIRAError as e:
+            if e.status_code != 400:
+                raise
+        # Jira Cloud validates the keys regardless and fails the search on a deleted or moved issue:
+        # the keys are split until the ones it refuses are searched on their own, and skipped
+        if len(keys) == 1:
+            return []
+        middle = len(keys) // 2
+        return self._search_keys(keys[:middle], condition) + self._search_keys(keys[middle:], condition)
+
+
+    def _cards_from_issues(self, issues: ResultList[Issue]) -> list[Card]:
+        issues_transitions = self._get_issues_transitions(list(issues))
+
+        cards: list[Card] = []
+        for issue in issues:
+            card = self._card_from_raw(dict(issue.raw), issues_transitions[issue.key])
+            if card is not None:
+                cards.append(card)
+        return cards
+
+
+    def _get_issues_transitions(self, issues: list[Issue]) -> dict[str, list[dict[str, Any]]]:
+        """Transitions of each issue, taken from the expanded search results.
+        Issues that came back without them are fetched with a bounded number of requests in flight."""
+        issues_transitions: dict[str, list[dict[str, Any]]] = {}
+        missing: list[Issue] = []
+
+        for issue in issues:
+            if "transitions" in issue.raw:
+                issues_transitions[issue.key] = issue.raw["transitions"]
+            else:
+                missing.append(issue)
+
+        if missing:
+            with ThreadPoolExecutor(max_workers=self.MAX_PARALLEL_REQUESTS) as executor:
+                for issue, transitions in zip(missing, executor.map(self.jira.transitions, missing)):
+                    issues_transitions[issue.key] = transitions
+
+        return issues_transitions
+
+
+    def _card_from_raw(self, issue_dict: dict[str, Any], transitions: list[dict[str, Any]] | None) -> Card | None:
+        """Build a Card from the raw issue json, or None when the issue is already finished"""
         if transitions == None or len(transitions) == 0:
             transitions = []
-        else:
-            transitions = [str(transition["to"]["name"]).capitalize() for transition in transitions]
+        transition_ids = {str(transition["to"]["name"]).capitalize(): transition["id"] for transition in transitions}
 
-        status = issue_dict["fields"]["status"]["name"]
-        if status == "Concluído":
-            return card
+        status = issue_dict["fields"]["status"]
+        if status["name"] == "Concluído" or status.get("statusCategory", {}).get("key") == "done":
+            return None
 
         duration = issue_dict["fields"]["aggregatetimeoriginalestimate"]
         if duration is None:
@@ -90,11 +271,12 @@ class JiraIntegration(IBoardIntegration):
         if time_spent is None:
             time_spent = "0"
 
-        refreshed_card: Card = Card(id=issue.key,
-                          name=issue.fields.summary,
+        card: Card = Card(id=issue_dict["key"],
+                          name=issue_dict["fields"]["summary"],
                           epick=issue_dict["fields"]["parent"]["fields"]["summary"],
                           estimated_duration=int(duration),
                           time_spent=int(time_spent),
                           current_stage=issue_dict["fields"]["status"]["name"].capitalize(),
-                          possible_next_stages=transitions)
-        return refreshed_card
\ No newline at end of file
+                          possible_next_stages=tuple(str(transition["to"]["name"]).capitalize() for transition in transitions),
+                          transition_ids=transition_ids)
+        return card
\ No newline at end of file
@@ -0,0 +1,204 @@
+import bisect
+import functools
+import json
+import re
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from pathlib import Path
+from typing import Any
+
+
+# Returned by timed() while metrics are disabled, nullcontext can be entered any number of times
+_DISABLED = nullcontext()
+
+
+class LatencyHistogram:
+    """Durations counted in fixed millisecond buckets, with approximate percentiles"""
+    BOUNDS_MS: tuple[float, ...] = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+    def __init__(self):
+        self.counts: list[int] = [0] * (len(self.BOUNDS_MS) + 1)
+        self.count: int = 0
+        self.total_ms: float = 0.0
+        self.max_ms: float = 0.0
+
+
+    def observe(self, duration_ms: float) -> None:
+        self.counts[bisect.bisect_left(self.BOUNDS_MS, duration_ms)] += 1
+        self.count += 1
+        self.total_ms += duration_ms
+        self.max_ms = max(self.max_ms, duration_ms)
+
+
+    def percentile(self, fraction: float) -> float:
+        """Upper bound of the bucket holding the given fraction of the observations"""
+        if self.count == 0:
+            return 0.0
+        threshold = fraction * self.count
+        seen = 0
+        for bound, count in zip(self.BOUNDS_MS, self.counts):
+            seen += count
+            if seen >= threshold:
+                return min(float(bound), self.max_ms)
+        return self.max_ms
+
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "avg_ms": round(self.total_ms / self.count, 3) if self.count else 0.0,
+            "p50_ms": self.percentile(0.5),
+            "p95_ms": self.percentile(0.95),
+            "max_ms": round(self.max_ms, 3),
+            "buckets": {(f"<={bound}" if i < len(self.BOUNDS_MS) else f">{self.BOUNDS_MS[-1]}"): count
+                        for i, (bound, count) in enumerate(zip(self.BOUNDS_MS + (None,), self.counts))},
+        }
+
+
+class OperationMetrics:
+    """Totals of one kind of operation"""
+
+    def __init__(self):
+        self.calls: int = 0
+        self.errors: int = 0
+        self.requests: int = 0
+        self.bytes_sent: int = 0
+        self.bytes_received: int = 0
+        self.last_error: str | None = None
+        self.latency = LatencyHistogram()
+
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "requests": self.requests,
+            "bytes_sent": self.bytes_sent,
+            "bytes_received": self.bytes_received,
+            "last_error": self.last_error,
+            "latency": self.latency.to_dict(),
+        }
+
+
+class MetricsRegistry:
+    """In-process metrics of board operations and of the HTTP requests they make.
+
+    Disabled by default: timed() then returns a shared no-op context and the HTTP hook
+    returns right away, so instrumented code costs next to nothing."""
+
+    # Issue keys and ids in request paths, replaced so requests are grouped by endpoint
+    _ISSUE_PATH = re.compile(r"/issue/[^/?]+")
+
+    def __init__(self, enabled: bool = False):
+        self.enabled: bool = enabled
+        self.started_at: float = time.time()
+        self._operations: dict[str, OperationMetrics] = {}
+        self._lock = threading.Lock()
+        # HTTP traffic of the current thread, attributed to the operation timed on it
+        self._traffic = threading.local()
+
+
+    def record(self, name: str, duration_ms: float, error: str | None = None,
+               requests: int = 0, bytes_sent: int = 0, bytes_received: int = 0) -> None:
+        if not self.enabled:
+            return
+        with self._lock:
+            metrics = self._operations.get(name)
+            if metrics is None:
+                metrics = self._operations[name] = OperationMetrics()
+            metrics.calls += 1
+            metrics.requests += requests
+            metrics.bytes_sent += bytes_sent
+            metrics.bytes_received += bytes_received
+            metrics.latency.observe(duration_ms)
+            if error is not None:
+                metrics.errors += 1
+                metrics.last_error = error
+
+
+    def timed(self, name: str):
+        """Context manager recording the duration, outcome and HTTP traffic of the enclosed code"""
+        if not self.enabled:
+            return _DISABLED
+        return self._timed(name)
+
+
+    def start(self) -> tuple[float, tuple[int, int, int]]:
+        """Mark for finish(), when the timed code can't be enclosed in timed()"""
+        return time.perf_counter(), self._thread_traffic()
+
+
+    def finish(self, name: str, mark: tuple[float, tuple[int, int, int]], error: BaseException | None = None) -> None:
+        """Record the code run on this thread since start() returned mark"""
+        start, traffic_before = mark
+        traffic = self._thread_traffic()
+        self.record(name, (time.perf_counter() - start) * 1000,
+                    f"{type(error).__name__}: {error}" if error is not None else None,
+                    *(after - before for after, before in zip(traffic, traffic_before)))
+
+
+    def instrument(self, name: str):
+        """Decorator recording every call of the decorated function, like timed()"""
+        def decorator(function):
+            @functools.wraps(function)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return function(*args, **kwargs)
+                with self._timed(name):
+                    return function(*args, **kwargs)
+            return wrapper
+        return decorator
+
+
+    @contextmanager
+    def _timed(self, name: str):
+        mark = self.start()
+        try:
+            yield
+        except BaseException as e:
+            self.finish(name, mark, e)
+            raise
+        self.finish(name, mark)
+
+
+    def record_response(self, response, *args, **kwargs) -> None:
+        """requests response hook recording every HTTP request as "http <METHOD> <path>" """
+        if not self.enabled:
+            return
+
+        request = response.request
+        body = request.body or b""
+        bytes_sent = len(body.encode("utf-8") if isinstance(body, str) else body)
+        bytes_received = int(response.headers.get("Content-Length") or len(response.content))
+
+        traffic = self._thread_traffic()
+        self._traffic.totals = (traffic[0] + 1, traffic[1] + bytes_sent, traffic[2] + bytes_received)
+
+        path = self._ISSUE_PATH.sub("/issue/{key}", request.path_url.split("?", 1)[0])
+        self.record(f"http {request.method} {path}", response.elapsed.total_seconds() * 1000,
+                    None if response.ok else f"HTTP {response.status_code}", 1, bytes_sent, bytes_received)
+
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            operations = {name: metrics.to_dict() for name, metrics in sorted(self._operations.items())}
+        return {"enabled": self.enabled, "started_at": self.started_at, "taken_at": time.time(), "operations": operations}
+
+
+    def export(self, path: str | Path) -> None:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.snapshot(), f, indent=2)
+
+
+    def reset(self) -> None:
+        with self._lock:
+            self._operations.clear()
+            self.started_at = time.time()
+
+
+    def _thread_traffic(self) -> tuple[int, int, int]:
+        """Requests, bytes sent and bytes received so far on the current thread"""
+        return getattr(self._traffic, "totals", (0, 0, 0))
+
+
+metrics_registry = MetricsRegistry()
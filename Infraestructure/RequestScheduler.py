@@ -0,0 +1,196 @@
+import math
+import random
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from enum import IntEnum
+from typing import Mapping
+
+
+class Priority(IntEnum):
+    """Order in which waiting requests are let through, lower first"""
+    INTERACTIVE = 0  # The user is waiting on it: worklogs, transitions, the selected card
+    BACKGROUND = 1   # Loads and syncs
+
+
+_current = threading.local()
+
+
+def current_priority() -> Priority:
+    return getattr(_current, "priority", Priority.BACKGROUND)
+
+
+@contextmanager
+def priority(value: Priority):
+    """Send the requests made on this thread inside the block with the given priority"""
+    previous = current_priority()
+    _current.priority = value
+    try:
+        yield
+    finally:
+        _current.priority = previous
+
+
+class RequestScheduler:
+    """Token bucket shared by every request to the board server.
+
+    Background requests leave interactive_reserve tokens to interactive ones and
+    wait while any interactive request is waiting. When the server asks to slow
+    down (429, Retry-After, X-RateLimit-* headers) every thread holds off until
+    the given time, instead of each one retrying on its own.
+
+    A rate of None sends as fast as the callers ask until the server announces its
+    rate limit or throttles a request, THROTTLED_RATE applies when it didn't say."""
+
+    MAX_RETRIES: int = 4
+    INITIAL_BACKOFF: float = 1.0
+    MAX_BACKOFF: float = 60.0
+    # Requests per second once throttled by a server that doesn't announce its rate
+    THROTTLED_RATE: float = 10.0
+
+    def __init__(self, rate: float | None = None, capacity: int = 10, interactive_reserve: int = 2):
+        self.rate: float | None = rate
+        self.capacity: int = capacity
+        self.interactive_reserve: int = interactive_reserve
+        self.paused_until: float = 0.0
+        self._configured_rate: float | None = rate
+        self._server_rate: float | None = None  # As announced by the server, or THROTTLED_RATE once throttled
+        self._tokens: float = float(capacity)
+        self._refilled_at: float = time.monotonic()
+        self._waiting: dict[Priority, int] = {level: 0 for level in Priority}
+        self._condition = threading.Condition()
+
+
+    def configure(self, rate: float | None, capacity: int | None = None) -> None:
+        """Set the most requests per second sent, the rate learned from the server still applies when lower"""
+        with self._condition:
+            self._refill()
+            self._configured_rate = rate
+            self._apply_rate()
+            if capacity is not None:
+                self.capacity = capacity
+                self._tokens = min(self._tokens, capacity)
+            self._condition.notify_all()
+
+
+    def acquire(self, level: Priority | None = None) -> None:
+        """Block until a request of the given priority (the thread's one by default) may be sent"""
+        level = current_priority() if level is None else level
+        with self._condition:
+            self._waiting[level] += 1
+            try:
+                while True:
+                    now = time.monotonic()
+                    self._refill(now)
+                    reserve = self.interactive_reserve if level > Priority.INTERACTIVE else 0
+                    ahead = any(count for other, count in self._waiting.items() if other < level)
+
+                    if now >= self.paused_until and self._tokens >= 1 + reserve and not ahead:
+                        self._tokens -= 1
+                        return
+
+                    if now < self.paused_until:
+                        timeout = self.paused_until - now
+                    elif ahead:
+                        # Woken up when the requests ahead are let through
+                        timeout = None
+                    else:
+                        timeout = (1 + reserve - self._tokens) / self.rate
+                    self._condition.wait(timeout)
+            finally:
+                self._waiting[level] -= 1
+                self._condition.notify_all()
+
+
+    def pause(self, seconds: float) -> None:
+        """Hold every request off for the given time"""
+        with self._condition:
+            self.paused_until = max(self.paused_until, time.monotonic() + seconds)
+            # Once the pause is over requests resume at the normal rate, not as a burst
+            if self._server_rate is None:
+                self._server_rate = self.THROTTLED_RATE
+                self._apply_rate()
+            self._tokens = 0.0
+            self._refilled_at = self.paused_until
+            self._condition.notify_all()
+
+
+    def observe(self, status_code: int, headers: Mapping[str, str]) -> None:
+        """Follow the rate limit the server announces on a response"""
+        # Jira Cloud describes its own token bucket, never send faster than it refills
+        fill_rate = headers.get("X-RateLimit-FillRate")
+        interval = headers.get("X-RateLimit-Interval-Seconds")
+        if fill_rate and interval:
+            try:
+                server_rate = float(fill_rate) / float(interval)
+            except (ValueError, ZeroDivisionError):
+                server_rate = None
+            # A rate that lets nothing through would stop every request, Retry-After covers an empty bucket
+            if server_rate is not None and 0 < server_rate < math.inf:
+                with self._condition:
+                    self._server_rate = server_rate
+                    self._apply_rate()
+
+        if headers.get("X-RateLimit-Remaining") == "0":
+            reset_in = _seconds_until(headers.get("X-RateLimit-Reset"))
+            if reset_in:
+                self.pause(reset_in)
+
+
+    def retry_delay(self, status_code: int, headers: Mapping[str, str], attempt: int) -> float | None:
+        """Seconds to wait before retrying a throttled request, None when it shouldn't be retried"""
+        if status_code not in (429, 503) or attempt >= self.MAX_RETRIES:
+            return None
+        # A 503 without Retry-After is an outage rather than throttling
+        if status_code == 503 and "Retry-After" not in headers:
+            return None
+
+        delay = _seconds_until(headers.get("Retry-After"))
+        if delay is None:
+            delay = min(self.MAX_BACKOFF, self.INITIAL_BACKOFF * 2 ** attempt)
+        # Jitter spreads the retries of every client throttled at the same moment
+        return delay * random.uniform(1.0, 1.25)
+
+
+    def backoff(self, attempt: int) -> float:
+        """Jittered delay before retrying a request that failed to connect"""
+        return min(self.MAX_BACKOFF, self.INITIAL_BACKOFF * 2 ** attempt) * random.uniform(0.8, 1.2)
+
+
+    def _apply_rate(self) -> None:
+        limits = [rate for rate in (self._configured_rate, self._server_rate) if rate is not None]
+        self.rate = min(limits) if limits else None
+
+
+    def _refill(self, now: float | None = None) -> None:
+        now = time.monotonic() if now is None else now
+        if self.rate is None:
+            self._tokens = float(self.capacity)
+            self._refilled_at = now
+        elif now > self._refilled_at:
+            self._tokens = min(self.capacity, self._tokens + (now - self._refilled_at) * self.rate)
+            self._refilled_at = now
+
+
+def _seconds_until(value: str | None) -> float | None:
+    """Seconds from now until the time in a Retry-After or X-RateLimit-Reset header (delta seconds, HTTP or ISO date)"""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        moment = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        try:
+            moment = datetime.fromisoformat(value)
+        except ValueError:
+            return None
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return max(0.0, (moment - datetime.now(timezone.utc)).total_seconds())
+
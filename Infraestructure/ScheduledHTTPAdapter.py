@@ -0,0 +1,51 @@
+import time
+from datetime import timedelta
+from requests.adapters import HTTPAdapter
+from requests.exceptions import ConnectionError
+from requests.hooks import dispatch_hook
+from Infraestructure.RequestScheduler import RequestScheduler
+
+# Methods safe to send again when the connection failed midway
+IDEMPOTENT_METHODS = {"GET", "HEAD", "OPTIONS", "PUT", "DELETE"}
+
+
+class ScheduledHTTPAdapter(HTTPAdapter):
+    """Connection pool whose requests go through a RequestScheduler.
+
+    Throttled requests (429, or 503 with Retry-After) and idempotent requests that failed
+    to connect are retried by the adapter, after the delay the server asked for. The
+    response hooks of the session (request counters, metrics) see every throttled
+    attempt, not only the final response."""
+
+    def __init__(self, scheduler: RequestScheduler, pool_connections: int = 10, pool_maxsize: int = 10):
+        super().__init__(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+        self.scheduler = scheduler
+
+
+    def send(self, request, **kwargs):
+        attempt = 0
+        while True:
+            self.scheduler.acquire()
+            started = time.perf_counter()
+            try:
+                response = super().send(request, **kwargs)
+            except ConnectionError:
+                if request.method not in IDEMPOTENT_METHODS or attempt >= self.scheduler.MAX_RETRIES:
+                    raise
+                time.sleep(self.scheduler.backoff(attempt))
+                attempt += 1
+                continue
+
+            self.scheduler.observe(response.status_code, response.headers)
+            delay = self.scheduler.retry_delay(response.status_code, response.headers, attempt)
+            if delay is None:
+                return response
+
+            # The session only hands the response returned to its hooks, a throttled attempt is a request too
+            response.elapsed = timedelta(seconds=time.perf_counter() - started)
+            dispatch_hook("response", request.hooks, response, **kwargs)
+            print(f"Jira throttled {request.method} {request.path_url.split('?', 1)[0]} (HTTP {response.status_code}), "
+                  f"retrying in {delay:.1f}s")
+            response.close()
+            self.scheduler.pause(delay)
+            attempt += 1
@@ -0,0 +1,173 @@
+import json
+import os
+import threading
+import time
+from dataclasses import replace
+from pathlib import Path
+from Domain.Models.Card import Card
+from Domain.Models.TimerSession import TimerSession
+
+
+class TimerJournal:
+    """Append-only journal of the timer session, replayed on start to recover it after a crash.
+
+    Start, pause, resume and stop are appended with their monotonic and wall clock times,
+    along with a checkpoint now and then while the timer runs. A record is written and
+    flushed on the calling thread, which survives a crash of the app at the cost of a
+    write() call; it reaches the disk through a background fsync, so a power loss costs
+    at most the last few records. The journal starts over with every session."""
+
+    # A running session is only resumed when the app was down for less than this,
+    # otherwise it comes back paused: nobody knows whether the work went on meanwhile
+    RESUME_WINDOW: float = 300.0
+    # Monotonic and wall clock may drift apart by this much and still be the same boot
+    CLOCK_TOLERANCE: float = 5.0
+
+    def __init__(self, journal_path: str | Path = "timer_journal.jsonl"):
+        self.journal_path = Path(journal_path)
+        self.session: TimerSession | None = None  # As of the last record
+        self._lock = threading.Lock()
+        self._sync_event = threading.Event()
+        self._syncer: threading.Thread | None = None
+        torn = self._replay()
+        self._file = open(self.journal_path, 'a', encoding='utf-8')
+        if torn:
+            # New records must not be glued to the torn line
+            self._file.write("\n")
+            self._file.flush()
+
+
+    def start(self, card: Card, elapsed: float) -> None:
+        """Record the start of a session on card, the timer showing elapsed (logged time included)"""
+        with self._lock:
+            # Only the current session is kept
+            self._file.seek(0)
+            self._file.truncate()
+            self.session = TimerSession(card_id=card.id, card_name=card.name, time_spent=card.time_spent,
+                                        elapsed=elapsed, running=True, monotonic=0.0, wall=0.0)
+            self._append("start", elapsed, card_id=card.id, card_name=card.name, time_spent=card.time_spent)
+
+
+    def pause(self, elapsed: float) -> None:
+        self._record("pause", elapsed, running=False)
+
+
+    def resume(self, elapsed: float) -> None:
+        self._record("resume", elapsed, running=True)
+
+
+    def checkpoint(self, elapsed: float) -> None:
+        """Record how far a running timer got, bounding what a power loss can cost"""
+        self._record("checkpoint", elapsed, running=True)
+
+
+    def stop(self) -> None:
+        with self._lock:
+            if self.session is None:
+                return
+            self._append("stop", self.session.elapsed)
+            self.session = None
+
+
+    def recover(self) -> TimerSession | None:
+        """The session left open by the last run, as of now, or None.
+
+        A running session counts the time the app was down when that was less than
+        RESUME_WINDOW, otherwise it is returned paused with the time recorded last."""
+        with self._lock:
+            session = self.session
+        if session is None or not session.running:
+            return session
+
+        down_for = self._time_since(session)
+        if down_for is not None and down_for <= self.RESUME_WINDOW:
+            return replace(session, elapsed=session.elapsed + down_for, monotonic=time.monotonic(), wall=time.time())
+        return replace(session, running=False)
+
+
+    def close(self) -> None:
+        with self._lock:
+            self._file.close()
+
+
+    def _time_since(self, session: TimerSession) -> float | None:
+        """Seconds since the session's last record, None when the clocks make no sense"""
+        wall_delta = time.time() - session.wall
+        monotonic_delta = time.monotonic() - session.monotonic
+        # Same boot: the monotonic clock is immune to wall clock changes
+        if 0 <= monotonic_delta <= wall_delta + self.CLOCK_TOLERANCE:
+            return monotonic_delta
+        # Rebooted since, only the wall clock relates the two runs
+        return wall_delta if wall_delta >= 0 else None
+
+
+    def _record(self, op: str, elapsed: float, running: bool) -> None:
+        with self._lock:
+            if self.session is None:
+                return
+            self.session.elapsed = elapsed
+            self.session.running = running
+            self._append(op, elapsed)
+
+
+    def _append(self, op: str, elapsed: float, **fields) -> None:
+        now_monotonic, now_wall = time.monotonic(), time.time()
+        self.session.monotonic = now_monotonic
+        self.session.wall = now_wall
+        record = {"op": op, "elapsed": round(elapsed, 3), "monotonic": now_monotonic, "wall": now_wall, **fields}
+        try:
+            self._file.write(json.dumps(record, ensure_ascii=False) + "\n")
+            self._file.flush()
+        except OSError as e:
+            print(f"Error writing timer journal: {e}")
+            return
+        self._request_sync()
+
+
+    def _request_sync(self) -> None:
+        if self._syncer is None:
+            self._syncer = threading.Thread(target=self._sync_loop, name="zilean-timer-journal", daemon=True)
+            self._syncer.start()
+        self._sync_event.set()
+
+
+    def _sync_loop(self) -> None:
+        while True:
+            self._sync_event.wait()
+            self._sync_event.clear()
+            try:
+                os.fsync(self._file.fileno())
+            except (OSError, ValueError):
+                # Closed on quit
+                return
+
+
+    def _replay(self) -> bool:
+        """Restore the session of the journal, returns whether its last line is torn"""
+        if not self.journal_path.exists():
+            return False
+
+        line = "\n"
+        with open(self.journal_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    # A torn line from a crash mid-write, the records before it still count
+                    continue
+
+                op = record["op"]
+                if op == "start":
+                    self.session = TimerSession(card_id=record["card_id"], card_name=record["card_name"],
+                                                time_spent=record["time_spent"], elapsed=record["elapsed"],
+                                                running=True, monotonic=record["monotonic"], wall=record["wall"])
+                elif self.session is None:
+                    continue
+                elif op == "stop":
+                    self.session = None
+                else:
+                    self.session.elapsed = record["elapsed"]
+                    self.session.running = op != "pause"
+                    self.session.monotonic = record["monotonic"]
+                    self.session.wall = record["wall"]
+        return not line.endswith("\n")
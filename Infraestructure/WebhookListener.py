@@ -0,0 +1,131 @@
+import hashlib
+import hmac
+import json
+import threading
+from collections.abc import Callable
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+from urllib.parse import urlsplit
+from Domain.Models.WebhookEvent import WebhookEvent
+
+# Larger bodies are refused, Jira issue payloads are a few KB
+MAX_BODY_SIZE = 1024 * 1024
+
+
+class WebhookListener:
+    """Local HTTP endpoint receiving Jira webhooks, for push based card updates
+
+    Jira (directly, or through a tunnel) posts to /webhook, or /webhook/<connection name>
+    for the cards of another site. Issue created, updated (transitions included), deleted
+    and worklog created payloads are turned into WebhookEvents and handed to on_event on
+    the server thread; other payloads are acknowledged and ignored. With a secret, the
+    X-Hub-Signature HMAC Jira sends along is required to match.
+    """
+
+    def __init__(self, on_event: Callable[[WebhookEvent], None], host: str = "127.0.0.1", port: int = 8765,
+                 secret: str = ""):
+        self.on_event = on_event
+        self.secret = secret
+        self._httpd = ThreadingHTTPServer((host, port), _make_handler(self))
+        self._httpd.daemon_threads = True
+        self._thread: threading.Thread | None = None
+
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}/webhook"
+
+
+    def start(self) -> "WebhookListener":
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name="zilean-webhooks", daemon=True)
+        self._thread.start()
+        return self
+
+
+    def stop(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+
+    def handle(self, path: str, body: bytes, signature: str | None) -> int:
+        """Status code answering a webhook request"""
+        # /webhook or /webhook/<connection name>
+        route = urlsplit(path).path.strip("/").split("/")
+        if route[0] != "webhook" or len(route) > 2:
+            return 404
+        board = route[1] if len(route) == 2 else ""
+        if self.secret and not self._signature_matches(body, signature):
+            return 401
+
+        try:
+            payload = json.loads(body)
+        except json.JSONDecodeError:
+            return 400
+
+        event = parse_webhook(payload, board)
+        if event is not None:
+            self.on_event(event)
+        return 204
+
+
+    def _signature_matches(self, body: bytes, signature: str | None) -> bool:
+        if not signature:
+            return False
+        expected = "sha256=" + hmac.new(self.secret.encode("utf-8"), body, hashlib.sha256).hexdigest()
+        return hmac.compare_digest(expected, signature)
+
+
+def parse_webhook(payload: dict[str, Any], board: str = "") -> WebhookEvent | None:
+    """The event a Jira webhook payload describes, None for payloads cards don't depend on"""
+    name = payload.get("webhookEvent", "")
+    timestamp = payload.get("timestamp", 0) / 1000
+
+    if name in ("jira:issue_created", "jira:issue_updated", "jira:issue_deleted"):
+        key = (payload.get("issue") or {}).get("key")
+        if not key:
+            return None
+        kind = name.removeprefix("jira:")
+        if kind == "issue_updated" and any(item.get("field") == "status"
+                                           for item in (payload.get("changelog") or {}).get("items", [])):
+            kind = "issue_transitioned"
+        return WebhookEvent(kind=kind, issue=key, board=board, timestamp=timestamp)
+
+    if name == "worklog_created":
+        issue_id = (payload.get("worklog") or {}).get("issueId")
+        if not issue_id:
+            return None
+        return WebhookEvent(kind="worklog_created", issue=str(issue_id), board=board, timestamp=timestamp)
+
+    return None
+
+
+def _make_handler(listener: WebhookListener):
+    class WebhookHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_POST(self):
+            length = int(self.headers.get("Content-Length") or 0)
+            if length > MAX_BODY_SIZE:
+                self._answer(413)
+                self.close_connection = True
+                return
+
+            body = self.rfile.read(length)
+            try:
+                status = listener.handle(self.path, body, self.headers.get("X-Hub-Signature"))
+            except Exception as e:
+                print(f"Error handling webhook: {e}")
+                status = 500
+            self._answer(status)
+
+        def _answer(self, status: int):
+            self.send_response(status)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+        def log_message(self, format, *args):
+            # Jira may send many of them, errors are printed by do_POST
+            pass
+
+    return WebhookHandler
@@ -0,0 +1,126 @@
+import json
+import os
+import threading
+import uuid
+from dataclasses import asdict
+from pathlib import Path
+from Domain.Models.Card import Card
+from Domain.Models.WorklogEntry import WorklogEntry
+
+
+class WorklogOutbox:
+    """Journal of worklogs waiting to be sent to the board.
+
+    Every entry is appended to the journal before anything is sent, and a "done" record is
+    appended once the board accepted it, so pending worklogs survive a crash or a quit and are
+    picked up again on the next start. Delivery is at-least-once: a crash between the board
+    accepting a worklog and the "done" record being written sends it again.
+
+    A worklog the board refuses for good (deleted issue, invalid worklog) is marked rejected
+    instead: it is no longer pending, and is kept until the user retries or discards it."""
+
+    def __init__(self, journal_path: str | Path = "worklog_outbox.jsonl"):
+        self.journal_path = Path(journal_path)
+        self._lock = threading.Lock()
+        self._pending: dict[str, WorklogEntry] = {}
+        self._replay()
+
+
+    def append(self, card: Card, seconds: int, started: float) -> WorklogEntry:
+        """Record a worklog to be sent, durable once this returns"""
+        entry = WorklogEntry(id=uuid.uuid4().hex, card_id=card.id, card_name=card.name, seconds=seconds, started=started)
+        with self._lock:
+            self._write({"op": "add", "entry": asdict(entry)})
+            self._pending[entry.id] = entry
+        return entry
+
+
+    def mark_done(self, entry: WorklogEntry) -> None:
+        """Record that the board accepted the worklog"""
+        with self._lock:
+            if self._pending.pop(entry.id, None) is None:
+                return
+            if self._pending:
+                self._write({"op": "done", "id": entry.id})
+            else:
+                # Nothing left to send, the journal starts over
+                self._compact()
+
+
+    def mark_rejected(self, entry: WorklogEntry, reason: str) -> None:
+        """Record that the board refused the worklog for good, it stops being sent"""
+        with self._lock:
+            if entry.id not in self._pending:
+                return
+            self._write({"op": "reject", "id": entry.id, "reason": reason})
+            self._pending[entry.id].rejection = reason
+
+
+    def retry(self, entry: WorklogEntry) -> None:
+        """Send a rejected worklog again, e.g. once the issue was restored"""
+        with self._lock:
+            if entry.id not in self._pending:
+                return
+            self._write({"op": "retry", "id": entry.id})
+            self._pending[entry.id].rejection = None
+
+
+    def discard(self, entry: WorklogEntry) -> None:
+        """Drop a worklog without sending it"""
+        self.mark_done(entry)
+
+
+    def pending(self) -> list[WorklogEntry]:
+        """Worklogs not yet accepted by the board, oldest first. Rejected ones are left out"""
+        with self._lock:
+            return [entry for entry in self._pending.values() if entry.rejection is None]
+
+
+    def rejected(self) -> list[WorklogEntry]:
+        """Worklogs the board refused for good, oldest first"""
+        with self._lock:
+            return [entry for entry in self._pending.values() if entry.rejection is not None]
+
+
+    def _replay(self) -> None:
+        if not self.journal_path.exists():
+            return
+
+        torn = False
+        with open(self.journal_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    # A torn line from a crash mid-write, the record was never acknowledged
+                    torn = True
+                    continue
+                if record["op"] == "add":
+                    entry = WorklogEntry(**record["entry"])
+                    self._pending[entry.id] = entry
+                elif record["op"] == "done":
+                    self._pending.pop(record["id"], None)
+                elif record["op"] in ("reject", "retry") and record["id"] in self._pending:
+                    self._pending[record["id"]].rejection = record.get("reason")
+
+        # Rewrite the journal so new records are not appended to a torn line
+        if torn:
+            self._compact()
+
+
+    def _write(self, record: dict) -> None:
+        with open(self.journal_path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+
+    def _compact(self) -> None:
+        """Rewrite the journal with only the pending entries, swapping the file atomically"""
+        temp_path = self.journal_path.with_name(self.journal_path.name + ".tmp")
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            for entry in self._pending.values():
+                f.write(json.dumps({"op": "add", "entry": asdict(entry)}, ensure_ascii=False) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, self.journal_path)
\ No newline at end of file
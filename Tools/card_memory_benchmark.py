@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Memory and (de)serialization benchmark of the Card representation
+
+Compares the previous plain dataclass (per-instance __dict__, a list of stages
+and a separate copy of every stage and epic string per card) with the slotted,
+interned Card. Cards are built from parsed JSON, as they are when loaded from
+Jira or from the card cache, so repeated strings are distinct objects.
+
+Usage: python -m Tools.card_memory_benchmark [cards]
+"""
+
+import gc
+import json
+import sys
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass, field
+
+from Domain.Models.Card import Card
+
+
+@dataclass
+class LegacyCard:
+    """Card as it was before slots and interning"""
+    id: str
+    name: str
+    epick: str
+    estimated_duration: int
+    time_spent: int
+    current_stage: str
+    possible_next_stages: list[str]
+    transition_ids: dict[str, str] = field(default_factory=dict)
+
+
+STAGES = ["To do", "In progress", "Code review", "Testing", "Done"]
+
+
+def build_payload(count: int) -> str:
+    """JSON of count cards spread over a few epics and the usual workflow stages"""
+    cards = []
+    for i in range(count):
+        cards.append({
+            "id": f"BENCH-{i}",
+            "name": f"Benchmark issue number {i} with a realistic summary",
+            "epick": f"Epic {i % 20}",
+            "estimated_duration": 3600,
+            "time_spent": i * 60,
+            "current_stage": STAGES[i % 4],
+            "possible_next_stages": STAGES,
+            "transition_ids": {stage: str(11 + n) for n, stage in enumerate(STAGES)},
+        })
+    return json.dumps(cards)
+
+
+def retained_bytes(payload: str, build) -> int:
+    """Bytes still allocated once the cards were built and the parsed JSON dropped"""
+    gc.collect()
+    tracemalloc.start()
+    cards = build(json.loads(payload))
+    gc.collect()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del cards
+    return size
+
+
+def measure_ms(action) -> float:
+    start = time.perf_counter()
+    action()
+    return (time.perf_counter() - start) * 1000
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    payload = build_payload(count)
+
+    legacy_bytes = retained_bytes(payload, lambda rows: [LegacyCard(**row) for row in rows])
+    compact_bytes = retained_bytes(payload, lambda rows: [Card(**row) for row in rows])
+
+    legacy_cards = [LegacyCard(**row) for row in json.loads(payload)]
+    cards = [Card(**row) for row in json.loads(payload)]
+
+    # Previous cache format: a dict per card through asdict, read back with keyword arguments
+    legacy_dump_ms = measure_ms(lambda: json.dumps([asdict(card) for card in legacy_cards]))
+    legacy_text = json.dumps([asdict(card) for card in legacy_cards])
+    legacy_load_ms = measure_ms(lambda: [LegacyCard(**row) for row in json.loads(legacy_text)])
+
+    dump_ms = measure_ms(lambda: json.dumps([card.to_row() for card in cards]))
+    text = json.dumps([card.to_row() for card in cards])
+    load_ms = measure_ms(lambda: [Card.from_row(row) for row in json.loads(text)])
+    assert [Card.from_row(row) for row in json.loads(text)] == cards
+
+    print(f"{count} cards")
+    print(f"Per card, plain dataclass:        {legacy_bytes / count:8.0f} bytes")
+    print(f"Per card, slotted and interned:   {compact_bytes / count:8.0f} bytes")
+    print(f"Serialize, asdict / to_row:       {legacy_dump_ms:8.1f} ms / {dump_ms:.1f} ms")
+    print(f"Deserialize, kwargs / from_row:   {legacy_load_ms:8.1f} ms / {load_ms:.1f} ms")
+    print(f"Cache size, dicts / rows:         {len(legacy_text):8d} bytes / {len(text)} bytes")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,335 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for the Jira REST API, serving a generated board
+
+Implements the endpoints JiraIntegration uses: serverInfo, field, myself, search
+(startAt pages, or search/jql token pages when emulating Jira Cloud), issue,
+transitions and worklog. Only the JQL clauses the integration sends are
+understood (key in / issue in, updated >= -Nm, statusCategory != Done); every
+other clause matches all issues. An issue in clause naming a missing issue fails
+with a 400, unless validateQuery=false is sent to the startAt search (Jira Cloud
+has no such switch).
+
+Usage: python -m Tools.fake_jira_server [--issues N] [--latency SECONDS] [--cloud] [--port PORT]
+"""
+
+import argparse
+import json
+import re
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Optional
+from urllib.parse import parse_qs, urlsplit
+
+API_PREFIX = "/rest/api/2/"
+
+# Workflow of every generated issue: (status, status category key, transition id)
+WORKFLOW = [
+    ("To Do", "new", "11"),
+    ("In Progress", "indeterminate", "21"),
+    ("Code Review", "indeterminate", "31"),
+    ("Done", "done", "41"),
+]
+
+
+class FakeJiraServer:
+    """Jira REST stand-in running on a background thread
+
+    Counts requests and body bytes in both directions, as seen by the client, see stats() and reset_stats().
+    Each request is delayed by latency seconds before being answered, throttle_next() answers 429s.
+    """
+
+    def __init__(self, issue_count: int = 100, latency: float = 0.0, cloud: bool = False,
+                 expand_transitions: bool = True, host: str = "127.0.0.1", port: int = 0):
+        self.latency = latency
+        self.cloud = cloud
+        self.expand_transitions = expand_transitions
+        self.issues: dict[str, dict[str, Any]] = {}
+        self.worklogs: list[dict[str, Any]] = []
+        self._lock = threading.Lock()
+        self._requests = 0
+        self._bytes_sent = 0
+        self._bytes_received = 0
+        self._throttled: list[float] = []
+
+        for i in range(issue_count):
+            self.add_issue(i)
+
+        self._httpd = ThreadingHTTPServer((host, port), _make_handler(self))
+        self._httpd.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "FakeJiraServer":
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def throttle_next(self, count: int = 1, retry_after: float = 1.0) -> None:
+        """Answer the next count requests with 429 Too Many Requests and the given Retry-After"""
+        with self._lock:
+            self._throttled.extend([retry_after] * count)
+
+    def _take_throttle(self) -> Optional[float]:
+        with self._lock:
+            return self._throttled.pop(0) if self._throttled else None
+
+    def __enter__(self) -> "FakeJiraServer":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {"requests": self._requests, "bytes_sent": self._bytes_received, "bytes_received": self._bytes_sent}
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self._requests = self._bytes_sent = self._bytes_received = 0
+
+    def add_issue(self, number: int) -> dict[str, Any]:
+        key = f"BENCH-{number + 1}"
+        status = WORKFLOW[number % (len(WORKFLOW) - 1)]
+        issue = {
+            "id": str(10000 + number),
+            "key": key,
+            "updated": time.time(),
+            "fields": {
+                "summary": f"Benchmark issue {number + 1} with a summary of realistic length",
+                "status": self._status_json(status),
+                "parent": {"key": f"EPIC-{number % 25}", "fields": {"summary": f"Epic {number % 25}"}},
+                "aggregatetimeoriginalestimate": 8 * 3600,
+                "aggregateprogress": {"progress": number * 60, "total": 8 * 3600},
+            },
+        }
+        with self._lock:
+            self.issues[key] = issue
+        return issue
+
+    # Request handling, called from the server threads
+
+    def _record(self, received: int, sent: int) -> None:
+        with self._lock:
+            self._requests += 1
+            self._bytes_received += received
+            self._bytes_sent += sent
+
+    def handle(self, method: str, path: str, query: dict[str, list[str]], body: Optional[dict]) -> tuple[int, Any]:
+        if not path.startswith(API_PREFIX):
+            return 404, {"errorMessages": [f"Unknown path {path}"]}
+        route = path[len(API_PREFIX):].strip("/")
+        fields = _list_param(query, "fields")
+        expand = _list_param(query, "expand")
+
+        if method == "GET" and route == "serverInfo":
+            return 200, {"baseUrl": self.url, "version": "9.12.0", "versionNumbers": [9, 12, 0],
+                         "deploymentType": "Cloud" if self.cloud else "Server",
+                         "buildNumber": 912000, "serverTitle": "Fake Jira"}
+        if method == "GET" and route == "field":
+            return 200, [{"id": name, "key": name, "name": name.capitalize(), "custom": False, "clauseNames": [name]}
+                         for name in ("summary", "status", "parent", "aggregatetimeoriginalestimate", "aggregateprogress")]
+        if method == "GET" and route == "myself":
+            return 200, {"accountId": "bench", "name": "bench", "emailAddress": "bench@example.com",
+                         "displayName": "Benchmark User", "active": True}
+        if method == "GET" and route == "search" and not self.cloud:
+            return self._search(query, fields, expand)
+        if method == "GET" and route == "search/jql" and self.cloud:
+            return self._search_token(query, fields, expand)
+
+        match = re.fullmatch(r"issue/([^/]+)(/transitions|/worklog)?", route)
+        if match is None:
+            return 404, {"errorMessages": [f"Unknown resource {route}"]}
+        with self._lock:
+            issue = self.issues.get(match.group(1))
+        if issue is None:
+            return 404, {"errorMessages": ["Issue does not exist or you do not have permission to see it."]}
+
+        if match.group(2) is None and method == "GET":
+            return 200, self._issue_json(issue, fields, expand)
+        if match.group(2) == "/transitions" and method == "GET":
+            return 200, {"expand": "transitions", "transitions": self._transitions_json()}
+        if match.group(2) == "/transitions" and method == "POST":
+            return self._transition(issue, body or {})
+        if match.group(2) == "/worklog" and method == "POST":
+            return self._add_worklog(issue, body or {})
+        return 405, {"errorMessages": [f"{method} not allowed on {route}"]}
+
+    def _search(self, query, fields, expand) -> tuple[int, Any]:
+        matches = self._matching_issues(query.get("jql", [""])[0], query.get("validateQuery", ["true"])[0].lower() != "false")
+        if matches is None:
+            return 400, {"errorMessages": ["An issue in the query does not exist"]}
+        start_at = int(query.get("startAt", ["0"])[0])
+        max_results = min(int(query.get("maxResults", ["50"])[0]), 100)
+        page = matches[start_at:start_at + max_results]
+        return 200, {"startAt": start_at, "maxResults": max_results, "total": len(matches),
+                     "issues": [self._issue_json(issue, fields, expand) for issue in page]}
+
+    def _search_token(self, query, fields, expand) -> tuple[int, Any]:
+        # Like Jira Cloud, keys are validated whatever validateQuery says
+        matches = self._matching_issues(query.get("jql", [""])[0], validate=True)
+        if matches is None:
+            return 400, {"errorMessages": ["An issue in the query does not exist"]}
+        start_at = int(query.get("nextPageToken", ["0"])[0])
+        max_results = min(int(query.get("maxResults", ["50"])[0]), 100)
+        page = matches[start_at:start_at + max_results]
+        result: dict[str, Any] = {"issues": [self._issue_json(issue, fields, expand) for issue in page],
+                                  "isLast": start_at + max_results >= len(matches)}
+        if not result["isLast"]:
+            result["nextPageToken"] = str(start_at + max_results)
+        return 200, result
+
+    def _matching_issues(self, jql: str, validate: bool) -> Optional[list[dict[str, Any]]]:
+        with self._lock:
+            issues = list(self.issues.values())
+
+        keys = re.search(r"(?:key|issue) in \(([^)]*)\)", jql)
+        if keys:
+            # Issue keys or ids
+            wanted = {key.strip() for key in keys.group(1).split(",") if key.strip()}
+            known = {issue["key"] for issue in issues} | {issue["id"] for issue in issues}
+            if validate and not wanted <= known:
+                return None
+            issues = [issue for issue in issues if issue["key"] in wanted or issue["id"] in wanted]
+
+        updated = re.search(r"updated >= -(\d+)m", jql)
+        if updated:
+            since = time.time() - int(updated.group(1)) * 60
+            issues = [issue for issue in issues if issue["updated"] >= since]
+
+        if "statusCategory != Done" in jql:
+            issues = [issue for issue in issues if issue["fields"]["status"]["statusCategory"]["key"] != "done"]
+        return issues
+
+    def _issue_json(self, issue, fields: list[str], expand: list[str]) -> dict[str, Any]:
+        wanted = set(fields) if fields and "*all" not in fields else set(issue["fields"])
+        result: dict[str, Any] = {
+            "id": issue["id"],
+            "key": issue["key"],
+            "self": f"{self.url}{API_PREFIX}issue/{issue['id']}",
+            "fields": {name: value for name, value in issue["fields"].items() if name in wanted},
+        }
+        if self.expand_transitions and "transitions" in expand:
+            result["transitions"] = self._transitions_json()
+        return result
+
+    def _transitions_json(self) -> list[dict[str, Any]]:
+        return [{"id": transition_id, "name": f"Move to {status}", "to": self._status_json((status, category, transition_id))}
+                for status, category, transition_id in WORKFLOW]
+
+    def _transition(self, issue, body) -> tuple[int, Any]:
+        transition_id = str(body.get("transition", {}).get("id"))
+        for status in WORKFLOW:
+            if status[2] == transition_id:
+                with self._lock:
+                    issue["fields"]["status"] = self._status_json(status)
+                    issue["updated"] = time.time()
+                return 204, None
+        return 400, {"errorMessages": [f"Transition id '{transition_id}' is not valid for this issue."]}
+
+    def _add_worklog(self, issue, body) -> tuple[int, Any]:
+        seconds = int(body.get("timeSpentSeconds", 0))
+        with self._lock:
+            issue["fields"]["aggregateprogress"]["progress"] += seconds
+            issue["updated"] = time.time()
+            worklog = {"id": str(len(self.worklogs) + 1), "issueId": issue["id"], "timeSpentSeconds": seconds,
+                       "started": body.get("started"), "self": f"{self.url}{API_PREFIX}issue/{issue['id']}/worklog"}
+            self.worklogs.append(worklog)
+        return 201, worklog
+
+    @staticmethod
+    def _status_json(status: tuple[str, str, str]) -> dict[str, Any]:
+        name, category, _ = status
+        return {"name": name, "statusCategory": {"key": category, "name": category.capitalize()}}
+
+
+def _list_param(query: dict[str, list[str]], name: str) -> list[str]:
+    """Values of a parameter sent repeated or comma separated"""
+    return [item for value in query.get(name, []) for item in value.split(",") if item]
+
+
+def _make_handler(server: FakeJiraServer):
+    class FakeJiraHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        # Headers and body are written separately, Nagle + delayed ACKs would add ~40 ms per request
+        disable_nagle_algorithm = True
+
+        def do_GET(self):
+            self._dispatch("GET")
+
+        def do_POST(self):
+            self._dispatch("POST")
+
+        def do_PUT(self):
+            self._dispatch("PUT")
+
+        def _dispatch(self, method: str):
+            length = int(self.headers.get("Content-Length") or 0)
+            raw_body = self.rfile.read(length) if length else b""
+            url = urlsplit(self.path)
+
+            if server.latency:
+                time.sleep(server.latency)
+
+            retry_after = server._take_throttle()
+            headers = {}
+            if retry_after is not None:
+                status, payload = 429, {"errorMessages": ["Rate limit exceeded."]}
+                headers["Retry-After"] = f"{retry_after:g}"
+            else:
+                try:
+                    body = json.loads(raw_body) if raw_body else None
+                    status, payload = server.handle(method, url.path, parse_qs(url.query), body)
+                except Exception as e:
+                    status, payload = 500, {"errorMessages": [str(e)]}
+
+            data = json.dumps(payload).encode("utf-8") if payload is not None else b""
+            server._record(len(raw_body), len(data))
+
+            self.send_response(status)
+            for name, value in headers.items():
+                self.send_header(name, value)
+            self.send_header("Content-Type", "application/json;charset=UTF-8")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, format, *args):
+            # One line per request would dominate the benchmark output
+            pass
+
+    return FakeJiraHandler
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve a generated Jira board locally")
+    parser.add_argument("--issues", type=int, default=100)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds added to every request")
+    parser.add_argument("--cloud", action="store_true", help="emulate Jira Cloud token paginated search")
+    parser.add_argument("--no-expand", action="store_true", help="ignore expand=transitions like some servers do")
+    parser.add_argument("--port", type=int, default=8089)
+    args = parser.parse_args()
+
+    server = FakeJiraServer(args.issues, args.latency, args.cloud, not args.no_expand, port=args.port)
+    print(f"Serving {args.issues} issues on {server.url}, Ctrl+C to stop")
+    try:
+        server._httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server._httpd.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
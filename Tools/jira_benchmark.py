@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Benchmark of JiraIntegration against the local fake Jira server
+
+Measures get_cards, refresh_card, refresh_cards (one of the keys deleted on the
+server), change_card_stage and add_timespent_to_card on boards of several sizes.
+Every operation reports wall time (median of the repetitions), requests sent,
+body bytes in both directions and peak Python memory. Results are printed as
+JSON, so runs can be saved and compared.
+
+Usage: python -m Tools.jira_benchmark [--sizes 10,100,1000,5000] [--latency SECONDS]
+                                      [--repeat N] [--cloud] [--no-expand] [--output FILE]
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from dataclasses import replace
+from importlib.metadata import version
+
+from Domain.Models.Card import Card
+from Infraestructure.JiraClientRegistry import JiraClientRegistry
+from Infraestructure.JiraIntegration import JiraIntegration
+from Infraestructure.RequestScheduler import RequestScheduler
+from Tools.fake_jira_server import FakeJiraServer
+
+
+def measure(server: FakeJiraServer, operation, repeat: int) -> dict:
+    """Run operation repeat times for the timing and once more under tracemalloc for the peak memory"""
+    wall_times = []
+    stats = {}
+    for _ in range(repeat):
+        server.reset_stats()
+        start = time.perf_counter()
+        operation()
+        wall_times.append((time.perf_counter() - start) * 1000)
+        stats = server.stats()
+
+    # Tracing slows allocations down, so memory is measured on a separate run
+    tracemalloc.start()
+    operation()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "wall_ms": round(statistics.median(wall_times), 3),
+        "requests": stats["requests"],
+        "bytes_sent": stats["bytes_sent"],
+        "bytes_received": stats["bytes_received"],
+        "peak_memory_bytes": peak,
+    }
+
+
+def next_stage(card: Card) -> str:
+    """A stage the card can move to that keeps it on the board"""
+    for stage in card.possible_next_stages:
+        if stage != card.current_stage and stage != "Done":
+            return stage
+    return card.possible_next_stages[0]
+
+
+def benchmark_size(issue_count: int, args) -> list[dict]:
+    results = []
+    with FakeJiraServer(issue_count, args.latency, args.cloud, not args.no_expand) as server:
+        # A registry per size, so no connection or client is reused across boards. Its
+        # scheduler is unthrottled, the fake server announces no rate limit
+        registry = JiraClientRegistry(RequestScheduler(rate=None))
+        integration = JiraIntegration(server.url, "bench@example.com", "token", client_registry=registry)
+        cards = integration.get_cards()
+        card = cards[0]
+
+        def get_cards():
+            integration.get_cards()
+
+        def refresh_card():
+            integration.refresh_card(card)
+
+        # BENCH-0 never existed, like a card deleted on the server since the last load
+        deleted = replace(card, id="BENCH-0")
+
+        def refresh_cards():
+            integration.refresh_cards([card, deleted])
+
+        def change_card_stage():
+            integration.change_card_stage(card, next_stage(card))
+
+        def add_timespent_to_card():
+            integration.add_timespent_to_card(replace(card, time_spent=60))
+
+        for name, operation in (("get_cards", get_cards),
+                                ("refresh_card", refresh_card),
+                                ("refresh_cards", refresh_cards),
+                                ("change_card_stage", change_card_stage),
+                                ("add_timespent_to_card", add_timespent_to_card)):
+            result = {"operation": name, "issues": issue_count, "cards": len(cards)}
+            result.update(measure(server, operation, args.repeat))
+            results.append(result)
+            print(f"{name:<24} {issue_count:>6} issues {result['wall_ms']:>10.1f} ms {result['requests']:>5} requests",
+                  file=sys.stderr)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark JiraIntegration against a local fake Jira server")
+    parser.add_argument("--sizes", default="10,100,1000,5000", help="comma separated issue counts")
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds added to every request")
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs per operation")
+    parser.add_argument("--cloud", action="store_true", help="emulate Jira Cloud token paginated search")
+    parser.add_argument("--no-expand", action="store_true", help="server ignores expand=transitions")
+    parser.add_argument("--output", help="write the JSON report to this file instead of stdout")
+    args = parser.parse_args()
+
+    report = {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "python": platform.python_version(),
+            "jira": version("jira"),
+            "latency_s": args.latency,
+            "repeat": args.repeat,
+            "cloud": args.cloud,
+            "expand_transitions": not args.no_expand,
+        },
+        "results": [],
+    }
+    for size in (int(size) for size in args.sizes.split(",")):
+        report["results"].extend(benchmark_size(size, args))
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
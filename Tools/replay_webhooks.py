@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Post recorded Jira webhook payloads to the local webhook listener
+
+Each file holds one payload, or a list of payloads, as Jira sent them. Without
+files the samples in Tools/webhook_payloads are posted, in name order. With
+--secret the X-Hub-Signature header Jira computes is added, so a listener
+configured with a webhook_secret accepts them.
+
+Usage: python -m Tools.replay_webhooks [--url URL] [--board NAME] [--secret SECRET] [--delay SECONDS] [FILE ...]
+"""
+
+import argparse
+import hashlib
+import hmac
+import json
+import sys
+import time
+import urllib.error
+import urllib.request
+from pathlib import Path
+
+SAMPLES_DIR = Path(__file__).with_name("webhook_payloads")
+
+
+def load_payloads(paths: list[Path]) -> list[dict]:
+    payloads = []
+    for path in paths:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        payloads.extend(data if isinstance(data, list) else [data])
+    return payloads
+
+
+def post(url: str, payload: dict, secret: str = "") -> int:
+    """POST a payload like Jira does, returns the status code of the answer"""
+    body = json.dumps(payload).encode("utf-8")
+    headers = {"Content-Type": "application/json", "User-Agent": "Atlassian Webhook HTTP Client"}
+    if secret:
+        headers["X-Hub-Signature"] = "sha256=" + hmac.new(secret.encode("utf-8"), body, hashlib.sha256).hexdigest()
+
+    request = urllib.request.Request(url, data=body, headers=headers, method="POST")
+    try:
+        with urllib.request.urlopen(request, timeout=10) as response:
+            return response.status
+    except urllib.error.HTTPError as e:
+        return e.code
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Post recorded Jira webhook payloads to the local listener")
+    parser.add_argument("files", nargs="*", type=Path, help=f"payload files, the samples of {SAMPLES_DIR.name} by default")
+    parser.add_argument("--url", default="http://127.0.0.1:8765/webhook")
+    parser.add_argument("--board", default="", help="connection name the payloads come from, for another Jira site")
+    parser.add_argument("--secret", default="", help="sign the payloads with the webhook secret")
+    parser.add_argument("--delay", type=float, default=0.0, help="seconds between payloads")
+    args = parser.parse_args()
+
+    paths = args.files or sorted(SAMPLES_DIR.glob("*.json"))
+    url = f"{args.url.rstrip('/')}/{args.board}" if args.board else args.url
+
+    failed = 0
+    for i, payload in enumerate(load_payloads(paths)):
+        if i and args.delay:
+            time.sleep(args.delay)
+        try:
+            status = post(url, payload, args.secret)
+        except urllib.error.URLError as e:
+            print(f"Could not reach {url}: {e.reason}", file=sys.stderr)
+            return 1
+        print(f"{payload.get('webhookEvent', '?'):<22} {status}")
+        failed += status >= 300
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
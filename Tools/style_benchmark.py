@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark of the cost of a timer state change on FloatingWidget styling
+
+Compares re-applying the whole stylesheet on every change (the previous behaviour)
+with the cached stylesheet plus dynamic property re-polish of the play button.
+
+Usage: python -m Tools.style_benchmark [iterations]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtWidgets import QApplication
+
+from modern_zilean import FloatingWidget
+from Domain.Models.Card import Card
+from Ui.StyleSheets import build_stylesheet
+
+
+def measure(action, iterations: int) -> float:
+    """Average milliseconds per call of action, including the events it posted"""
+    app = QApplication.instance()
+    start = time.perf_counter()
+    for i in range(iterations):
+        action(i)
+        app.processEvents()
+    return (time.perf_counter() - start) * 1000 / iterations
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    app = QApplication(sys.argv)
+    
+    # Keep config.json and the other local files away from the working directory
+    os.chdir(tempfile.mkdtemp(prefix="zilean-bench-"))
+    widget = FloatingWidget()
+    widget.show()
+    widget.card_model.set_cards([Card("BENCH-1", "Benchmark card", "Epic", 0, 0, "To do", ())])
+    
+    def legacy_state_change(i):
+        # Previous behaviour: toggle the state and rebuild + re-apply the full stylesheet
+        widget.current_card = widget.card_store.at(0) if i % 2 else None
+        widget.play_btn.setEnabled(bool(i % 2))
+        widget.setStyleSheet(build_stylesheet.__wrapped__(widget.config.primary_color, widget.is_collapsed))
+    
+    def state_change(i):
+        widget.current_card = widget.card_store.at(0) if i % 2 else None
+        widget.update_play_button_state()
+    
+    legacy_ms = measure(legacy_state_change, iterations)
+    cached_ms = measure(state_change, iterations)
+    
+    print(f"Full stylesheet per state change:   {legacy_ms:.3f} ms")
+    print(f"Property + targeted re-polish:      {cached_ms:.3f} ms")
+    print(f"Speedup:                            {legacy_ms / cached_ms:.1f}x")
+    
+    widget.worklog_flusher.stop()
+    widget.worklog_flusher.wait()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+Headless load harness of FloatingWidget on an in-memory board
+
+Runs the widget offscreen on top of InMemoryBoardIntegration and drives load,
+reload (with and without a failing board, and repeated clicks), select,
+start/stop and collapse cycles. For every action it reports how long the GUI
+thread was blocked: the synchronous call itself, and the longest event loop
+stall until the background work the action started was applied. Results are
+printed as JSON.
+
+Usage: python -m Tools.widget_harness [--cards N] [--latency SECONDS] [--iterations N] [--output FILE]
+"""
+
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtCore import QEventLoop, QTimer
+from PySide6.QtWidgets import QApplication, QMessageBox
+
+from modern_zilean import AppConfig, ConfigManager, FloatingWidget
+from Infraestructure.InMemoryBoardIntegration import InMemoryBoardIntegration
+
+
+class StallMonitor:
+    """Measures the longest gap between event loop passes, i.e. how long the GUI thread was busy"""
+    INTERVAL_MS = 1
+
+    def __init__(self):
+        self.longest = 0.0
+        self._last = time.perf_counter()
+        self._timer = QTimer()
+        self._timer.setInterval(self.INTERVAL_MS)
+        self._timer.timeout.connect(self._on_timeout)
+        self._timer.start()
+
+    def reset(self):
+        self.longest = 0.0
+        self._last = time.perf_counter()
+
+    def _on_timeout(self):
+        now = time.perf_counter()
+        self.longest = max(self.longest, now - self._last)
+        self._last = now
+
+
+class Harness:
+    def __init__(self, card_count: int, latency: float):
+        self.app = QApplication.instance() or QApplication(sys.argv)
+        self.monitor = StallMonitor()
+        self.samples: dict[str, list[dict]] = {}
+        self.board = InMemoryBoardIntegration.large_board(card_count, latency=latency)
+
+        # Message boxes would block the harness waiting for a click
+        QMessageBox.information = staticmethod(lambda *args, **kwargs: QMessageBox.Ok)
+        QMessageBox.warning = staticmethod(lambda *args, **kwargs: QMessageBox.Ok)
+
+        # Keep config.json and the other local files away from the working directory
+        os.chdir(tempfile.mkdtemp(prefix="zilean-harness-"))
+        ConfigManager().save(AppConfig(jira_server="memory://harness", email="harness@example.com", token="token"))
+
+        self.widget = self.measure("construct", lambda: FloatingWidget(integration_factory=lambda config: self.board))
+        self.widget.show()
+        # The widget loads the board on its own once the event loop runs
+        self.measure("initial_load", lambda: None, self.cards_jobs_done)
+
+    def cards_jobs_done(self) -> bool:
+        return self.widget.job_executor.is_idle()
+
+    def outbox_empty(self) -> bool:
+        return not self.widget.worklog_outbox.pending()
+
+    def measure(self, action: str, call, done=None, timeout: float = 60.0):
+        """Run call on the GUI thread, then the event loop until done() holds, recording both"""
+        self.app.processEvents()
+        self.monitor.reset()
+        start = time.perf_counter()
+        result = call()
+        call_ms = (time.perf_counter() - start) * 1000
+
+        deadline = time.perf_counter() + timeout
+        while done is not None and not done():
+            if time.perf_counter() > deadline:
+                raise TimeoutError(f"{action} did not complete in {timeout} seconds")
+            self.app.processEvents(QEventLoop.AllEvents, 5)
+        # Signals posted right before the worker finished are delivered here
+        self.app.processEvents()
+
+        self.samples.setdefault(action, []).append({
+            "call_ms": call_ms,
+            "max_stall_ms": max(self.monitor.longest * 1000, call_ms),
+            "completion_ms": (time.perf_counter() - start) * 1000,
+        })
+        return result
+
+    def run(self, iterations: int):
+        widget = self.widget
+        for _ in range(iterations):
+            self.measure("load", widget.load_cards, self.cards_jobs_done)
+
+            # Some issues change on the board between reloads
+            for card in random.sample(self.board.get_cards(), max(1, len(widget.card_store) // 20)):
+                card.time_spent += 60
+                self.board.put_card(card)
+            self.measure("reload", widget.reload_cards, self.cards_jobs_done)
+
+            # Repeated clicks share the reload already in flight
+            self.measure("reload_burst", lambda: [widget.reload_cards() for _ in range(5)], self.cards_jobs_done)
+            
+            self.board.fail_next("search")
+            self.measure("reload_failure", widget.reload_cards, self.cards_jobs_done)
+
+            for row in random.sample(range(len(widget.card_store)), min(10, len(widget.card_store))):
+                self.measure("select", lambda: widget.card_combo.setCurrentIndex(row))
+
+            def start_stop():
+                widget.start_timer()
+                # Pretend two minutes went by, less than a minute is not logged
+                widget.start_time -= 120
+                widget.stop_timer()
+            self.measure("start_stop", start_stop, self.outbox_empty)
+
+            self.measure("collapse", widget.toggle_collapse)
+            self.measure("expand", widget.toggle_collapse)
+
+    def report(self) -> list[dict]:
+        results = []
+        for action, samples in self.samples.items():
+            results.append({
+                "action": action,
+                "samples": len(samples),
+                **{f"{metric}_{name}": round(function(sample[metric] for sample in samples), 3)
+                   for metric in ("call_ms", "max_stall_ms", "completion_ms")
+                   for name, function in (("median", lambda values: statistics.median(list(values))), ("max", max))},
+            })
+        return results
+
+    def close(self):
+        self.widget.worklog_flusher.stop()
+        self.widget.worklog_flusher.wait()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure GUI thread latency of FloatingWidget on an in-memory board")
+    parser.add_argument("--cards", type=int, default=1000)
+    parser.add_argument("--latency", type=float, default=0.05, help="seconds added to every board call")
+    parser.add_argument("--iterations", type=int, default=5)
+    parser.add_argument("--output", help="write the JSON report to this file instead of stdout")
+    args = parser.parse_args()
+    output = os.path.abspath(args.output) if args.output else None
+
+    harness = Harness(args.cards, args.latency)
+    try:
+        harness.run(args.iterations)
+    finally:
+        harness.close()
+
+    results = harness.report()
+    for result in results:
+        print(f"{result['action']:<16} call {result['call_ms_median']:>8.2f} ms  "
+              f"stall {result['max_stall_ms_median']:>8.2f} ms (max {result['max_stall_ms_max']:.2f})  "
+              f"done in {result['completion_ms_median']:>8.1f} ms", file=sys.stderr)
+
+    text = json.dumps({"meta": {"cards": args.cards, "latency_s": args.latency, "iterations": args.iterations},
+                       "results": results}, indent=2)
+    if output:
+        with open(output, 'w', encoding='utf-8') as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
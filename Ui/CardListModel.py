@@ -0,0 +1,133 @@
+from typing import List, Optional
+
+from PySide6.QtCore import QAbstractListModel, QModelIndex, QSortFilterProxyModel, Qt
+
+from Business.CardStore import CardStore
+from Domain.Models.Card import Card
+from Domain.Models.CardDelta import CardDelta
+
+
+# Role returning the Card object of a row
+CardRole = Qt.UserRole + 1
+
+
+def format_card(card: Card) -> str:
+    """Combo box text of a card, showing up to 60 characters of the issue title"""
+    if len(card.name) > 60:
+        return f"{card.id}: {card.name[:60]}..."
+    return f"{card.id}: {card.name}"
+
+
+class CardListModel(QAbstractListModel):
+    """List model over a CardStore
+
+    Updates go through set_cards, append_cards and apply_delta, which notify views
+    of the affected rows only.
+    """
+
+    def __init__(self, store: Optional[CardStore] = None, parent=None):
+        super().__init__(parent)
+        self.store: CardStore = store if store is not None else CardStore()
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.store)
+
+    def data(self, index, role=Qt.DisplayRole):
+        card = self.store.at(index.row()) if index.isValid() else None
+        if card is None:
+            return None
+
+        if role in (Qt.DisplayRole, Qt.EditRole):
+            return format_card(card)
+        if role == Qt.ToolTipRole:
+            return f"{card.id}: {card.name}\n{card.epick}"
+        if role == CardRole:
+            return card
+        return None
+
+    def card_at(self, row: int) -> Optional[Card]:
+        return self.store.at(row)
+
+    def row_of(self, card_id: Optional[str]) -> int:
+        """Row of the card with the given id, -1 when it isn't in the model"""
+        return self.store.row_of(card_id)
+
+    def set_cards(self, cards: List[Card]):
+        """Replace every card"""
+        self.beginResetModel()
+        self.store.replace(cards)
+        self.endResetModel()
+
+    def append_cards(self, cards: List[Card]):
+        """Add cards at the bottom, updating in place the ones already shown"""
+        added: List[Card] = []
+        for card in cards:
+            row = self.store.row_of(card.id)
+            if row < 0:
+                added.append(card)
+            else:
+                self.store.upsert(card)
+                index = self.index(row)
+                self.dataChanged.emit(index, index)
+
+        if not added:
+            return
+        first = len(self.store)
+        self.beginInsertRows(QModelIndex(), first, first + len(added) - 1)
+        self.store.extend(added)
+        self.endInsertRows()
+
+    def apply_delta(self, delta: CardDelta):
+        """Merge a delta by key: removed rows are dropped, changed rows are updated in place and new cards appended"""
+        # Removed cards, from the bottom so the rows above keep their numbers
+        for row in sorted((self.store.row_of(card_id) for card_id in delta.removed_ids if card_id in self.store), reverse=True):
+            self.beginRemoveRows(QModelIndex(), row, row)
+            self.store.remove(self.store.at(row).id)
+            self.endRemoveRows()
+
+        # Changed and added cards
+        self.append_cards(delta.changed)
+
+
+class CardFilterProxyModel(QSortFilterProxyModel):
+    """Fuzzy type-ahead filter over issue key, summary and epic
+
+    Every word typed must appear in that order, not necessarily contiguous, in
+    "<key> <summary> <epic>", ignoring case: "ab12 login" matches "AB-12: Fix login page".
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._terms: List[str] = []
+        self._haystacks: dict[str, tuple[Card, str]] = {}
+
+    def set_filter_text(self, text: str):
+        terms = text.lower().split()
+        if terms == self._terms:
+            return
+        self._terms = terms
+        self.invalidateFilter()
+
+    def filterAcceptsRow(self, source_row: int, source_parent: QModelIndex) -> bool:
+        if not self._terms:
+            return True
+
+        card = self.sourceModel().card_at(source_row)
+        if card is None:
+            return False
+
+        haystack = self._haystack(card)
+        for term in self._terms:
+            # Subsequence match: each character must be found after the previous one
+            characters = iter(haystack)
+            if not all(character in characters for character in term):
+                return False
+        return True
+
+    def _haystack(self, card: Card) -> str:
+        """Lowercased searchable text of a card, cached until the card object is replaced"""
+        cached = self._haystacks.get(card.id)
+        if cached is None or cached[0] is not card:
+            cached = (card, f"{card.id} {card.name} {card.epick}".lower())
+            self._haystacks[card.id] = cached
+        return cached[1]
@@ -0,0 +1,112 @@
+from PySide6.QtCore import QTimer
+from PySide6.QtWidgets import (
+    QCheckBox, QDialog, QFileDialog, QHBoxLayout, QHeaderView, QLabel,
+    QMessageBox, QPushButton, QTableWidget, QTableWidgetItem, QVBoxLayout
+)
+
+from Infraestructure.MetricsRegistry import MetricsRegistry
+
+
+class DiagnosticsDialog(QDialog):
+    """Live view of the metrics registry: board calls, HTTP requests and UI handlers"""
+
+    COLUMNS = ("Operation", "Calls", "Errors", "Requests", "Sent", "Received", "Avg ms", "p50 ms", "p95 ms", "Max ms")
+
+    def __init__(self, registry: MetricsRegistry, parent=None):
+        super().__init__(parent)
+        self.registry = registry
+        self.setup_ui()
+
+        # Refreshed while open, the registry is cheap to snapshot
+        self.refresh_timer = QTimer(self)
+        self.refresh_timer.setInterval(1000)
+        self.refresh_timer.timeout.connect(self.refresh)
+        self.refresh_timer.start()
+        self.refresh()
+
+    def setup_ui(self):
+        self.setWindowTitle("Zilean Diagnostics")
+        self.resize(820, 360)
+
+        layout = QVBoxLayout()
+
+        self.enabled_check = QCheckBox("Record metrics")
+        self.enabled_check.setChecked(self.registry.enabled)
+        self.enabled_check.toggled.connect(self.set_enabled)
+        layout.addWidget(self.enabled_check)
+
+        self.table = QTableWidget(0, len(self.COLUMNS))
+        self.table.setHorizontalHeaderLabels(self.COLUMNS)
+        self.table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
+        self.table.verticalHeader().setVisible(False)
+        self.table.setEditTriggers(QTableWidget.NoEditTriggers)
+        layout.addWidget(self.table)
+
+        self.last_error_label = QLabel()
+        self.last_error_label.setWordWrap(True)
+        layout.addWidget(self.last_error_label)
+
+        # Buttons
+        button_layout = QHBoxLayout()
+        reset_btn = QPushButton("Reset")
+        export_btn = QPushButton("Export JSON...")
+        close_btn = QPushButton("Close")
+
+        reset_btn.clicked.connect(self.reset)
+        export_btn.clicked.connect(self.export)
+        close_btn.clicked.connect(self.accept)
+
+        button_layout.addWidget(reset_btn)
+        button_layout.addWidget(export_btn)
+        button_layout.addStretch()
+        button_layout.addWidget(close_btn)
+
+        layout.addLayout(button_layout)
+        self.setLayout(layout)
+
+    def set_enabled(self, enabled: bool):
+        self.registry.enabled = enabled
+        self.refresh()
+
+    def refresh(self):
+        operations = self.registry.snapshot()["operations"]
+        self.table.setRowCount(len(operations))
+
+        last_errors = []
+        for row, (name, metrics) in enumerate(operations.items()):
+            latency = metrics["latency"]
+            values = (name, metrics["calls"], metrics["errors"], metrics["requests"],
+                      format_bytes(metrics["bytes_sent"]), format_bytes(metrics["bytes_received"]),
+                      f"{latency['avg_ms']:.1f}", f"{latency['p50_ms']:.0f}", f"{latency['p95_ms']:.0f}",
+                      f"{latency['max_ms']:.1f}")
+            for column, value in enumerate(values):
+                self.table.setItem(row, column, QTableWidgetItem(str(value)))
+            if metrics["last_error"]:
+                last_errors.append(f"{name}: {metrics['last_error']}")
+
+        if not self.registry.enabled:
+            self.last_error_label.setText("Metrics are not being recorded.")
+        else:
+            self.last_error_label.setText("\n".join(last_errors[-3:]) if last_errors else "No errors recorded.")
+
+    def reset(self):
+        self.registry.reset()
+        self.refresh()
+
+    def export(self):
+        path, _ = QFileDialog.getSaveFileName(self, "Export Metrics", "zilean_metrics.json", "JSON files (*.json)")
+        if not path:
+            return
+
+        try:
+            self.registry.export(path)
+        except OSError as e:
+            QMessageBox.warning(self, "Export Error", f"Failed to export metrics: {e}")
+
+
+def format_bytes(count: int) -> str:
+    for unit in ("B", "KB", "MB"):
+        if count < 1024:
+            return f"{count:.0f} {unit}"
+        count /= 1024
+    return f"{count:.1f} GB"
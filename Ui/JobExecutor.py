@@ -0,0 +1,148 @@
+import itertools
+import queue
+import threading
+from typing import Any, Callable, Optional
+
+from PySide6.QtCore import QObject, Signal
+
+
+class JobCancelled(Exception):
+    """Raised inside a job by check_cancelled() once the job was cancelled"""
+
+
+class Job(QObject):
+    """A unit of background work, its signals are always emitted on the GUI thread
+
+    Nothing is emitted once the job is cancelled, not even values it produced before.
+    """
+    progress = Signal(object)
+    succeeded = Signal(object)
+    failed = Signal(str)
+    finished = Signal()  # After succeeded or failed, and when cancelled
+
+    def __init__(self, key: str, sequence: int, parent=None):
+        super().__init__(parent)
+        self.key = key
+        self.sequence = sequence
+        self.cancelled = False
+        self.done = False
+        self._executor: Optional["JobExecutor"] = None
+
+    def report(self, value: Any):
+        """Hand an intermediate value (e.g. a page of cards) to the GUI thread, called from the job"""
+        self.check_cancelled()
+        self._executor._post.emit(self, "progress", value)
+
+    def check_cancelled(self):
+        """Stop the job early, called from the job between steps"""
+        if self.cancelled:
+            raise JobCancelled(self.key)
+
+
+class JobExecutor(QObject):
+    """Runs jobs on a bounded pool of daemon threads, one job in flight per key
+
+    Submitting a key that is already running returns the running job (single-flight)
+    unless replace is set, in which case the running job is cancelled and its results
+    dropped. Progress and results reach the GUI thread in the order they were produced,
+    and a job never delivers after a newer job with the same key. The threads are
+    daemons, so a request still in flight doesn't keep the app from exiting.
+    """
+    _post = Signal(object, str, object)  # job, kind, value
+
+    def __init__(self, max_workers: int = 2, parent=None):
+        super().__init__(parent)
+        self._max_workers = max_workers
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._workers: list[threading.Thread] = []
+        self._shut_down = False
+        self._jobs: dict[str, Job] = {}
+        self._sequence = itertools.count(1)
+        self._delivered: dict[str, int] = {}  # Newest sequence delivered per key
+        # Queued to the GUI thread, which this object lives in
+        self._post.connect(self._deliver)
+
+    def submit(self, key: str, function: Callable[[Job], Any], replace: bool = False) -> Job:
+        """Run function(job) in the background, or return the job already running for key"""
+        if self._shut_down:
+            raise RuntimeError("Cannot submit jobs after shutdown")
+        running = self._jobs.get(key)
+        if running is not None and not replace:
+            return running
+
+        job = Job(key, next(self._sequence), self)
+        job._executor = self
+        self._jobs[key] = job
+        if running is not None:
+            # Finished once the new job is registered, so handlers of finished see the key still busy
+            running.cancelled = True
+            self._finish(running)
+        self._queue.put((job, function))
+        if len(self._workers) < self._max_workers:
+            worker = threading.Thread(target=self._work, name=f"zilean-job-{len(self._workers)}", daemon=True)
+            self._workers.append(worker)
+            worker.start()
+        return job
+
+    def running(self, key: str) -> Optional[Job]:
+        return self._jobs.get(key)
+
+    def is_idle(self) -> bool:
+        return not self._jobs
+
+    def cancel(self, key: str):
+        """Cancel the job running for key, it stops at its next check and delivers nothing more"""
+        job = self._jobs.pop(key, None)
+        if job is not None:
+            job.cancelled = True
+            self._finish(job)
+
+    def shutdown(self):
+        """Cancel every job and stop taking new ones, without waiting for the running ones"""
+        self._shut_down = True
+        for key in list(self._jobs):
+            self.cancel(key)
+        for _ in self._workers:
+            self._queue.put(None)
+
+    def _work(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            self._run(*item)
+
+    def _run(self, job: Job, function: Callable[[Job], Any]):
+        if job.cancelled:
+            return
+        try:
+            result = function(job)
+        except JobCancelled:
+            return
+        except Exception as e:
+            self._post.emit(job, "failed", str(e))
+            return
+        self._post.emit(job, "succeeded", result)
+
+    def _deliver(self, job: Job, kind: str, value: Any):
+        # Values queued before the job was cancelled or superseded are dropped here
+        if job.cancelled or job.done or job.sequence < self._delivered.get(job.key, 0):
+            return
+        self._delivered[job.key] = job.sequence
+
+        if kind == "progress":
+            job.progress.emit(value)
+            return
+
+        if self._jobs.get(job.key) is job:
+            del self._jobs[job.key]
+        if kind == "succeeded":
+            job.succeeded.emit(value)
+        else:
+            job.failed.emit(value)
+        self._finish(job)
+
+    def _finish(self, job: Job):
+        job.done = True
+        job.finished.emit()
+        job.deleteLater()
@@ -0,0 +1,139 @@
+from functools import lru_cache
+
+
+@lru_cache(maxsize=None)
+def build_stylesheet(primary_color: str, collapsed: bool) -> str:
+    """Widget stylesheet for a primary color and collapse state, built once per combination
+    
+    Control buttons are styled through their "state" dynamic property, so timer state
+    changes only re-polish the affected button instead of re-applying this stylesheet.
+    """
+    if collapsed:
+        style = f"""
+        QWidget {{
+            background-color: rgba(25, 25, 25, 200);
+            border-radius: 15px;
+            color: white;
+            font-family: 'Segoe UI', Arial, sans-serif;
+        }}
+        
+        QLabel#timer {{
+            font-size: 15px;
+            font-weight: bold;
+            color: {primary_color};
+            padding: 3px 6px;
+        }}
+        
+        QPushButton#iconButton {{
+            background-color: rgba(255, 255, 255, 0.1);
+            border-radius: 12px;
+            padding: 1px;
+            font-size: 10px;
+        }}
+        
+        QPushButton#iconButton:hover {{
+            background-color: rgba(255, 255, 255, 0.2);
+        }}
+        """
+    else:
+        # Convert hex color to RGB for alpha variations
+        hex_color = primary_color.lstrip('#')
+        r, g, b = tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
+        
+        style = f"""
+        QWidget {{
+            background-color: rgba(35, 35, 35, 240);
+            border-radius: 12px;
+            color: white;
+            font-family: 'Segoe UI', Arial, sans-serif;
+        }}
+        
+        QLabel#timer {{
+            font-size: 16px;
+            font-weight: bold;
+            color: {primary_color};
+            padding: 4px;
+        }}
+        
+        QLabel#cardInfo {{
+            font-size: 11px;
+            color: #cccccc;
+            padding: 2px;
+        }}
+        
+        QPushButton {{
+            border: none;
+            border-radius: 6px;
+            padding: 6px 10px;
+            font-size: 12px;
+        }}
+        
+        QPushButton#iconButton {{
+            background-color: rgba(255, 255, 255, 0.1);
+            border-radius: 12px;
+            padding: 2px;
+        }}
+        
+        QPushButton#iconButton:hover {{
+            background-color: rgba(255, 255, 255, 0.2);
+        }}
+        
+        QPushButton#controlButton {{
+            background-color: rgba({r}, {g}, {b}, 0.8);
+            min-width: 24px;
+            min-height: 24px;
+        }}
+        
+        QPushButton#controlButton:hover {{
+            background-color: rgba({r}, {g}, {b}, 1.0);
+        }}
+        
+        QPushButton#controlButton:pressed {{
+            background-color: rgba({max(0, r-20)}, {max(0, g-20)}, {max(0, b-20)}, 1.0);
+        }}
+        
+        QPushButton#controlButton[state="disabled"] {{
+            background-color: rgba(128, 128, 128, 0.5);
+            min-width: 24px;
+            min-height: 24px;
+            color: rgba(255, 255, 255, 0.5);
+        }}
+        
+        QPushButton#controlButton[state="disabled"]:hover {{
+            background-color: rgba(128, 128, 128, 0.5);
+        }}
+        
+        
+        QComboBox {{
+            background-color: rgba(255, 255, 255, 0.1);
+            border: 1px solid rgba(255, 255, 255, 0.2);
+            border-radius: 6px;
+            padding: 4px 8px;
+            min-width: 250px;
+        }}
+        
+        QComboBox:hover {{
+            background-color: rgba(255, 255, 255, 0.15);
+        }}
+        
+        QComboBox::drop-down {{
+            border: none;
+            width: 20px;
+        }}
+        
+        QComboBox::down-arrow {{
+            image: none;
+            border: none;
+        }}
+        
+        QComboBox QAbstractItemView {{
+            background-color: rgba(45, 45, 45, 250);
+            border: 1px solid rgba(255, 255, 255, 0.2);
+            border-radius: 6px;
+            selection-background-color: rgba({r}, {g}, {b}, 0.8);
+            color: white;
+            padding: 4px;
+        }}
+        """
+    
+    return style
\ No newline at end of file
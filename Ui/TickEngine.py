@@ -0,0 +1,50 @@
+import time
+from typing import Optional
+
+from PySide6.QtCore import QObject, QTimer, Qt, Signal
+
+
+class TickEngine(QObject):
+    """Emits the whole seconds elapsed by a running timer, right after each second boundary
+    
+    Time is measured with time.monotonic(), so wall clock changes (NTP, sleep/resume) don't
+    make the display jump, and nothing is scheduled while the timer is stopped or paused.
+    """
+    tick = Signal(int)
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.origin: Optional[float] = None
+        
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setTimerType(Qt.PreciseTimer)
+        self._timer.timeout.connect(self._on_timeout)
+    
+    def start(self, origin: float):
+        """Start ticking, counting elapsed time from origin (a time.monotonic() value)"""
+        self.origin = origin
+        self._on_timeout()
+    
+    def stop(self):
+        """Stop ticking completely until the next start"""
+        self._timer.stop()
+        self.origin = None
+    
+    def is_active(self) -> bool:
+        return self.origin is not None
+    
+    def elapsed(self) -> float:
+        """Seconds elapsed since the origin, 0 when stopped"""
+        if self.origin is None:
+            return 0.0
+        return time.monotonic() - self.origin
+    
+    def _on_timeout(self):
+        elapsed = self.elapsed()
+        self.tick.emit(int(elapsed))
+        
+        # Schedule the next tick just after the next second boundary of the elapsed time,
+        # recomputed on every tick so timer latency never accumulates into drift
+        delay_ms = int((1.0 - elapsed % 1.0) * 1000) + 1
+        self._timer.start(delay_ms)
\ No newline at end of file
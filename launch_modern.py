@@ -2,22 +2,23 @@
 """
 Launcher script for Modern Zilean
 Handles startup, error checking, and environment setup
+
+Usage: python launch_modern.py [--profile-startup]
 """
 
 import sys
 import os
+from importlib.util import find_spec
 from pathlib import Path
 
 def check_requirements():
-    """Check if required packages are installed"""
-    try:
-        import PySide6
-        from jira import JIRA
-        return True
-    except ImportError as e:
-        print(f"Missing required package: {e}")
+    """Check if required packages are installed, without importing them"""
+    missing = [package for package in ("PySide6", "jira") if find_spec(package) is None]
+    if missing:
+        print(f"Missing required package: {', '.join(missing)}")
         print("Please install requirements: pip install -r requirements_modern.txt")
         return False
+    return True
 
 def setup_environment():
     """Setup environment and paths"""
@@ -28,20 +29,26 @@ def setup_environment():
 
 def main():
     """Main launcher function"""
+    # Started first, so the breakdown covers every import of the application
+    setup_environment()
+    from startup_profiler import profiler_from_args
+    profiler = profiler_from_args(sys.argv)
+    
     print("🕐 Starting Modern Zilean...")
     
     # Check requirements
     if not check_requirements():
         input("Press Enter to exit...")
         return 1
-    
-    # Setup environment
-    setup_environment()
+    if profiler:
+        profiler.mark("check requirements")
     
     try:
         # Import and run the modern application
         from modern_zilean import main as run_app
-        run_app()
+        if profiler:
+            profiler.mark("import modern_zilean")
+        run_app(profiler)
     except Exception as e:
         print(f"Error starting application: {e}")
         import traceback
@@ -4,18 +4,23 @@ Modern Zilean - Floating Jira Time Tracker Widget
 A sleek, always-on-top time tracking widget for Jira integration
 """
 
+import os
 import sys
 import json
 import time
+import random
+import threading
+from datetime import datetime
+from functools import partial
 from pathlib import Path
-from typing import Optional, List
-from dataclasses import dataclass
+from typing import TYPE_CHECKING, Callable, Optional, List
+from dataclasses import dataclass, field
 
 from PySide6.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QHBoxLayout, 
     QLabel, QPushButton, QComboBox, QSystemTrayIcon, 
     QMenu, QDialog, QFormLayout, QLineEdit, QMessageBox,
-    QGraphicsDropShadowEffect
+    QGraphicsDropShadowEffect, QSizePolicy, QSpacerItem, QCompleter
 )
 from PySide6.QtCore import (
     Qt, QTimer, QPropertyAnimation, QEasingCurve, 
@@ -25,8 +30,38 @@ from PySide6.QtGui import QFont, QIcon, QPixmap, QPainter, QColor
 
 # Import existing domain models
 from Domain.Models.Card import Card
+from Domain.Models.CardDelta import CardDelta
+from Domain.Models.WorklogEntry import WorklogEntry
 from Domain.Interfaces.IBoardIntegration import IBoardIntegration
-from Infraestructure.JiraIntegration import JiraIntegration
+from Infraestructure.CardQuery import CardQuery
+from Infraestructure.CardCache import CardCache
+from Infraestructure.JiraClientRegistry import jira_client_registry
+from Infraestructure.WorklogOutbox import WorklogOutbox
+from Infraestructure.TimerJournal import TimerJournal
+from Domain.Models.WebhookEvent import WebhookEvent
+from Infraestructure.MetricsRegistry import metrics_registry
+from Infraestructure.InstrumentedBoardIntegration import InstrumentedBoardIntegration
+from Ui.StyleSheets import build_stylesheet
+from Ui.TickEngine import TickEngine
+from Business.CardStore import CardStore
+from Ui.CardListModel import CardListModel, CardFilterProxyModel
+from Ui.DiagnosticsDialog import DiagnosticsDialog
+from Ui.JobExecutor import Job, JobExecutor
+from startup_profiler import StartupProfiler, profiler_from_args
+
+# The listener pulls in http.server and friends, it is only imported when webhooks are enabled
+if TYPE_CHECKING:
+    from Infraestructure.WebhookListener import WebhookListener
+
+
+@dataclass
+class BoardConnection:
+    """Another Jira site whose cards are listed next to the ones of the main site"""
+    name: str  # Prefix of the card ids of this site, e.g. "acme" for "acme:ABC-1"
+    jira_server: str
+    email: str
+    token: str
+    extra_jql: str = ""
 
 
 @dataclass
@@ -39,33 +74,165 @@ class AppConfig:
     always_on_top: bool = True
     collapsed: bool = False
     primary_color: str = "#8A2BE2"  # Default purple color
+    extra_jql: str = ""  # Appended to the card query, e.g. "project = ABC"
+    http_pool_size: int = 10  # Keep-alive connections shared by the Jira client
+    http_timeout: float = 20.0  # Seconds before a Jira request is abandoned
+    metrics_enabled: bool = False  # Record call metrics, shown by the tray Diagnostics panel
+    http_rate_limit: float = 0.0  # Most Jira requests per second, 0 for no cap. Jira's own limit is always followed
+    extra_connections: list = field(default_factory=list)  # Other Jira sites, BoardConnection fields
+    webhook_enabled: bool = False  # Apply the changes Jira pushes to a local listener, see WebhookListener
+    webhook_port: int = 8765
+    webhook_secret: str = ""  # Secret of the Jira webhook, required in its signature when set
+
+
+def board_connections(config: AppConfig) -> List[BoardConnection]:
+    """The valid extra connections of the configuration, invalid ones are reported and skipped"""
+    connections: List[BoardConnection] = []
+    for data in config.extra_connections:
+        try:
+            connection = BoardConnection(**data)
+        except TypeError as e:
+            print(f"Ignoring Jira connection {data.get('name')!r}: {e}")
+            continue
+        if not connection.name or ":" in connection.name or connection.name in {c.name for c in connections}:
+            print(f"Ignoring Jira connection {connection.name!r}: its name must be unique, non empty and without ':'")
+            continue
+        connections.append(connection)
+    return connections
+
+
+def create_jira_integration(config: AppConfig) -> IBoardIntegration:
+    """Build the Jira integration described by the configuration
+    
+    With extra connections the cards of every site are fetched in parallel and
+    listed together, see AggregateBoardIntegration.
+    """
+    # The jira stack is only imported by the first network operation, after the widget painted
+    from Infraestructure.JiraIntegration import JiraIntegration
+    
+    jira_client_registry.configure_rate_limit(config.http_rate_limit or None)
+    main_integration = partial(
+        JiraIntegration,
+        config.jira_server,
+        config.email,
+        config.token,
+        CardQuery(extra_jql=config.extra_jql),
+        pool_size=config.http_pool_size,
+        timeout=config.http_timeout
+    )
+    connections = board_connections(config)
+    if not connections:
+        return main_integration()
+    
+    from Infraestructure.AggregateBoardIntegration import AggregateBoardIntegration
+    
+    # Each site connects on its own fetch thread, so one unreachable site doesn't hold up the others
+    boards: dict[str, Callable[[], IBoardIntegration]] = {"": main_integration}
+    for connection in connections:
+        boards[connection.name] = partial(
+            JiraIntegration,
+            connection.jira_server,
+            connection.email,
+            connection.token,
+            CardQuery(extra_jql=connection.extra_jql),
+            pool_size=config.http_pool_size,
+            timeout=config.http_timeout
+        )
+    return AggregateBoardIntegration(boards)
+
+
+# Builds the board integration used by the widget and its workers, create_jira_integration by default
+IntegrationFactory = Callable[[AppConfig], IBoardIntegration]
+
+
+def instrumented(factory: IntegrationFactory) -> IntegrationFactory:
+    """Wrap the integrations built by factory so their calls are recorded while metrics are enabled"""
+    def create_integration(config: AppConfig) -> IBoardIntegration:
+        integration = factory(config)
+        if metrics_registry.enabled:
+            return InstrumentedBoardIntegration(integration, metrics_registry)
+        return integration
+    return create_integration
 
 
 class ConfigManager:
-    """Handles configuration persistence"""
+    """Handles configuration persistence
+    
+    save() writes right away, schedule_save() writes behind: changes made less than
+    save_delay seconds apart are written once, on a background thread. The file is
+    swapped atomically and only rewritten when its content changes.
+    """
+    SAVE_DELAY = 1.0
     
-    def __init__(self, config_path: str = "config.json"):
+    def __init__(self, config_path: str = "config.json", save_delay: Optional[float] = None):
         self.config_path = Path(config_path)
         self.config = AppConfig()
+        self.save_delay = self.SAVE_DELAY if save_delay is None else save_delay
+        self._written: Optional[str] = None  # Content of the file as last read or written
+        self._written_version = 0
+        self._version = 0
+        self._pending: Optional[tuple[int, dict]] = None
+        self._due = 0.0
+        self._condition = threading.Condition()
+        self._write_lock = threading.Lock()
+        self._writer: Optional[threading.Thread] = None
     
     def load(self) -> AppConfig:
         """Load configuration from file"""
         if self.config_path.exists():
             try:
                 with open(self.config_path, 'r') as f:
-                    data = json.load(f)
-                    self.config = AppConfig(**data)
+                    text = f.read()
+                self.config = AppConfig(**json.loads(text))
+                self._written = text
             except Exception as e:
                 print(f"Error loading config: {e}")
         return self.config
     
     def save(self, config: AppConfig):
-        """Save configuration to file"""
-        try:
-            with open(self.config_path, 'w') as f:
-                json.dump(config.__dict__, f, indent=2)
-        except Exception as e:
-            print(f"Error saving config: {e}")
+        """Save configuration to file right away, replacing any scheduled save"""
+        with self._condition:
+            self._pending = None
+            self._version += 1
+            version = self._version
+        self._write(version, dict(config.__dict__))
+    
+    def schedule_save(self, config: AppConfig):
+        """Save configuration in the background once it stops changing for save_delay seconds"""
+        with self._condition:
+            self._version += 1
+            self._pending = (self._version, dict(config.__dict__))
+            self._due = time.monotonic() + self.save_delay
+            if self._writer is None:
+                self._writer = threading.Thread(target=self._run_writer, name="zilean-config", daemon=True)
+                self._writer.start()
+            self._condition.notify()
+    
+    def _run_writer(self):
+        while True:
+            with self._condition:
+                while self._pending is None or time.monotonic() < self._due:
+                    self._condition.wait(None if self._pending is None else self._due - time.monotonic())
+                pending, self._pending = self._pending, None
+            self._write(*pending)
+    
+    def _write(self, version: int, data: dict):
+        text = json.dumps(data, indent=2)
+        with self._write_lock:
+            # A newer save may have been written while this one waited
+            if version < self._written_version or text == self._written:
+                return
+            temp_path = self.config_path.with_name(self.config_path.name + ".tmp")
+            try:
+                with open(temp_path, 'w') as f:
+                    f.write(text)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(temp_path, self.config_path)
+                self._written = text
+                self._written_version = version
+            except Exception as e:
+                print(f"Error saving config: {e}")
 
 
 class SettingsDialog(QDialog):
@@ -149,52 +316,205 @@ class SettingsDialog(QDialog):
         self.accept()
 
 
-class JiraWorker(QThread):
-    """Background worker for Jira operations"""
-    cards_loaded = Signal(list)
-    error_occurred = Signal(str)
+class CardLoadJob:
+    """Background job loading every card, page by page"""
+    
+    def __init__(self, config: AppConfig, card_cache: Optional[CardCache] = None,
+                 integration_factory: IntegrationFactory = create_jira_integration):
+        self.config = config
+        self.card_cache = card_cache
+        self.integration_factory = integration_factory
+        self.synced_at: float = time.time()
+        self.board_errors: dict[str, str] = {}  # Boards the cards could not be loaded from, by name
+    
+    def __call__(self, job: Job) -> List[Card]:
+        jira_integration = self.integration_factory(self.config)
+        cards: List[Card] = []
+        for page in jira_integration.iter_cards():
+            cards.extend(page)
+            job.report(page)
+        self.board_errors = dict(jira_integration.last_load_errors)
+        print(f"Loaded {len(cards)} cards with {jira_integration.last_load_request_count} Jira requests")
+        
+        # Keep the card cache up to date without blocking the GUI thread.
+        # A load missing some boards would drop their cards from it
+        job.check_cancelled()
+        if self.card_cache and not self.board_errors:
+            self.card_cache.save(self.config.jira_server, self.config.email, cards, self.synced_at)
+        return cards
+
+
+class CardSyncJob:
+    """Background job fetching only what changed since the last sync"""
     
-    def __init__(self, config: AppConfig):
+    def __init__(self, config: AppConfig, cards: List[Card], since: float, card_cache: Optional[CardCache] = None,
+                 integration_factory: IntegrationFactory = create_jira_integration):
+        self.config = config
+        self.integration_factory = integration_factory
+        self.card_store = CardStore(cards)
+        self.since = since
+        self.card_cache = card_cache
+        self.board_errors: dict[str, str] = {}  # Boards that could not be synced, by name
+    
+    def __call__(self, job: Job) -> CardDelta:
+        jira_integration = self.integration_factory(self.config)
+        delta: CardDelta = jira_integration.sync_cards(self.card_store.ids(), self.since)
+        self.board_errors = dict(jira_integration.last_load_errors)
+        print(f"Synced {len(delta.changed)} changed and {len(delta.removed_ids)} removed cards "
+              f"with {jira_integration.last_load_request_count} Jira requests")
+        
+        job.check_cancelled()
+        if self.card_cache:
+            self.card_store.apply(delta)
+            self.card_cache.save(self.config.jira_server, self.config.email, self.card_store.as_list(), delta.synced_at)
+        return delta
+
+
+class IssueSyncJob:
+    """Background job fetching only the given issues, e.g. the ones Jira pushed changes of"""
+    
+    def __init__(self, config: AppConfig, cards: List[Card], issues: set[str], synced_at: float,
+                 card_cache: Optional[CardCache] = None, integration_factory: IntegrationFactory = create_jira_integration):
+        self.config = config
+        self.integration_factory = integration_factory
+        self.card_store = CardStore(cards)
+        self.issues = issues
+        self.synced_at = synced_at  # Of the last full or delta sync, which this job doesn't replace
+        self.card_cache = card_cache
+        self.board_errors: dict[str, str] = {}  # Boards that could not be synced, by name
+    
+    def __call__(self, job: Job) -> CardDelta:
+        jira_integration = self.integration_factory(self.config)
+        delta: CardDelta = jira_integration.sync_issues(self.issues)
+        self.board_errors = dict(jira_integration.last_load_errors)
+        print(f"Synced {len(delta.changed)} changed and {len(delta.removed_ids)} removed of {len(self.issues)} pushed issues "
+              f"with {jira_integration.last_load_request_count} Jira requests")
+        
+        job.check_cancelled()
+        if self.card_cache:
+            self.card_store.apply(delta)
+            self.card_cache.save(self.config.jira_server, self.config.email, self.card_store.as_list(), self.synced_at)
+        return delta
+
+
+class WorklogFlusher(QThread):
+    """Background worker sending the worklog outbox to Jira, retrying failed entries with backoff"""
+    entry_flushed = Signal(object)
+    entry_failed = Signal(object, str, float)  # entry, error, seconds until the next attempt
+    entry_rejected = Signal(object, str)  # entry, reason: refused for good, it waits for the user
+    
+    INITIAL_BACKOFF = 5.0
+    MAX_BACKOFF = 300.0
+    # Jira answers that sending the same worklog again won't change: the issue is gone, the worklog is
+    # invalid or not allowed. A 401 is retried, the credentials may be fixed in the settings meanwhile
+    PERMANENT_STATUSES = {400, 403, 404, 405, 410, 413, 422}
+    
+    def __init__(self, config: AppConfig, outbox: WorklogOutbox,
+                 integration_factory: IntegrationFactory = create_jira_integration):
         super().__init__()
         self.config = config
-        self.jira_integration: Optional[IBoardIntegration] = None
+        self.outbox = outbox
+        self.integration_factory = integration_factory
+        self.wake_event = threading.Event()
+        self.stopping = False
+        self.next_attempt: dict[str, float] = {}
+    
+    def wake(self):
+        """Flush right away, e.g. after a new entry or a settings change"""
+        self.wake_event.set()
+    
+    def stop(self):
+        self.stopping = True
+        self.wake_event.set()
     
     def run(self):
-        try:
-            self.jira_integration = JiraIntegration(
-                self.config.jira_server,
-                self.config.email,
-                self.config.token
-            )
-            cards = self.jira_integration.get_cards()
-            self.cards_loaded.emit(cards)
-        except Exception as e:
-            self.error_occurred.emit(str(e))
+        while not self.stopping:
+            self.wake_event.clear()
+            retry_in = self.flush_pending()
+            self.wake_event.wait(retry_in)
+    
+    def flush_pending(self) -> Optional[float]:
+        """Send every entry that is due, returns the seconds until the next retry (None when nothing waits)"""
+        if not all([self.config.jira_server, self.config.email, self.config.token]):
+            return None
+        
+        jira_integration: Optional[IBoardIntegration] = None
+        retry_in: Optional[float] = None
+        
+        for entry in self.outbox.pending():
+            if self.stopping:
+                break
+            
+            wait = self.next_attempt.get(entry.id, 0) - time.monotonic()
+            if wait > 0:
+                retry_in = wait if retry_in is None else min(retry_in, wait)
+                continue
+            
+            try:
+                if jira_integration is None:
+                    jira_integration = self.integration_factory(self.config)
+                card = Card(id=entry.card_id, name=entry.card_name, epick="", estimated_duration=0,
+                            time_spent=entry.seconds, current_stage="", possible_next_stages=())
+                if not jira_integration.add_timespent_to_card(card, datetime.fromtimestamp(entry.started).astimezone()):
+                    raise RuntimeError("Jira rejected the worklog")
+                
+                self.outbox.mark_done(entry)
+                self.next_attempt.pop(entry.id, None)
+                self.entry_flushed.emit(entry)
+            except Exception as e:
+                status = getattr(e, "status_code", None)
+                if status in self.PERMANENT_STATUSES:
+                    reason = f"HTTP {status}: {getattr(e, 'text', None) or e}"
+                    self.outbox.mark_rejected(entry, reason)
+                    self.next_attempt.pop(entry.id, None)
+                    self.entry_rejected.emit(entry, reason)
+                    continue
+                
+                entry.attempts += 1
+                backoff = min(self.MAX_BACKOFF, self.INITIAL_BACKOFF * 2 ** (entry.attempts - 1))
+                backoff *= random.uniform(0.8, 1.2)
+                self.next_attempt[entry.id] = time.monotonic() + backoff
+                retry_in = backoff if retry_in is None else min(retry_in, backoff)
+                self.entry_failed.emit(entry, str(e), backoff)
+        
+        return retry_in
 
 
 class FloatingWidget(QWidget):
     """Main floating widget for time tracking"""
+    webhook_received = Signal(object)  # WebhookEvent, emitted from the listener thread
     
-    def __init__(self):
+    def __init__(self, integration_factory: IntegrationFactory = create_jira_integration):
         super().__init__()
         
+        # Board backend, replaceable e.g. by an in-memory board in the load harness
+        self.integration_factory = instrumented(integration_factory)
+        
         # Configuration
         self.config_manager = ConfigManager()
         self.config = self.config_manager.load()
+        metrics_registry.enabled = self.config.metrics_enabled
+        self.card_cache = CardCache(self.config_manager.config_path.with_name("cards_cache.json"))
+        self.worklog_outbox = WorklogOutbox(self.config_manager.config_path.with_name("worklog_outbox.jsonl"))
+        self.timer_journal = TimerJournal(self.config_manager.config_path.with_name("timer_journal.jsonl"))
         
         # State
-        self.cards: List[Card] = []
+        self.card_store = CardStore()
         self.current_card: Optional[Card] = None
         self.is_collapsed = self.config.collapsed
         self.is_running = False
         self.is_paused = False
         self.elapsed_time = 0
-        self.start_time = 0
-        self.rebuilding_ui = False  # Flag to prevent card selection during UI rebuild
+        self.start_time = 0  # time.monotonic() value the running timer counts from
+        self.rebuilding_ui = False  # Flag to prevent card selection while the combo box is being edited
+        self.last_sync_timestamp: Optional[float] = None
         
-        # Jira integration
-        self.jira_integration: Optional[IBoardIntegration] = None
-        self.jira_worker: Optional[JiraWorker] = None
+        # Card loads and syncs, at most one in flight ("cards" key)
+        self.job_executor = JobExecutor(parent=self)
+        self.webhook_listener: Optional["WebhookListener"] = None
+        self.webhook_sync_pending = False
+        self.pushed_issues: set[str] = set()  # Card ids Jira pushed changes of, not synced yet
+        self.webhook_received.connect(self.on_webhook_event)
         
         # UI setup
         self.setup_ui()
@@ -202,9 +522,134 @@ class FloatingWidget(QWidget):
         self.setup_timers()
         self.setup_system_tray()
         
-        # Load cards if configured
+        # Worklogs are sent in the background, starting with the ones left pending by the last run
+        self.worklog_flusher = WorklogFlusher(self.config, self.worklog_outbox, self.integration_factory)
+        self.worklog_flusher.entry_flushed.connect(self.on_worklog_flushed)
+        self.worklog_flusher.entry_failed.connect(self.on_worklog_failed)
+        self.worklog_flusher.entry_rejected.connect(self.on_worklog_rejected)
+        
+        # Show the cached cards right away, Jira is only contacted once the event loop runs
         if self.is_configured():
-            self.load_cards()
+            self.show_cached_cards()
+        self.restore_timer_session()
+        QTimer.singleShot(0, self.start_background_work)
+    
+    def start_background_work(self):
+        """Send the pending worklogs and revalidate the cards against Jira in the background"""
+        self.worklog_flusher.start()
+        if self.is_configured():
+            # A full load would reset the card of a recovered timer session
+            self.load_cards(revalidate=bool(self.card_store) or self.is_running or self.is_paused)
+        if self.config.webhook_enabled:
+            self.start_webhook_listener()
+    
+    def start_webhook_listener(self):
+        """Listen for Jira webhooks, so cards change as soon as they do on Jira instead of on reload"""
+        from Infraestructure.WebhookListener import WebhookListener
+        
+        try:
+            self.webhook_listener = WebhookListener(self.webhook_received.emit, port=self.config.webhook_port,
+                                                    secret=self.config.webhook_secret).start()
+        except OSError as e:
+            print(f"Failed to listen for Jira webhooks on port {self.config.webhook_port}: {e}")
+            self.show_notification(f"Jira webhooks are off, port {self.config.webhook_port} is not available",
+                                   QSystemTrayIcon.Warning)
+            return
+        print(f"Listening for Jira webhooks on {self.webhook_listener.url}")
+    
+    def on_webhook_event(self, event: WebhookEvent):
+        """Apply a change pushed by Jira"""
+        from Infraestructure.AggregateBoardIntegration import AggregateBoardIntegration
+        
+        # Card ids of other sites are namespaced, like AggregateBoardIntegration does
+        card_id = f"{event.board}{AggregateBoardIntegration.SEPARATOR}{event.issue}" if event.board else event.issue
+        print(f"Jira webhook: {event.kind} {card_id}")
+        if event.kind == "issue_deleted":
+            # Nothing to fetch, the payload says it all
+            if card_id in self.card_store:
+                self.apply_cards_delta(CardDelta(removed_ids={card_id}))
+            return
+        
+        # Payloads lack what cards need (transitions, worklogs by issue id), only the issue is fetched
+        self.pushed_issues.add(card_id)
+        self.sync_pushed_changes()
+    
+    def sync_pushed_changes(self):
+        """Fetch the issues Jira pushed changes of, after the cards job in flight if any, without messages"""
+        if not self.is_configured() or not self.last_sync_timestamp or not self.pushed_issues:
+            return
+        
+        running = self.job_executor.running("cards")
+        if running is not None:
+            # Bursts of webhooks end up in a single sync
+            if not self.webhook_sync_pending:
+                self.webhook_sync_pending = True
+                running.finished.connect(self.run_pending_webhook_sync)
+            return
+        
+        issues, self.pushed_issues = self.pushed_issues, set()
+        sync = IssueSyncJob(self.config, self.card_store.as_list(), issues, self.last_sync_timestamp,
+                            self.card_cache, self.integration_factory)
+        job = self.job_executor.submit("cards", sync)
+        job.succeeded.connect(lambda delta: self.on_cards_pushed(delta, sync.board_errors))
+        job.failed.connect(self.on_push_sync_error)
+    
+    def run_pending_webhook_sync(self):
+        self.webhook_sync_pending = False
+        self.sync_pushed_changes()
+    
+    def on_cards_pushed(self, delta: CardDelta, board_errors: dict):
+        """Merge the pushed issues, quietly. The last sync time stays, the other cards were not synced"""
+        self.apply_cards_delta(delta)
+        for name, error in board_errors.items():
+            print(f"Failed to sync the changes pushed by Jira for {name or 'the main site'}: {error}")
+    
+    def on_push_sync_error(self, error: str):
+        """Fall back to a delta sync of every card when the pushed issues could not be fetched"""
+        print(f"Failed to sync the changes pushed by Jira: {error}")
+        if self.job_executor.running("cards") is not None:
+            return
+        sync = CardSyncJob(self.config, self.card_store.as_list(), self.last_sync_timestamp,
+                           self.card_cache, self.integration_factory)
+        job = self.job_executor.submit("cards", sync)
+        job.succeeded.connect(lambda delta: self.on_cards_fallback_synced(delta, sync.board_errors))
+        job.failed.connect(lambda error: print(f"Failed to sync the cards after a push: {error}"))
+    
+    def on_cards_fallback_synced(self, delta: CardDelta, board_errors: dict):
+        self.last_sync_timestamp = delta.synced_at
+        self.on_cards_pushed(delta, board_errors)
+        
+    def restore_timer_session(self):
+        """Bring back the timer session a crash or a quit left open"""
+        session = self.timer_journal.recover()
+        if session is None:
+            return
+        
+        row = self.card_model.row_of(session.card_id)
+        if row >= 0:
+            self.select_card_row(row)
+        else:
+            # Not cached, the card is only known by the journal until Jira answers
+            self.current_card = Card(id=session.card_id, name=session.card_name, epick="", estimated_duration=0,
+                                     time_spent=session.time_spent, current_stage="", possible_next_stages=())
+            self.update_card_display()
+        
+        self.elapsed_time = session.elapsed
+        if session.running:
+            self.is_running = True
+            self.start_time = time.monotonic() - session.elapsed
+            self.tick_engine.start(self.start_time)
+            self.journal_checkpoint_timer.start()
+            self.timer_journal.resume(session.elapsed)
+            message = f"Timer of {session.card_id} recovered and still running"
+        else:
+            self.is_paused = True
+            self.timer_journal.pause(session.elapsed)
+            message = f"Timer of {session.card_id} recovered, paused at {self.get_current_time_display()}"
+        
+        self.update_play_button_state()
+        self.update_display()
+        self.show_notification(message)
     
     def setup_ui(self):
         """Setup the user interface"""
@@ -222,14 +667,8 @@ class FloatingWidget(QWidget):
         shadow.setOffset(2, 2)
         self.setGraphicsEffect(shadow)
         
-        # Main layout - minimal padding for collapsed mode
+        # Main layout, margins depend on the collapse state
         self.main_layout = QVBoxLayout()
-        if self.is_collapsed:
-            self.main_layout.setContentsMargins(6, 4, 6, 4)
-            self.main_layout.setSpacing(2)
-        else:
-            self.main_layout.setContentsMargins(12, 8, 12, 8)
-            self.main_layout.setSpacing(6)
         
         # Header (always visible)
         self.setup_header()
@@ -239,12 +678,12 @@ class FloatingWidget(QWidget):
         
         self.setLayout(self.main_layout)
         
+        # Both states share the same widgets, only their visibility and sizes change
+        self.apply_collapse_state()
+        
         # Set initial size and position
         self.resize(450 if not self.is_collapsed else 180, 140 if not self.is_collapsed else 60)
         self.position_widget()
-        
-        # Update visibility
-        self.update_visibility()
     
     def position_widget(self):
         """Position widget in top-right corner or use saved position"""
@@ -255,59 +694,54 @@ class FloatingWidget(QWidget):
             y = 20  # 20px margin from top edge
             self.move(x, y)
             self.config.widget_position = (x, y)
-            self.config_manager.save(self.config)
+            self.config_manager.schedule_save(self.config)
         else:
             self.move(*self.config.widget_position)
     
     def setup_header(self):
         """Setup the header with timer and settings button"""
-        header_layout = QHBoxLayout()
-        header_layout.setContentsMargins(4, 4, 4, 4)
-        header_layout.setSpacing(4 if self.is_collapsed else 8)  # Minimal spacing when collapsed
+        self.header_layout = QHBoxLayout()
+        self.header_layout.setContentsMargins(4, 4, 4, 4)
         
         # Timer display - show current time if running
         current_time = self.get_current_time_display()
         self.timer_label = QLabel(current_time)
         self.timer_label.setObjectName("timer")
-        header_layout.addWidget(self.timer_label)
+        self.header_layout.addWidget(self.timer_label)
         
-        # Only add stretch when expanded, not when collapsed
-        if not self.is_collapsed:
-            header_layout.addStretch()
+        # Stretch between the timer and the buttons, collapsed to nothing when collapsed
+        self.header_spacer = QSpacerItem(0, 0, QSizePolicy.Expanding, QSizePolicy.Minimum)
+        self.header_layout.addItem(self.header_spacer)
         
-        # Settings button (only show when expanded)
+        # Settings button (only shown when expanded)
         self.settings_btn = QPushButton("⚙️")
         self.settings_btn.setObjectName("iconButton")
-        self.settings_btn.setFixedSize(20 if self.is_collapsed else 24, 20 if self.is_collapsed else 24)
+        self.settings_btn.setFixedSize(24, 24)
         self.settings_btn.clicked.connect(self.show_settings)
-        if not self.is_collapsed:  # Only show settings button when expanded
-            header_layout.addWidget(self.settings_btn)
-        
-        # Reload button (only show when expanded)
-        if not self.is_collapsed:
-            self.reload_btn = QPushButton("🔄")
-            self.reload_btn.setObjectName("iconButton")
-            self.reload_btn.setFixedSize(24, 24)
-            self.reload_btn.clicked.connect(self.reload_cards)
-            header_layout.addWidget(self.reload_btn)
-        
-        # Close button (only show when expanded)
-        if not self.is_collapsed:
-            self.close_btn = QPushButton("✕")
-            self.close_btn.setObjectName("iconButton")  # Use same style as other icon buttons
-            self.close_btn.setFixedSize(24, 24)
-            self.close_btn.clicked.connect(self.quit_app)
-            header_layout.addWidget(self.close_btn)
+        self.header_layout.addWidget(self.settings_btn)
+        
+        # Reload button (only shown when expanded)
+        self.reload_btn = QPushButton("🔄")
+        self.reload_btn.setObjectName("iconButton")
+        self.reload_btn.setFixedSize(24, 24)
+        self.reload_btn.clicked.connect(self.reload_cards)
+        self.header_layout.addWidget(self.reload_btn)
+        
+        # Close button (only shown when expanded)
+        self.close_btn = QPushButton("✕")
+        self.close_btn.setObjectName("iconButton")  # Use same style as other icon buttons
+        self.close_btn.setFixedSize(24, 24)
+        self.close_btn.clicked.connect(self.quit_app)
+        self.header_layout.addWidget(self.close_btn)
         
         # Toggle button
-        self.toggle_btn = QPushButton("+" if self.is_collapsed else "-")
+        self.toggle_btn = QPushButton()
         self.toggle_btn.setObjectName("iconButton")
-        self.toggle_btn.setFixedSize(28 if self.is_collapsed else 24, 28 if self.is_collapsed else 24)
         self.toggle_btn.clicked.connect(self.toggle_collapse)
-        header_layout.addWidget(self.toggle_btn)
+        self.header_layout.addWidget(self.toggle_btn)
         
         header_widget = QWidget()
-        header_widget.setLayout(header_layout)
+        header_widget.setLayout(self.header_layout)
         self.main_layout.addWidget(header_widget)
     
     def setup_content(self):
@@ -345,11 +779,32 @@ class FloatingWidget(QWidget):
         controls_layout.addStretch()
         
         # Card selector with better width for full issue titles
+        # The combo box is a view over the card model, typing filters it through a fuzzy proxy
+        self.card_model = CardListModel(self.card_store, self)
+        self.card_filter = CardFilterProxyModel(self)
+        self.card_filter.setSourceModel(self.card_model)
+        
         self.card_combo = QComboBox()
         self.card_combo.setObjectName("cardSelector")
         self.card_combo.setMinimumWidth(250)  # Much wider to show full titles
-        self.card_combo.setSizeAdjustPolicy(QComboBox.AdjustToContents)
-        self.card_combo.currentTextChanged.connect(self.on_card_selected)
+        # Sized for the longest possible entry (key + 60 characters of title) instead of measuring every item
+        self.card_combo.setSizeAdjustPolicy(QComboBox.AdjustToMinimumContentsLengthWithIcon)
+        self.card_combo.setMinimumContentsLength(72)
+        self.card_combo.setModel(self.card_model)
+        self.card_combo.setEditable(True)
+        self.card_combo.setInsertPolicy(QComboBox.NoInsert)
+        
+        card_completer = QCompleter(self.card_filter, self.card_combo)
+        card_completer.setCompletionMode(QCompleter.UnfilteredPopupCompletion)
+        self.card_combo.setCompleter(card_completer)
+        
+        # Every row is a single line, so the list views don't need to measure each one on restyles
+        self.card_combo.view().setUniformItemSizes(True)
+        card_completer.popup().setUniformItemSizes(True)
+        
+        self.card_combo.lineEdit().textEdited.connect(self.card_filter.set_filter_text)
+        self.card_combo.lineEdit().editingFinished.connect(self.on_card_filter_finished)
+        self.card_combo.currentIndexChanged.connect(self.on_card_selected)
         controls_layout.addWidget(self.card_combo)
         
         content_layout.addLayout(controls_layout)
@@ -358,143 +813,19 @@ class FloatingWidget(QWidget):
     
     def setup_style(self):
         """Apply modern styling"""
-        primary_color = self.config.primary_color
-        
-        if self.is_collapsed:
-            style = f"""
-            QWidget {{
-                background-color: rgba(25, 25, 25, 200);
-                border-radius: 15px;
-                color: white;
-                font-family: 'Segoe UI', Arial, sans-serif;
-            }}
-            
-            QLabel#timer {{
-                font-size: 15px;
-                font-weight: bold;
-                color: {primary_color};
-                padding: 3px 6px;
-            }}
-            
-            QPushButton#iconButton {{
-                background-color: rgba(255, 255, 255, 0.1);
-                border-radius: 12px;
-                padding: 1px;
-                font-size: 10px;
-            }}
-            
-            QPushButton#iconButton:hover {{
-                background-color: rgba(255, 255, 255, 0.2);
-            }}
-            """
-        else:
-            # Convert hex color to RGB for alpha variations
-            hex_color = primary_color.lstrip('#')
-            r, g, b = tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
-            
-            style = f"""
-            QWidget {{
-                background-color: rgba(35, 35, 35, 240);
-                border-radius: 12px;
-                color: white;
-                font-family: 'Segoe UI', Arial, sans-serif;
-            }}
-            
-            QLabel#timer {{
-                font-size: 16px;
-                font-weight: bold;
-                color: {primary_color};
-                padding: 4px;
-            }}
-            
-            QLabel#cardInfo {{
-                font-size: 11px;
-                color: #cccccc;
-                padding: 2px;
-            }}
-            
-            QPushButton {{
-                border: none;
-                border-radius: 6px;
-                padding: 6px 10px;
-                font-size: 12px;
-            }}
-            
-            QPushButton#iconButton {{
-                background-color: rgba(255, 255, 255, 0.1);
-                border-radius: 12px;
-                padding: 2px;
-            }}
-            
-            QPushButton#iconButton:hover {{
-                background-color: rgba(255, 255, 255, 0.2);
-            }}
-            
-            QPushButton#controlButton {{
-                background-color: rgba({r}, {g}, {b}, 0.8);
-                min-width: 24px;
-                min-height: 24px;
-            }}
-            
-            QPushButton#controlButton:hover {{
-                background-color: rgba({r}, {g}, {b}, 1.0);
-            }}
-            
-            QPushButton#controlButton:pressed {{
-                background-color: rgba({max(0, r-20)}, {max(0, g-20)}, {max(0, b-20)}, 1.0);
-            }}
-            
-            QPushButton#controlButtonDisabled {{
-                background-color: rgba(128, 128, 128, 0.5);
-                min-width: 24px;
-                min-height: 24px;
-                color: rgba(255, 255, 255, 0.5);
-            }}
-            
-            QPushButton#controlButtonDisabled:hover {{
-                background-color: rgba(128, 128, 128, 0.5);
-            }}
-            
-            
-            QComboBox {{
-                background-color: rgba(255, 255, 255, 0.1);
-                border: 1px solid rgba(255, 255, 255, 0.2);
-                border-radius: 6px;
-                padding: 4px 8px;
-                min-width: 250px;
-            }}
-            
-            QComboBox:hover {{
-                background-color: rgba(255, 255, 255, 0.15);
-            }}
-            
-            QComboBox::drop-down {{
-                border: none;
-                width: 20px;
-            }}
-            
-            QComboBox::down-arrow {{
-                image: none;
-                border: none;
-            }}
-            
-            QComboBox QAbstractItemView {{
-                background-color: rgba(45, 45, 45, 250);
-                border: 1px solid rgba(255, 255, 255, 0.2);
-                border-radius: 6px;
-                selection-background-color: rgba({r}, {g}, {b}, 0.8);
-                color: white;
-                padding: 4px;
-            }}
-            """
-        
-        self.setStyleSheet(style)
+        self.setStyleSheet(build_stylesheet(self.config.primary_color, self.is_collapsed))
     
     def setup_timers(self):
         """Setup update timers"""
-        self.update_timer = QTimer()
-        self.update_timer.timeout.connect(self.update_display)
-        self.update_timer.start(1000)  # Update every second
+        # Only ticks while the timer runs, on each second boundary
+        self.tick_engine = TickEngine(self)
+        self.tick_engine.tick.connect(self.update_display)
+        
+        # Bounds the time a power loss can take from a running session
+        self.journal_checkpoint_timer = QTimer(self)
+        self.journal_checkpoint_timer.setInterval(30_000)
+        self.journal_checkpoint_timer.timeout.connect(
+            lambda: self.timer_journal.checkpoint(time.monotonic() - self.start_time))
     
     def setup_system_tray(self):
         """Setup system tray icon"""
@@ -515,6 +846,14 @@ class FloatingWidget(QWidget):
             settings_action = tray_menu.addAction("Settings")
             settings_action.triggered.connect(self.show_settings)
             
+            diagnostics_action = tray_menu.addAction("Diagnostics")
+            diagnostics_action.triggered.connect(self.show_diagnostics)
+            
+            # Only shown while Jira refused some worklogs for good
+            self.rejected_worklogs_action = tray_menu.addAction("Rejected Worklogs...")
+            self.rejected_worklogs_action.triggered.connect(self.review_rejected_worklogs)
+            self.update_rejected_worklogs_action()
+            
             tray_menu.addSeparator()
             quit_action = tray_menu.addAction("Quit")
             quit_action.triggered.connect(self.quit_app)
@@ -530,18 +869,38 @@ class FloatingWidget(QWidget):
             self.config.token
         ])
     
-    def load_cards(self):
-        """Load cards from Jira in background"""
+    def show_cached_cards(self):
+        """Populate the widget with the cards of the last session"""
+        cards, synced_at = self.card_cache.load(self.config.jira_server, self.config.email)
+        if cards:
+            self.on_cards_page_loaded(cards)
+            self.last_sync_timestamp = synced_at
+    
+    def load_cards(self, revalidate: bool = False):
+        """Load cards from Jira in background
+        
+        With revalidate the cards on screen are kept while loading and only the
+        differences are applied once Jira answers.
+        """
         if not self.is_configured():
             return
         
-        # Set loading state
-        self.set_loading_state()
-        
-        self.jira_worker = JiraWorker(self.config)
-        self.jira_worker.cards_loaded.connect(self.on_cards_loaded)
-        self.jira_worker.error_occurred.connect(self.on_jira_error)
-        self.jira_worker.start()
+        load = CardLoadJob(self.config, self.card_cache, self.integration_factory)
+        if revalidate:
+            # Nothing to revalidate against when cards are already being loaded
+            if self.job_executor.running("cards"):
+                return
+            job = self.job_executor.submit("cards", load)
+            job.succeeded.connect(lambda cards: self.on_cards_revalidated(cards, load.synced_at, load.board_errors))
+            job.failed.connect(self.on_revalidate_error)
+        else:
+            # Whatever was being loaded is stale now, e.g. after a settings change
+            job = self.job_executor.submit("cards", load, replace=True)
+            # Set loading state
+            self.set_loading_state()
+            job.progress.connect(self.on_cards_page_loaded)
+            job.succeeded.connect(lambda cards: self.on_cards_loaded(cards, load.synced_at, load.board_errors))
+            job.failed.connect(self.on_jira_error)
     
     def reload_cards(self):
         """Reload cards from Jira and refresh the interface"""
@@ -554,6 +913,22 @@ class FloatingWidget(QWidget):
             self.reload_btn.setEnabled(False)
             self.reload_btn.setText("⏳")
         
+        # The cards are already being fetched, wait for that instead of fetching them twice
+        running = self.job_executor.running("cards")
+        if running is not None:
+            running.finished.connect(self.restore_reload_button)
+            return
+        
+        # Only fetch what changed when the cards on screen come from a known sync
+        if self.card_store and self.last_sync_timestamp:
+            sync = CardSyncJob(self.config, self.card_store.as_list(), self.last_sync_timestamp,
+                               self.card_cache, self.integration_factory)
+            job = self.job_executor.submit("cards", sync)
+            job.succeeded.connect(lambda delta: self.on_cards_synced(delta, sync.board_errors))
+            job.failed.connect(self.on_sync_error)
+            job.finished.connect(self.restore_reload_button)
+            return
+        
         # Store current card ID to restore selection after reload
         current_card_id = self.current_card.id if self.current_card else None
         
@@ -561,72 +936,72 @@ class FloatingWidget(QWidget):
         self.set_loading_state()
         
         # Load cards
-        self.jira_worker = JiraWorker(self.config)
-        self.jira_worker.cards_loaded.connect(lambda cards: self.on_cards_reloaded(cards, current_card_id))
-        self.jira_worker.error_occurred.connect(self.on_reload_error)
-        self.jira_worker.start()
+        load = CardLoadJob(self.config, self.card_cache, self.integration_factory)
+        job = self.job_executor.submit("cards", load)
+        job.succeeded.connect(lambda cards: self.on_cards_reloaded(cards, current_card_id, load.synced_at, load.board_errors))
+        job.failed.connect(self.on_reload_error)
+        job.finished.connect(self.restore_reload_button)
     
-    def on_cards_reloaded(self, cards: List[Card], previous_card_id: str):
-        """Handle reloaded cards and restore selection"""
-        self.cards = cards
-        
-        # Re-enable reload button
+    def restore_reload_button(self):
+        """Re-enable the reload button, also when the reload was cancelled by a newer load"""
         if hasattr(self, 'reload_btn'):
             self.reload_btn.setEnabled(True)
             self.reload_btn.setText("🔄")
+    
+    @metrics_registry.instrument("ui on_cards_synced")
+    def on_cards_synced(self, delta: CardDelta, board_errors: dict):
+        """Merge the changes fetched by a delta sync into the cards on screen"""
+        self.last_sync_timestamp = delta.synced_at
         
-        # Initialize Jira integration for time logging
-        if self.is_configured():
-            self.jira_integration = JiraIntegration(
-                self.config.jira_server,
-                self.config.email,
-                self.config.token
-            )
+        self.restore_reload_button()
         
-        # Update combo box
-        if hasattr(self, 'card_combo'):
-            self.card_combo.clear()
-            
-            if cards:
-                # Show more of the issue title - up to 60 characters
-                card_names = [f"{card.id}: {card.name[:60]}..." if len(card.name) > 60 
-                             else f"{card.id}: {card.name}" for card in cards]
-                self.card_combo.addItems(card_names)
-                
-                # Try to restore previous selection
-                if previous_card_id:
-                    for i, card in enumerate(cards):
-                        if card.id == previous_card_id:
-                            self.card_combo.setCurrentIndex(i)
-                            self.current_card = card
-                            # Update elapsed time with refreshed card data
-                            self.elapsed_time = card.time_spent
-                            break
-                    else:
-                        # Previous card not found, select first card
-                        self.current_card = cards[0]
-                        self.elapsed_time = cards[0].time_spent
-                else:
-                    # No previous card, select first
-                    self.current_card = cards[0]
-                    self.elapsed_time = cards[0].time_spent
-                
-                self.update_card_display()
+        self.apply_cards_delta(delta)
+        
+        if board_errors:
+            self.warn_board_errors(board_errors)
+            return
+        QMessageBox.information(self, "Success", f"Reloaded {len(self.card_store)} cards from Jira "
+                                f"({len(delta.changed)} changed, {len(delta.removed_ids)} removed)")
+    
+    def on_sync_error(self, error: str):
+        """Handle delta sync errors, keeping the cards on screen"""
+        self.restore_reload_button()
+        
+        QMessageBox.warning(self, "Reload Error", f"Failed to reload cards: {error}")
+    
+    @metrics_registry.instrument("ui on_cards_reloaded")
+    def on_cards_reloaded(self, cards: List[Card], previous_card_id: str, synced_at: float, board_errors: dict):
+        """Handle reloaded cards and restore selection"""
+        self.last_sync_timestamp = synced_at
+        
+        self.restore_reload_button()
+        
+        if board_errors:
+            # The cards of the failed boards stay on screen
+            self.on_cards_revalidated(cards, synced_at, board_errors)
+            return
+        
+        self.rebuilding_ui = True
+        self.card_model.set_cards(cards)
+        self.rebuilding_ui = False
+        
+        if cards:
+            self.card_combo.setEnabled(True)
+            # Try to restore previous selection, otherwise select the first card
+            row = self.card_model.row_of(previous_card_id)
+            self.select_card_row(row if row >= 0 else 0)
+        else:
+            self.show_no_cards_state()
         
         QMessageBox.information(self, "Success", f"Reloaded {len(cards)} cards from Jira")
     
     def on_reload_error(self, error: str):
         """Handle reload errors"""
-        # Re-enable reload button
-        if hasattr(self, 'reload_btn'):
-            self.reload_btn.setEnabled(True)
-            self.reload_btn.setText("🔄")
+        self.restore_reload_button()
         
         # Re-enable card combo and show error state
-        if hasattr(self, 'card_combo'):
-            self.card_combo.setEnabled(True)
-            self.card_combo.clear()
-            self.card_combo.addItem("Failed to reload issues")
+        self.card_combo.setEnabled(True)
+        self.show_card_message("Failed to reload issues")
         
         # Update card display
         if hasattr(self, 'card_label'):
@@ -634,39 +1009,109 @@ class FloatingWidget(QWidget):
         
         QMessageBox.warning(self, "Reload Error", f"Failed to reload cards: {error}")
     
-    def on_cards_loaded(self, cards: List[Card]):
-        """Handle loaded cards"""
-        self.cards = cards
+    @metrics_registry.instrument("ui on_cards_page_loaded")
+    def on_cards_page_loaded(self, cards: List[Card]):
+        """Append a page of cards as soon as it arrives"""
+        if not cards:
+            return
         
-        # Re-enable card combo
-        if hasattr(self, 'card_combo'):
-            self.card_combo.setEnabled(True)
-            self.card_combo.clear()
+        first_page = not self.card_store
         
-        # Initialize Jira integration for time logging
-        if self.is_configured():
-            self.jira_integration = JiraIntegration(
-                self.config.jira_server,
-                self.config.email,
-                self.config.token
-            )
+        self.rebuilding_ui = True
+        self.card_model.append_cards(cards)
+        self.rebuilding_ui = False
         
-        if cards:
-            # Show more of the issue title - up to 60 characters
-            card_names = [f"{card.id}: {card.name[:60]}..." if len(card.name) > 60 
-                         else f"{card.id}: {card.name}" for card in cards]
-            self.card_combo.addItems(card_names)
-            self.current_card = cards[0]
-            self.elapsed_time = cards[0].time_spent
-            self.update_card_display()
+        if first_page:
+            # Let the user pick right away
+            self.card_combo.setEnabled(True)
+            self.select_card_row(0)
+    
+    @metrics_registry.instrument("ui on_cards_loaded")
+    def on_cards_loaded(self, cards: List[Card], synced_at: float, board_errors: dict):
+        """Handle the end of the load, once every page was received"""
+        self.last_sync_timestamp = synced_at
+        
+        if not cards:
+            self.show_no_cards_state()
+        self.warn_board_errors(board_errors)
+    
+    def show_no_cards_state(self):
+        """Show that there are no issues to work on"""
+        self.card_combo.setEnabled(True)
+        self.show_card_message("No issues found")
+        self.current_card = None
+        self.elapsed_time = 0
+        if hasattr(self, 'card_label'):
+            self.card_label.setText("No issues found")
+        self.update_play_button_state()
+        self.update_display()
+    
+    def on_cards_revalidated(self, cards: List[Card], synced_at: float, board_errors: dict):
+        """Apply the cards fetched from Jira on top of the cached ones"""
+        self.last_sync_timestamp = synced_at
+        delta = self.card_store.diff(cards)
+        if board_errors:
+            # Cards missing from a partial load may belong to the failed boards, they are kept
+            delta.removed_ids.clear()
+        self.apply_cards_delta(delta)
+        self.warn_board_errors(board_errors)
+    
+    def warn_board_errors(self, board_errors: dict):
+        """Tell which boards the cards could not be loaded from, the cards of the other ones are shown"""
+        if not board_errors:
+            return
+        names = ", ".join(name or "the main site" for name in board_errors)
+        self.show_notification(f"Cards of {names} could not be loaded: {next(iter(board_errors.values()))}",
+                               QSystemTrayIcon.Warning)
+    
+    def on_revalidate_error(self, error: str):
+        """Keep showing the cached cards when they could not be revalidated"""
+        print(f"Failed to revalidate cached cards: {error}")
+        self.show_notification(f"Showing cached issues, Jira is unavailable: {error}", QSystemTrayIcon.Warning)
+    
+    def show_notification(self, message: str, icon=QSystemTrayIcon.Information):
+        """Non-blocking message through the system tray, printed when there is no tray"""
+        if hasattr(self, 'tray_icon'):
+            self.tray_icon.showMessage("Zilean", message, icon, 3000)
         else:
-            # No cards found
-            self.card_combo.addItem("No issues found")
-            self.current_card = None
-            self.elapsed_time = 0
-            if hasattr(self, 'card_label'):
-                self.card_label.setText("No issues found")
-            self.update_play_button_state()
+            print(message)
+    
+    @metrics_registry.instrument("ui apply_cards_delta")
+    def apply_cards_delta(self, delta: CardDelta):
+        """Merge a delta into the card list by key, notifying only the affected rows"""
+        # Block selection handling while the rows change
+        self.rebuilding_ui = True
+        self.card_model.apply_delta(delta)
+        self.rebuilding_ui = False
+        
+        if not self.card_store:
+            self.show_no_cards_state()
+            return
+        
+        # Keep the selection, unless the card is gone. A running timer keeps its card untouched
+        if self.is_running or self.is_paused:
+            return
+        
+        row = self.card_model.row_of(self.current_card.id if self.current_card else None)
+        self.select_card_row(row if row >= 0 else 0)
+    
+    def select_card_row(self, row: int):
+        """Select a card of the list without the timer handling of a user selection"""
+        self.rebuilding_ui = True
+        self.card_combo.setCurrentIndex(row)
+        self.rebuilding_ui = False
+        
+        self.current_card = self.card_model.card_at(row)
+        self.elapsed_time = self.current_card.time_spent if self.current_card else 0
+        self.update_card_display()
+    
+    def show_card_message(self, message: str):
+        """Show a message in place of the card list, e.g. while loading"""
+        self.rebuilding_ui = True
+        self.card_model.set_cards([])
+        self.rebuilding_ui = False
+        self.card_combo.lineEdit().setPlaceholderText(message)
+        self.card_combo.setEditText("")
     
     def set_loading_state(self):
         """Set the UI to loading state"""
@@ -675,10 +1120,8 @@ class FloatingWidget(QWidget):
         self.elapsed_time = 0
         
         # Update card combo to show loading message
-        if hasattr(self, 'card_combo'):
-            self.card_combo.clear()
-            self.card_combo.addItem("Loading issues...")
-            self.card_combo.setEnabled(False)
+        self.show_card_message("Loading issues...")
+        self.card_combo.setEnabled(False)
         
         # Update card display
         if hasattr(self, 'card_label'):
@@ -693,10 +1136,8 @@ class FloatingWidget(QWidget):
     def on_jira_error(self, error: str):
         """Handle Jira errors"""
         # Re-enable card combo
-        if hasattr(self, 'card_combo'):
-            self.card_combo.setEnabled(True)
-            self.card_combo.clear()
-            self.card_combo.addItem("Failed to load issues")
+        self.card_combo.setEnabled(True)
+        self.show_card_message("Failed to load issues")
         
         # Update card display
         if hasattr(self, 'card_label'):
@@ -704,14 +1145,13 @@ class FloatingWidget(QWidget):
         
         QMessageBox.warning(self, "Jira Error", f"Failed to load cards: {error}")
     
-    def on_card_selected(self, card_text: str):
+    @metrics_registry.instrument("ui on_card_selected")
+    def on_card_selected(self, index: int):
         """Handle card selection"""
-        if not card_text or not self.cards or self.rebuilding_ui:
+        if index < 0 or self.rebuilding_ui:
             return
         
-        # Extract card ID from combo text
-        card_id = card_text.split(":")[0]
-        new_card = next((card for card in self.cards if card.id == card_id), None)
+        new_card = self.card_model.card_at(index)
         
         # Only stop timer if actually changing to a different card
         if new_card and self.current_card and new_card.id != self.current_card.id:
@@ -726,6 +1166,12 @@ class FloatingWidget(QWidget):
             
             self.update_card_display()
     
+    def on_card_filter_finished(self):
+        """Drop the type-ahead filter and show the selected card again"""
+        self.card_filter.set_filter_text("")
+        index = self.card_combo.currentIndex()
+        self.card_combo.setEditText(self.card_combo.itemText(index) if index >= 0 else "")
+    
     def update_card_display(self):
         """Update card information display"""
         if self.current_card:
@@ -735,105 +1181,105 @@ class FloatingWidget(QWidget):
         
         # Update play button state
         self.update_play_button_state()
+        self.update_display()
     
     def update_play_button_state(self):
         """Update play button appearance based on timer state"""
         if hasattr(self, 'play_btn'):
             if self.is_running:
                 self.play_btn.setEnabled(False)
-                self.play_btn.setObjectName("controlButton")
+                self.set_button_state(self.play_btn, "disabled")
             elif self.is_paused:
                 self.play_btn.setText("▶️")
                 self.play_btn.setEnabled(True)
-                self.play_btn.setObjectName("controlButton")
+                self.set_button_state(self.play_btn, "enabled")
             else:
                 # Stopped state
                 self.play_btn.setText("▶️")
                 if self.current_card:
                     self.play_btn.setEnabled(True)
-                    self.play_btn.setObjectName("controlButton")
+                    self.set_button_state(self.play_btn, "enabled")
                 else:
                     self.play_btn.setEnabled(False)
-                    self.play_btn.setObjectName("controlButton")
-            
-            # Re-apply styling to update appearance
-            self.setup_style()
+                    self.set_button_state(self.play_btn, "disabled")
     
+    def set_button_state(self, button: QPushButton, state: str):
+        """Restyle a single button through its "state" property, only when the state changes"""
+        if button.property("state") == state:
+            return
+        button.setProperty("state", state)
+        button.style().unpolish(button)
+        button.style().polish(button)
+    
+    @metrics_registry.instrument("ui toggle_collapse")
     def toggle_collapse(self):
         """Toggle between collapsed and expanded states"""
         self.is_collapsed = not self.is_collapsed
         self.config.collapsed = self.is_collapsed
-        self.config_manager.save(self.config)
+        self.config_manager.schedule_save(self.config)
         
-        # Rebuild the entire UI to properly handle layout changes
-        self.rebuild_ui()
+        # Switch the existing widgets in a single layout pass, without painting intermediate states
+        self.setUpdatesEnabled(False)
+        self.apply_collapse_state()
+        self.setup_style()
+        self.main_layout.activate()
         
         # Resize to appropriate dimensions
         new_width = 180 if self.is_collapsed else 450  # Better size when collapsed
         new_height = 60 if self.is_collapsed else 140   # Better height too
         self.resize(new_width, new_height)
-        
-        # Force the widget to update its geometry and maintain size
-        self.updateGeometry()
-        self.update()
-        
-        # Use a timer to ensure the size sticks after UI rebuild
-        QTimer.singleShot(50, lambda: self.resize(new_width, new_height))
+        self.setUpdatesEnabled(True)
     
-    def rebuild_ui(self):
-        """Rebuild the UI when toggling between states"""
-        self.rebuilding_ui = True  # Set flag to prevent card selection events
+    def apply_collapse_state(self):
+        """Show, hide and size the widgets for the current collapse state"""
+        collapsed = self.is_collapsed
         
-        # Clear the current layout
-        while self.main_layout.count():
-            child = self.main_layout.takeAt(0)
-            if child.widget():
-                child.widget().deleteLater()
-        
-        # Update layout margins based on state
-        if self.is_collapsed:
+        # Minimal padding for collapsed mode
+        if collapsed:
             self.main_layout.setContentsMargins(6, 4, 6, 4)
             self.main_layout.setSpacing(2)
         else:
             self.main_layout.setContentsMargins(12, 8, 12, 8)
             self.main_layout.setSpacing(6)
         
-        # Rebuild header and content
-        self.setup_header()
-        self.setup_content()
+        # Header: only the timer and the toggle button when collapsed
+        self.header_layout.setSpacing(4 if collapsed else 8)
+        self.header_spacer.changeSize(0, 0, QSizePolicy.Fixed if collapsed else QSizePolicy.Expanding, QSizePolicy.Minimum)
+        self.settings_btn.setVisible(not collapsed)
+        self.reload_btn.setVisible(not collapsed)
+        self.close_btn.setVisible(not collapsed)
+        self.toggle_btn.setText("+" if collapsed else "-")
+        self.toggle_btn.setFixedSize(28 if collapsed else 24, 28 if collapsed else 24)
+        self.header_layout.invalidate()
         
-        # Repopulate card combo if we have cards
-        if self.cards and hasattr(self, 'card_combo'):
-            card_names = [f"{card.id}: {card.name[:60]}..." if len(card.name) > 60 
-                         else f"{card.id}: {card.name}" for card in self.cards]
-            self.card_combo.addItems(card_names)
-            if self.current_card:
-                # Find and select the current card
-                for i, card in enumerate(self.cards):
-                    if card.id == self.current_card.id:
-                        self.card_combo.setCurrentIndex(i)
-                        break
-                # Update the card display after setting selection
-                self.update_card_display()
-        
-        # Update visibility and styling
         self.update_visibility()
-        self.setup_style()
-        
-        # Immediately update timer display to prevent showing 00:00:00
-        self.update_display()
-        
-        self.rebuilding_ui = False  # Clear flag after rebuild is complete
     
     def update_visibility(self):
         """Update widget visibility based on collapse state"""
         self.content_widget.setVisible(not self.is_collapsed)
     
+    def show_diagnostics(self):
+        """Show the metrics of Jira calls and UI handlers"""
+        dialog = DiagnosticsDialog(metrics_registry, self)
+        dialog.exec()
+        
+        # Recording stays as the user left it
+        if self.config.metrics_enabled != metrics_registry.enabled:
+            self.config.metrics_enabled = metrics_registry.enabled
+            self.config_manager.schedule_save(self.config)
+    
     def show_settings(self):
         """Show settings dialog"""
+        credentials = (self.config.jira_server, self.config.email, self.config.token)
         dialog = SettingsDialog(self.config, self)
         if dialog.exec() == QDialog.Accepted:
-            self.config_manager.save(self.config)
+            self.config_manager.schedule_save(self.config)
+            # The shared Jira client is only rebuilt when the credentials change
+            if credentials != (self.config.jira_server, self.config.email, self.config.token):
+                jira_client_registry.invalidate()
+            self.worklog_flusher.wake()
+            # The primary color may have changed
+            self.setup_style()
             self.load_cards()
     
     def start_timer(self):
@@ -846,14 +1292,18 @@ class FloatingWidget(QWidget):
             # Resume from pause
             self.is_paused = False
             self.is_running = True
-            self.start_time = time.time() - self.elapsed_time
+            self.start_time = time.monotonic() - self.elapsed_time
+            self.timer_journal.resume(self.elapsed_time)
         else:
             if not self.is_running:
                 # Start new timer
                 self.is_running = True
                 self.elapsed_time = 0
-                self.start_time = time.time() - self.current_card.time_spent
+                self.start_time = time.monotonic() - self.current_card.time_spent
+                self.timer_journal.start(self.current_card, self.current_card.time_spent)
         
+        self.tick_engine.start(self.start_time)
+        self.journal_checkpoint_timer.start()
         self.update_play_button_state()
     
     def pause_timer(self):
@@ -861,8 +1311,12 @@ class FloatingWidget(QWidget):
         if self.is_running:
             self.is_running = False
             self.is_paused = True
-            self.elapsed_time = time.time() - self.start_time
+            self.tick_engine.stop()
+            self.journal_checkpoint_timer.stop()
+            self.elapsed_time = time.monotonic() - self.start_time
+            self.timer_journal.pause(self.elapsed_time)
             self.update_play_button_state()
+            self.update_display()
     
     def stop_timer(self):
         """Stop the timer and log time"""
@@ -870,13 +1324,15 @@ class FloatingWidget(QWidget):
             original_running_state = self.is_running
             self.is_running = False
             self.is_paused = False
+            self.tick_engine.stop()
+            self.journal_checkpoint_timer.stop()
             
             print(f"Finished working on card: {self.current_card.name if self.current_card else 'None'}")
             
             if self.current_card:
                 # Calculate current elapsed time if timer was running
                 if original_running_state:
-                    self.elapsed_time = time.time() - self.start_time
+                    self.elapsed_time = time.monotonic() - self.start_time
                 
                 # Calculate only the new time worked (excluding already logged time)
                 new_elapsed_time = self.elapsed_time - self.current_card.time_spent
@@ -886,6 +1342,7 @@ class FloatingWidget(QWidget):
                 # Only log if more than 60 seconds
                 if new_elapsed_time < 60:
                     self.is_paused = True
+                    self.timer_journal.pause(self.elapsed_time)
                     self.update_play_button_state()
                     QMessageBox.warning(self, "Warning", "It's only possible to register times greater than 60 seconds")
                     return
@@ -893,7 +1350,7 @@ class FloatingWidget(QWidget):
                 # Store the new elapsed time for logging
                 time_to_log = new_elapsed_time
                 
-                # Log time to Jira
+                # Queue the time to be logged to Jira
                 if self.log_time_to_jira_session(time_to_log):
                     # Update the card's total time spent
                     self.current_card.time_spent += int(time_to_log)
@@ -903,42 +1360,63 @@ class FloatingWidget(QWidget):
                     # If logging failed, keep the current elapsed time
                     pass
             
+            # The time is in the worklog outbox now, the session is over
+            self.timer_journal.stop()
+            
             # Don't reset elapsed_time to 0 - keep showing accumulated time
             self.update_play_button_state()
             self.update_display()
     
     def log_time_to_jira_session(self, time_to_log):
-        """Log a specific time session to Jira"""
-        if self.jira_integration and self.current_card and time_to_log > 0:
-            try:
-                # Save the current time spent temporarily
-                original_time_spent = self.current_card.time_spent
-                
-                # Set the time to log for this session
-                self.current_card.time_spent = int(time_to_log)
-                
-                # Log the time to Jira
-                success = self.jira_integration.add_timespent_to_card(self.current_card)
-                
-                if success:
-                    # Restore original time (will be updated by caller)
-                    self.current_card.time_spent = original_time_spent
-                    QMessageBox.information(self, "Success", f"Logged {int(time_to_log)} seconds to Jira")
-                    return True
-                else:
-                    # Restore original time if failed
-                    self.current_card.time_spent = original_time_spent
-                    QMessageBox.warning(self, "Error", "Failed to log time to Jira")
-                    return False
-                    
-            except Exception as e:
-                QMessageBox.critical(self, "Error", f"Error logging time to Jira: {str(e)}")
-                # Restore original time if error occurred
-                if 'original_time_spent' in locals():
-                    self.current_card.time_spent = original_time_spent
-                return False
+        """Queue a time session to be logged to Jira in the background"""
+        if self.current_card and time_to_log > 0:
+            self.worklog_outbox.append(self.current_card, int(time_to_log), time.time() - time_to_log)
+            self.worklog_flusher.wake()
+            return True
         return False
     
+    def on_worklog_flushed(self, entry: WorklogEntry):
+        """Handle a worklog accepted by Jira"""
+        self.show_notification(f"Logged {entry.seconds} seconds to {entry.card_id}")
+    
+    def on_worklog_rejected(self, entry: WorklogEntry, reason: str):
+        """Handle a worklog Jira refused for good, it is kept until the user retries or discards it"""
+        print(f"Jira rejected the worklog of {entry.card_id}: {reason}")
+        self.update_rejected_worklogs_action()
+        self.show_notification(
+            f"Jira refused {entry.seconds} seconds for {entry.card_id} ({reason}). "
+            f"Retry or discard it from Rejected Worklogs in the tray menu",
+            QSystemTrayIcon.Warning
+        )
+    
+    def update_rejected_worklogs_action(self):
+        if hasattr(self, 'rejected_worklogs_action'):
+            self.rejected_worklogs_action.setVisible(bool(self.worklog_outbox.rejected()))
+    
+    def review_rejected_worklogs(self):
+        """Let the user retry or discard every worklog Jira refused for good"""
+        for entry in self.worklog_outbox.rejected():
+            answer = QMessageBox.question(
+                self, "Rejected Worklog",
+                f"Jira refused {entry.seconds} seconds for {entry.card_id} ({entry.card_name}):\n{entry.rejection}\n\n"
+                f"Retry sends it again, Discard drops it.",
+                QMessageBox.Retry | QMessageBox.Discard | QMessageBox.Ignore, QMessageBox.Ignore
+            )
+            if answer == QMessageBox.Retry:
+                self.worklog_outbox.retry(entry)
+            elif answer == QMessageBox.Discard:
+                self.worklog_outbox.discard(entry)
+        self.update_rejected_worklogs_action()
+        self.worklog_flusher.wake()
+    
+    def on_worklog_failed(self, entry: WorklogEntry, error: str, retry_in: float):
+        """Handle a worklog Jira did not accept, it stays queued until it goes through"""
+        print(f"Failed to log time to {entry.card_id}: {error}")
+        self.show_notification(
+            f"Could not log {entry.seconds} seconds to {entry.card_id}, retrying in {int(retry_in)} seconds",
+            QSystemTrayIcon.Warning
+        )
+    
     def log_time_to_jira(self):
         """Log elapsed time to Jira (legacy method for compatibility)"""
         return self.log_time_to_jira_session(self.elapsed_time)
@@ -946,7 +1424,7 @@ class FloatingWidget(QWidget):
     def get_current_time_display(self):
         """Get the current time display string"""
         if self.is_running:
-            current_elapsed = time.time() - self.start_time
+            current_elapsed = time.monotonic() - self.start_time
         else:
             current_elapsed = self.elapsed_time
         
@@ -955,14 +1433,14 @@ class FloatingWidget(QWidget):
         minutes, seconds = divmod(remainder, 60)
         return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
     
-    def update_display(self):
-        """Update timer display"""
+    def update_display(self, *args):
+        """Update timer display, repainting the label only when its text changes"""
         if self.is_running:
-            self.elapsed_time = time.time() - self.start_time
+            self.elapsed_time = time.monotonic() - self.start_time
         
         time_str = self.get_current_time_display()
         
-        if hasattr(self, 'timer_label'):
+        if hasattr(self, 'timer_label') and self.timer_label.text() != time_str:
             self.timer_label.setText(time_str)
     
     def mousePressEvent(self, event):
@@ -976,9 +1454,17 @@ class FloatingWidget(QWidget):
         if event.buttons() == Qt.LeftButton and hasattr(self, 'drag_position'):
             new_pos = event.globalPosition().toPoint() - self.drag_position
             self.move(new_pos)
+            # Saved once the drag ends
             self.config.widget_position = (new_pos.x(), new_pos.y())
             event.accept()
     
+    def mouseReleaseEvent(self, event):
+        """Save the position the widget was dragged to"""
+        if event.button() == Qt.LeftButton and hasattr(self, 'drag_position'):
+            del self.drag_position
+            self.config_manager.schedule_save(self.config)
+            event.accept()
+    
     def closeEvent(self, event):
         """Handle close event"""
         self.stop_timer()
@@ -994,19 +1480,51 @@ class FloatingWidget(QWidget):
     
     def quit_app(self):
         """Quit the application"""
+        # Written now, along with any save still scheduled, and skipped when nothing changed
         self.config_manager.save(self.config)
+        # Card loads in flight are dropped, pending worklogs stay in the outbox and are sent on the next start
+        self.job_executor.shutdown()
+        self.worklog_flusher.stop()
+        self.worklog_flusher.wait(3000)
+        # A running or paused timer is left in the journal and recovered paused on the next start,
+        # the time the app is closed is not worked time
+        if self.is_running:
+            self.timer_journal.pause(time.monotonic() - self.start_time)
+        self.timer_journal.close()
+        if self.webhook_listener is not None:
+            self.webhook_listener.stop()
         QApplication.quit()
 
 
-def main():
-    """Main application entry point"""
+def main(profiler: Optional["StartupProfiler"] = None):
+    """Main application entry point
+    
+    With --profile-startup a startup breakdown is printed once the widget is on screen.
+    Run through launch_modern.py for it to include the imports of this module.
+    """
+    if profiler is None:
+        profiler = profiler_from_args(sys.argv)
+    
     app = QApplication(sys.argv)
     app.setQuitOnLastWindowClosed(False)
+    if profiler:
+        profiler.mark("QApplication")
     
     # Create and show the floating widget
     widget = FloatingWidget()
+    if profiler:
+        profiler.mark("FloatingWidget")
     widget.show()
     
+    if profiler:
+        profiler.mark("show")
+        
+        def report_startup():
+            profiler.mark("first event loop pass")
+            profiler.report()
+        
+        QTimer.singleShot(0, report_startup)
+    
     sys.exit(app.exec())
 
 
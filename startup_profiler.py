@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Startup profiling for Modern Zilean, enabled with --profile-startup
+
+Records how long each startup phase took and how long every module took to
+import, then prints a breakdown once the widget is on screen.
+"""
+
+import sys
+import threading
+import time
+from collections import defaultdict
+from typing import Optional
+
+
+class _ImportTimer:
+    """Meta path finder timing the execution of every module imported while installed"""
+
+    def __init__(self, profiler: "StartupProfiler"):
+        self.profiler = profiler
+        self._local = threading.local()
+
+    def find_spec(self, name, path, target=None):
+        # Let the other finders locate the module, only its loader is wrapped
+        if getattr(self._local, "finding", False):
+            return None
+        self._local.finding = True
+        try:
+            for finder in sys.meta_path:
+                if finder is self or not hasattr(finder, "find_spec"):
+                    continue
+                spec = finder.find_spec(name, path, target)
+                if spec is not None:
+                    break
+            else:
+                return None
+        finally:
+            self._local.finding = False
+
+        # Builtin and frozen modules use the loader class itself, which must not be patched
+        loader = spec.loader
+        if loader is None or isinstance(loader, type) or not hasattr(loader, "exec_module"):
+            return spec
+
+        exec_module = loader.exec_module
+
+        def timed_exec_module(module):
+            self.profiler._exec_module(name, exec_module, module)
+
+        loader.exec_module = timed_exec_module
+        return spec
+
+
+class StartupProfiler:
+    """Phase and import time breakdown of the application startup"""
+
+    def __init__(self):
+        self.started_at = time.perf_counter()
+        self.phases: list[tuple[str, float]] = []
+        self.imports: dict[str, float] = {}  # Module -> seconds spent in its own body, without nested imports
+        self._last_mark = self.started_at
+        self._nested = threading.local()
+        self._import_timer: Optional[_ImportTimer] = _ImportTimer(self)
+        sys.meta_path.insert(0, self._import_timer)
+
+
+    def mark(self, phase: str) -> None:
+        """End the current phase, naming it"""
+        now = time.perf_counter()
+        self.phases.append((phase, now - self._last_mark))
+        self._last_mark = now
+
+
+    def report(self, top: int = 15) -> None:
+        """Stop recording imports and print the breakdown"""
+        if self._import_timer in sys.meta_path:
+            sys.meta_path.remove(self._import_timer)
+        self._import_timer = None
+
+        print("Startup profile")
+        print("  Phases:")
+        for phase, seconds in self.phases:
+            print(f"    {phase:<32} {seconds * 1000:8.1f} ms")
+        print(f"    {'total':<32} {(self._last_mark - self.started_at) * 1000:8.1f} ms")
+
+        packages: dict[str, float] = defaultdict(float)
+        for module, seconds in self.imports.items():
+            packages[module.partition(".")[0]] += seconds
+
+        print(f"  Imports: {len(self.imports)} modules, {sum(self.imports.values()) * 1000:.1f} ms")
+        print("    By package:")
+        for package, seconds in sorted(packages.items(), key=lambda item: item[1], reverse=True)[:top]:
+            print(f"      {package:<30} {seconds * 1000:8.1f} ms")
+        print("    Slowest modules:")
+        for module, seconds in sorted(self.imports.items(), key=lambda item: item[1], reverse=True)[:top]:
+            print(f"      {module:<30} {seconds * 1000:8.1f} ms")
+
+
+    def _exec_module(self, name: str, exec_module, module) -> None:
+        stack = self._nested.__dict__.setdefault("stack", [])
+        stack.append(0.0)
+        start = time.perf_counter()
+        try:
+            exec_module(module)
+        finally:
+            total = time.perf_counter() - start
+            nested = stack.pop()
+            if stack:
+                stack[-1] += total
+            self.imports[name] = total - nested
+
+
+def profiler_from_args(argv: list[str]) -> Optional[StartupProfiler]:
+    """Profiler when --profile-startup is in argv, None otherwise"""
+    if "--profile-startup" in argv:
+        return StartupProfiler()
+    return None